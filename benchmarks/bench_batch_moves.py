@@ -0,0 +1,60 @@
+"""Benchmark de la generación de movimientos por lotes frente a Board.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_batch_moves
+"""
+from random import Random
+from time import perf_counter
+
+import numpy as np
+
+from core.BatchMoveGenerator import BatchMoveGenerator
+from core.Board import Board
+
+
+def sample_positions(num_positions: int, seed: int = 0) -> list:
+    """Genera posiciones (arreglo de puntos, usa fichas blancas) jugando partidas aleatorias."""
+    rng = Random(seed)
+    positions = []
+    while len(positions) < num_positions:
+        board = Board()
+        uses_white_checkers = True
+        while not any(board.is_match_won()) and len(positions) < num_positions:
+            positions.append((tuple(board.points), uses_white_checkers))
+            dice = (rng.randint(1, 6), rng.randint(1, 6))
+            if dice[0] == dice[1]:
+                dice = dice * 2
+            board.apply_play(rng.choice(board.calculate_legal_plays(uses_white_checkers, dice)), uses_white_checkers)
+            uses_white_checkers = not uses_white_checkers
+    return positions
+
+
+def main(num_positions: int = 10000):
+    positions = sample_positions(num_positions)
+    rng = np.random.default_rng(0)
+    dice = rng.integers(1, 7, size=(num_positions, 2))
+    points = np.array([points for points, _ in positions], dtype=np.int8)
+    uses_white = np.array([uses_white_checkers for _, uses_white_checkers in positions])
+
+    boards = []
+    for position_points, _ in positions:
+        board = Board()
+        board.load_points(position_points)
+        boards.append(board)
+
+    start = perf_counter()
+    for board, (_, uses_white_checkers), (first_die, second_die) in zip(boards, positions, dice.tolist()):
+        board.get_legal_single_moves(uses_white_checkers, first_die)
+        board.get_legal_single_moves(uses_white_checkers, second_die)
+    board_seconds = perf_counter() - start
+
+    start = perf_counter()
+    BatchMoveGenerator.compute_legal_moves(points, dice, uses_white)
+    batch_seconds = perf_counter() - start
+
+    print(f"{'Board (una posición a la vez)':<35} {board_seconds / num_positions * 1e6:8.2f} µs/posición")
+    print(f"{'BatchMoveGenerator':<35} {batch_seconds / num_positions * 1e6:8.2f} µs/posición")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Micro-benchmarks del acceso a puntos y de los movimientos del tablero.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_board
+"""
+from timeit import repeat
+
+from core.Board import Board
+
+
+def branching_map_normal_index(normal_index: int, uses_white_checkers: bool) -> tuple[bool, int]:
+    """Mapeo con comparaciones encadenadas (implementación original de Board.map_normal_index)."""
+    if uses_white_checkers:
+        if 1 <= normal_index <= 12:
+            return True, 12 - normal_index
+        if 13 <= normal_index <= 24:
+            return False, normal_index - 13
+    else:
+        if 1 <= normal_index <= 12:
+            return False, 12 - normal_index
+        if 13 <= normal_index <= 24:
+            return True, normal_index - 13
+
+
+def timeit(function, number: int) -> float:
+    """Mide el mejor tiempo de varias repeticiones (reduce el ruido de la máquina)."""
+    return min(repeat(function, number=number, repeat=5))
+
+
+def report(name: str, seconds: float, calls: int):
+    """Imprime el costo por llamada de un benchmark en nanosegundos."""
+    print(f"{name:<45} {seconds / calls * 1e9:8.1f} ns/llamada")
+
+
+def main(repetitions: int = 20000):
+    board = Board()
+    accesses = repetitions * 48
+
+    def run_branching_map():
+        for normal_index in range(1, 25):
+            branching_map_normal_index(normal_index, True)
+            branching_map_normal_index(normal_index, False)
+
+    def run_map_normal_index():
+        for normal_index in range(1, 25):
+            board.map_normal_index(normal_index, True)
+            board.map_normal_index(normal_index, False)
+
+    def run_get_triangle_from_normal():
+        for normal_index in range(1, 25):
+            board.get_triangle_from_normal(normal_index, True)
+            board.get_triangle_from_normal(normal_index, False)
+
+    def run_verify_checker_placement():
+        for normal_index in range(1, 25):
+            board.verify_checker_placement(normal_index, True)
+            board.verify_checker_placement(normal_index, False)
+
+    report("map_normal_index (comparaciones)", timeit(run_branching_map, number=repetitions), accesses)
+    report("Board.map_normal_index", timeit(run_map_normal_index, number=repetitions), accesses)
+    report("Board.get_triangle_from_normal", timeit(run_get_triangle_from_normal, number=repetitions), accesses)
+    report("Board.verify_checker_placement", timeit(run_verify_checker_placement, number=repetitions), accesses)
+
+    def run_dice_combinations():
+        for normal_index in (1, 12, 17, 19):
+            board.calculate_possible_dice_combinations(normal_index, True, (3, 3, 3, 3))
+
+    report("Board.calculate_possible_dice_combinations", timeit(run_dice_combinations, number=repetitions // 10),
+           repetitions // 10 * 4)
+
+    def run_move_checker():
+        board.move_checker(1, 4, True)
+        board.move_checker(4, 1, True)
+
+    def run_make_unmake_move():
+        board.make_move(1, 3, True)
+        board.unmake_move()
+        board.make_move(12, 5, False)
+        board.unmake_move()
+
+    report("Board.move_checker (ida y vuelta)", timeit(run_move_checker, number=repetitions * 10),
+           repetitions * 10)
+    report("Board.make_move + unmake_move", timeit(run_make_unmake_move, number=repetitions * 10),
+           repetitions * 20)
+
+
+if __name__ == "__main__":
+    main()
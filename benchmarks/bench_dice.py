@@ -0,0 +1,45 @@
+"""Benchmark de la tirada de dados: módulo random y objetos Dice nuevos contra DiceSource.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_dice [cantidad de tiradas]
+"""
+import random
+import sys
+from timeit import repeat
+
+from core.Dice import Dice
+from core.DiceSource import DiceSource
+
+
+def timeit(function, number: int) -> float:
+    """Mide el mejor tiempo de varias repeticiones (reduce el ruido de la máquina)."""
+    return min(repeat(function, number=number, repeat=5))
+
+
+def report(name: str, seconds: float, calls: int):
+    """Imprime el costo por tirada de un benchmark en nanosegundos."""
+    print(f"{name:<45} {seconds / calls * 1e9:8.1f} ns/tirada")
+
+
+def main(num_rolls: int = 100000):
+    dice_source = DiceSource(0)
+    reused_dices = (Dice(dice_source=dice_source), Dice(dice_source=dice_source))
+
+    def roll_new_dices():
+        # Tirada original de BackgammonGame.roll_dices(): dos Dice nuevos con random.randint
+        dices = [Dice(), Dice()]
+        for dice in dices:
+            dice.roll_dice()
+
+    def roll_reused_dices():
+        for dice in reused_dices:
+            dice.roll_dice()
+
+    report("random.randint x2", timeit(lambda: (random.randint(1, 6), random.randint(1, 6)), num_rolls), num_rolls)
+    report("DiceSource.next_pair", timeit(dice_source.next_pair, num_rolls), num_rolls)
+    report("Dice() nuevos + random", timeit(roll_new_dices, num_rolls), num_rolls)
+    report("Dice reutilizados + DiceSource", timeit(roll_reused_dices, num_rolls), num_rolls)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,25 @@
+"""Benchmark de la lectura de un archivo de partidas (GameArchive).
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_game_archive <archivo>
+"""
+import sys
+from time import perf_counter
+
+from core.GameArchive import GameArchive
+
+
+def main(path: str):
+    start = perf_counter()
+    num_games = 0
+    white_wins = 0
+    for game_record in GameArchive.read(path):
+        num_games += 1
+        white_wins += game_record.result is not None and game_record.result[0]
+    seconds = perf_counter() - start
+    print(f"Partidas: {num_games}, ganadas por las blancas: {white_wins} "
+          f"({num_games / seconds if seconds else 0.0:.1f} partidas/s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -0,0 +1,31 @@
+"""Benchmark de la evaluación por lotes de la red neuronal (solo CPU).
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_neural_evaluator [archivo de pesos .npz]
+"""
+import sys
+from timeit import repeat
+
+import numpy as np
+
+from benchmarks.bench_batch_moves import sample_positions
+from core.NeuralEvaluator import NeuralEvaluator
+
+
+def main(batch_sizes: tuple[int, ...] = (1, 32, 1024), positions_per_size: int = 32768):
+    evaluator = NeuralEvaluator.load(sys.argv[1]) if len(sys.argv) > 1 else NeuralEvaluator.random()
+    positions = sample_positions(max(batch_sizes))
+    points = np.array([points for points, _ in positions], dtype=np.int8)
+    uses_white = np.array([uses_white_checkers for _, uses_white_checkers in positions])
+
+    for batch_size in batch_sizes:
+        batch_points = points[:batch_size]
+        batch_uses_white = uses_white[:batch_size]
+        number = max(positions_per_size // batch_size, 1)
+        seconds = min(repeat(lambda: evaluator.evaluate_batch(batch_points, batch_uses_white),
+                             number=number, repeat=5))
+        print(f"lote de {batch_size:>5}: {number * batch_size / seconds:12,.0f} posiciones/s")
+
+
+if __name__ == "__main__":
+    main()
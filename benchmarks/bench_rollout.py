@@ -0,0 +1,29 @@
+"""Benchmark de la escalabilidad de los rollouts con la cantidad de procesos.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_rollout [cantidad de partidas]
+"""
+import sys
+from os import cpu_count
+
+from core.Board import Board
+from core.RolloutEngine import RolloutEngine
+
+
+def main(num_games: int = 400):
+    board = Board()
+    max_workers = cpu_count() or 1
+    base_games_per_second = None
+    num_workers = 1
+    while num_workers <= max_workers:
+        results = RolloutEngine(num_workers=num_workers, games_per_task=10).rollout(board, True, num_games)
+        games_per_second = results["games_per_second"]
+        base_games_per_second = base_games_per_second or games_per_second
+        print(f"{num_workers:>3} procesos: {games_per_second:8.1f} partidas/s "
+              f"(x{games_per_second / base_games_per_second:.2f}), "
+              f"victoria {results['win'][0]:.3f} ± {results['win'][2] - results['win'][0]:.3f}")
+        num_workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 400)
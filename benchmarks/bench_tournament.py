@@ -0,0 +1,32 @@
+"""Torneo entre el bot heurístico y el bot de carrera: rendimiento y resultados.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_tournament <cantidad de partidas> [archivo de resultados] [cantidad de procesos]
+                                          [archivo del libro de aperturas]
+"""
+import sys
+
+from core.ExpectiminimaxBot import ExpectiminimaxBot
+from core.HeuristicEvaluator import HeuristicEvaluator
+from core.OpeningBook import OpeningBook
+from core.RaceEvaluator import RaceEvaluator
+from core.TournamentRunner import TournamentRunner
+
+
+def main(num_games: int, output_path: str | None = None, num_workers: int | None = None,
+         opening_book_path: str | None = None):
+    book = OpeningBook.load(opening_book_path) if opening_book_path else None
+    runner = TournamentRunner((ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=1, opening_book=book),
+                               ExpectiminimaxBot(RaceEvaluator.win_probability, max_depth=1, opening_book=book)),
+                              ("heuristic", "race"), num_workers=num_workers)
+    report = runner.run(num_games, output_path)
+    print(f"{report['games']} partidas en {report['seconds']:.2f} s ({report['games_per_second']:.1f} partidas/s), "
+          f"{report['average_plies']:.1f} jugadas por partida, {report['unfinished']} sin terminar")
+    for name in ("heuristic", "race"):
+        print(f"{name}: victorias {report[name]['win_rate']:.3f}, gammons {report[name]['gammon_rate']:.3f}, "
+              f"backgammons {report[name]['backgammon_rate']:.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]), sys.argv[2] if len(sys.argv) > 2 else None,
+         int(sys.argv[3]) if len(sys.argv) > 3 else None, sys.argv[4] if len(sys.argv) > 4 else None)
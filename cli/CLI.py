@@ -1,6 +1,7 @@
 from core.Board import Board
 from core.Dice import Dice
 from core.InputType import InputType
+from core.SelectionOverlay import SelectionOverlay
 
 
 class CLI:
@@ -10,6 +11,7 @@ class CLI:
 
     Attributes:
         __board__: El tablero del juego.
+        __selection__: La capa de selección que se dibuja sobre el tablero.
         SELECTED_CHECKER_TOP_STR: Carácter para simbolizar la ficha seleccionada (en top).
         SELECTED_CHECKER_BOT_STR: Carácter para simbolizar la ficha seleccionada (en bot).
         POSIBLE_CHECKER_TOP_STR: Tupla de carácteres para simbolizar un posible movimiento (en top).
@@ -20,13 +22,15 @@ class CLI:
     POSIBLE_CHECKER_TOP_STR = ("⊕", "△")
     POSIBLE_CHECKER_BOT_STR = ("⊕", "▽")
 
-    def __init__(self, board: Board):
+    def __init__(self, board: Board, selection: SelectionOverlay | None = None):
         """Inicializa una instancia de la interfaz gráfica por consola.
 
         Args:
             board: El tablero del juego.
+            selection: La capa de selección a dibujar (por defecto, una sin selección).
         """
         self.__board__ = board
+        self.__selection__ = selection if selection is not None else SelectionOverlay()
 
     def refresh_cli(self, uses_white_checkers: bool, dices: tuple[Dice, ...] | None):
         self.print_board(uses_white_checkers)
@@ -68,8 +72,9 @@ class CLI:
         Args:
             uses_white_checkers: Indica si el jugador actual usa fichas blancas.
         """
-        board_top_triangles = self.__board__.top_board_triangles
-        board_bot_triangles = self.__board__.bot_board_triangles
+        # Aplica los símbolos de selección sobre los triángulos generados por el tablero.
+        board_top_triangles = self.__selection__.mark_triangles(self.__board__.top_board_triangles, range(12, 0, -1))
+        board_bot_triangles = self.__selection__.mark_triangles(self.__board__.bot_board_triangles, range(13, 25))
 
         # Si el jugador actual no usa fichas blancas,
         # se invierten los triángulos para que la perspectiva sea correcta.
@@ -246,7 +251,7 @@ class CLI:
 
         # Agrega el pie del tablero inferior.
         off_str = self.generate_checkers_off_str(uses_white_checkers)
-        off_possible_move = "P 🡺" if self.__board__.off_tray_posible_move[0 if uses_white_checkers else 1] else "   "
+        off_possible_move = "P 🡺" if self.__selection__.off_tray_posible_move[0 if uses_white_checkers else 1] else "   "
         if uses_white_checkers:
             bottom_board_str += (
                 "│  ▲  ▲  ▲  ▲  ▲  ▲  │  ▲  ▲  ▲  ▲  ▲  ▲  │\n"
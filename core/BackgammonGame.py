@@ -3,20 +3,72 @@ from core.Board import Board
 from core.Dice import Dice
 from core.Player import Player
 from core.InputType import InputType
+from core.SelectionOverlay import SelectionOverlay
+
+try:
+    from core.DiceSource import DiceSource
+except ImportError:
+    # Sin NumPy se puede jugar igual, con los dados del módulo random, pero sin semilla para repetir la partida
+    DiceSource = None
 
 
 class BackgammonGame:
-    def __init__(self):
+    def __init__(self, dice_source: "DiceSource | None" = None, seed: int | None = None):
+        # Sin fuente de dados se crea una con semilla conocida para poder repetir la partida (ver game_record)
+        if dice_source is None and DiceSource is None:
+            if seed is not None:
+                raise ImportError("Se necesita NumPy para jugar una partida con semilla.")
+        elif dice_source is None:
+            seed = seed if seed is not None else DiceSource.new_seed()
+            dice_source = DiceSource(seed)
+        self.__seed__ = seed
+        self.__plays__ = []
+        self.__current_play__ = []
+        self.__starts_white__ = None
         self.__pygame_mode__ = False
         self.__board__ = Board()
-        self.__cli__ = CLI(self.__board__)
+        self.__selection__ = SelectionOverlay()
+        self.__cli__ = CLI(self.__board__, self.__selection__)
         self.__white_player__ = Player("Blanco", True)
         self.__black_player__ = Player("Negro", False)
         self.__player_playing__ = None
-        self.__dices__ = [Dice(), Dice()]
+        # Los dos dados se reutilizan en cada tirada
+        self.__rolled_dices__ = (Dice(dice_source=dice_source), Dice(dice_source=dice_source))
+        self.__dices__ = list(self.__rolled_dices__)
         self.__dices_values__ = []
         self.__twin_dice__ = False
 
+    @property
+    def board(self) -> Board:
+        """El tablero del juego."""
+        return self.__board__
+
+    @property
+    def player_playing(self) -> Player | None:
+        """El jugador que tiene el turno (None antes de la tirada inicial)."""
+        return self.__player_playing__
+
+    @property
+    def dices_values(self) -> tuple[int, ...]:
+        """Los valores de los dados de la última tirada (4 valores si salieron dobles)."""
+        return tuple(self.__dices_values__)
+
+    @property
+    def seed(self) -> int | None:
+        """La semilla de los dados de la partida (None si se inyectó una fuente de dados sin semilla)."""
+        return self.__seed__
+
+    @property
+    def game_record(self) -> "GameRecord":
+        """El registro de la partida hasta el momento (semilla, jugadas de cada turno y resultado)."""
+        # El registro repite las partidas con DiceSource, que usa NumPy
+        from core.GameRecord import GameRecord
+        plays = self.__plays__ + [tuple(self.__current_play__)] if self.__current_play__ else self.__plays__
+        won, white_won = self.__board__.is_match_won()
+        return GameRecord(self.__seed__, plays, (self.__white_player__.name, self.__black_player__.name),
+                          (white_won, self.__board__.get_win_type(white_won)) if won else None,
+                          self.__starts_white__)
+
     def refresh(self):
         if self.__pygame_mode__:
             pass
@@ -56,10 +108,11 @@ class BackgammonGame:
             elif unsorted_dices[0].dice_number < unsorted_dices[1].dice_number:
                 self.__player_playing__ = self.__black_player__
                 break
+        self.__starts_white__ = self.__player_playing__.uses_white_checkers
 
     def roll_dices(self, unsorted: bool = False) -> tuple[Dice, ...]:
         unsorted_dices = []
-        self.__dices__ = [Dice(), Dice()]
+        self.__dices__ = list(self.__rolled_dices__)
         self.__dices_values__ = []
         for dice in self.__dices__:
             dice.roll_dice()
@@ -78,8 +131,27 @@ class BackgammonGame:
             return tuple(unsorted_dices)
         return tuple(self.__dices__)
 
+    def play_bot_turn(self, bot) -> tuple:
+        """Juega el turno del jugador actual con un bot, sin interacción con el usuario.
+
+        Tira los dados, pide la jugada al bot y la aplica en el tablero.
+
+        Args:
+            bot: Un objeto con un método choose_play(tablero, usa fichas blancas, dados) -> jugada.
+        Returns:
+            tuple: La jugada realizada.
+        """
+        self.roll_dices()
+        uses_white_checkers = self.__player_playing__.uses_white_checkers
+        play = bot.choose_play(self.__board__, uses_white_checkers, self.dices_values)
+        self.__board__.apply_play(play, uses_white_checkers)
+        self.__current_play__.extend(play)
+        return play
+
     def change_turn(self):
-        """Cambia el jugador que está jugando por el otro."""
+        """Cambia el jugador que está jugando por el otro y guarda la jugada del turno en el registro."""
+        self.__plays__.append(tuple(self.__current_play__))
+        self.__current_play__ = []
         if self.__player_playing__.uses_white_checkers:
             self.__player_playing__ = self.__black_player__
         else:
@@ -88,9 +160,9 @@ class BackgammonGame:
     def checker_selection(self) -> dict:
         user_input_normal_index = self.get_user_input_check_type("Seleccione una ficha para mover",
                                                                  (InputType.NORMAL_INDEX,))
-        possible_moves = self.__board__.select_checker(user_input_normal_index,
-                                                       self.__player_playing__.uses_white_checkers,
-                                                       tuple(self.__dices_values__))
+        possible_moves = self.__selection__.select_checker(self.__board__, user_input_normal_index,
+                                                           self.__player_playing__.uses_white_checkers,
+                                                           tuple(self.__dices_values__))
         return possible_moves
 
     def selected_checker_move(self, possible_moves: dict):
@@ -99,8 +171,16 @@ class BackgammonGame:
         while user_input_normal_index not in possible_moves:
             user_input_normal_index = self.get_user_input_check_type("Seleccione un lugar válido donde"
                                                                      "mover la ficha", (InputType.NORMAL_INDEX,))
-        self.__board__.move_checker(self.__board__.selected_checker, user_input_normal_index,
-                                    self.__player_playing__.uses_white_checkers)
+        # Mueve la ficha de a un dado, como en las jugadas de los bots (Board.apply_play()),
+        # para comer las fichas solitarias de los puntos intermedios y retirar con el último dado,
+        # y registra cada movimiento simple para poder repetir la partida
+        uses_white_checkers = self.__player_playing__.uses_white_checkers
+        normal_origin = self.__selection__.selected_checker
+        for dice_number in possible_moves[user_input_normal_index]:
+            self.__board__.apply_single_move(normal_origin, dice_number, uses_white_checkers)
+            self.__current_play__.append((normal_origin, dice_number))
+            normal_origin += dice_number
+        self.__selection__.deselect_checker(self.__player_playing__.uses_white_checkers)
         self.consume_dice(user_input_normal_index, possible_moves)
 
     def consume_dice(self, dest_triangle_normal: int,  possible_moves: dict):
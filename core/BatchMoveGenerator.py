@@ -0,0 +1,94 @@
+import numpy as np
+
+
+class BatchMoveGenerator:
+    """Genera movimientos legales para lotes de posiciones con operaciones vectorizadas de NumPy.
+
+    Recibe N posiciones (cada una con el formato del arreglo de puntos de Board:
+    26 enteros con signo, positivos = blancas, negativos = negras, 0 = barra blanca, 25 = barra negra)
+    y N tiradas de dos dados, y calcula a la vez, para todas las posiciones, orígenes y dados,
+    si una ficha puede moverse con ese dado, siguiendo las mismas reglas que Board.get_legal_single_moves().
+
+    Las posiciones se pasan primero a la perspectiva del jugador que mueve (índices normales 0-25,
+    con 0 = barra), por lo que el resto de las operaciones no depende del color.
+
+    Attributes:
+        NUM_POINTS: La cantidad de valores del arreglo de puntos.
+        NUM_ORIGINS: La cantidad de orígenes posibles de un movimiento (índices normales 0-24).
+        NORMAL_ORIGINS: Los índices normales de origen (0-24), como arreglo de NumPy.
+    """
+    NUM_POINTS = 26
+    NUM_ORIGINS = 25
+    NORMAL_ORIGINS = np.arange(25)
+
+    @staticmethod
+    def to_player_perspective(positions: np.ndarray, uses_white_checkers) -> tuple[np.ndarray, np.ndarray]:
+        """Pasa un lote de posiciones a la perspectiva del jugador que mueve.
+
+        Args:
+            positions: Un arreglo N×26 de enteros con signo con el formato del arreglo de puntos de Board.
+            uses_white_checkers: Indica si el jugador que mueve usa fichas blancas
+                    (un booleano para todo el lote o un arreglo de N booleanos).
+        Returns:
+            tuple: Dos arreglos N×26 indexados por índice normal (0 = barra):
+            (fichas propias, fichas del oponente).
+        """
+        positions = np.asarray(positions, dtype=np.int8)
+        uses_white_checkers = np.broadcast_to(np.asarray(uses_white_checkers, dtype=bool), positions.shape[:1])
+        # Para las negras, el índice normal n corresponde al punto absoluto 25 - n (y los valores se niegan)
+        perspective = np.where(uses_white_checkers[:, None], positions, -positions[:, ::-1])
+        return np.clip(perspective, 0, None), np.clip(-perspective, 0, None)
+
+    @classmethod
+    def compute_legal_moves(cls, positions: np.ndarray, dice: np.ndarray, uses_white_checkers) -> np.ndarray:
+        """Calcula la legalidad de mover una ficha desde cada origen con cada dado, para todo el lote.
+
+        Args:
+            positions: Un arreglo N×26 de enteros con signo con el formato del arreglo de puntos de Board.
+            dice: Un arreglo N×2 con los números de los dados (0 = dado ya usado).
+            uses_white_checkers: Indica si el jugador que mueve usa fichas blancas
+                    (un booleano para todo el lote o un arreglo de N booleanos).
+        Returns:
+            np.ndarray: Un arreglo booleano N×2×25 [posición, dado, índice normal de origen (0 = barra)].
+        """
+        own, opponent = cls.to_player_perspective(positions, uses_white_checkers)
+        dice = np.asarray(dice, dtype=np.int8)
+        if own.shape[1] != cls.NUM_POINTS or dice.shape != (own.shape[0], 2):
+            raise ValueError("Se esperaba un arreglo de posiciones N×26 y un arreglo de dados N×2.")
+
+        # Índices normales de destino [posición, dado, origen]
+        dest = cls.NORMAL_ORIGINS[None, None, :] + dice[:, :, None]
+        has_checker = (own[:, :cls.NUM_ORIGINS] > 0)[:, None, :]
+
+        # Movimientos dentro del tablero: el destino no debe estar tomado por el oponente
+        dest_on_board = np.minimum(dest, 24)
+        dest_opponent = np.take_along_axis(opponent[:, None, :], dest_on_board, axis=2)
+        inside_legal = (dest <= 24) & (dest_opponent < 2)
+
+        # Retiro de fichas: todas las fichas en el área de retiro,
+        # con el número exacto o, si es la ficha más atrasada, con uno mayor
+        can_take_out = own[:, :19].sum(axis=1) == 0
+        home_occupied = own[:, 19:25] > 0
+        most_advanced = np.where(home_occupied.any(axis=1), home_occupied.argmax(axis=1) + 19, -1)
+        is_most_advanced = cls.NORMAL_ORIGINS[None, None, :] == most_advanced[:, None, None]
+        take_out_legal = can_take_out[:, None, None] & (dest >= 25) & ((dest == 25) | is_most_advanced)
+
+        legal = has_checker & (dice[:, :, None] > 0) & (inside_legal | take_out_legal)
+
+        # Si hay fichas en la barra, solo se puede ingresar desde la barra (origen 0)
+        bar_checkers = (own[:, 0] > 0)[:, None, None]
+        from_bar = cls.NORMAL_ORIGINS[None, None, :] == 0
+        return legal & (bar_checkers == from_bar)
+
+    @staticmethod
+    def get_legal_origins(legal_moves: np.ndarray, index: int, dice_slot: int) -> tuple:
+        """Obtiene los orígenes legales de una posición y un dado del resultado de compute_legal_moves().
+
+        Args:
+            legal_moves: El arreglo booleano N×2×25 devuelto por compute_legal_moves().
+            index: El índice de la posición en el lote.
+            dice_slot: El dado (0 o 1).
+        Returns:
+            tuple: Los índices normales de origen (0-24), con el mismo formato que Board.get_legal_single_moves().
+        """
+        return tuple(int(normal_origin) for normal_origin in np.flatnonzero(legal_moves[index, dice_slot]))
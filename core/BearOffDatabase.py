@@ -0,0 +1,282 @@
+import mmap
+import struct
+from math import comb
+
+import numpy as np
+
+from core.Board import Board
+from core.RollCatalog import RollCatalog
+
+
+class BearOffDatabase:
+    """Base de datos de retiro de fichas de un solo lado (one-sided bear-off), guardada en un archivo binario.
+
+    Para cada distribución de hasta N fichas en el área de retiro de un jugador
+    guarda la cantidad esperada de tiradas para retirarlas todas (jugando para minimizarla)
+    y la distribución de probabilidad de esa cantidad de tiradas.
+
+    El archivo se abre con mmap, por lo que las consultas leen directamente del archivo
+    (sin copiarlo a memoria) y varios procesos pueden compartirlo.
+
+    Las distribuciones se representan como una tupla de 6 enteros con la cantidad de fichas
+    en cada punto del área de retiro, ordenados por distancia al área de retiro:
+    (fichas a 1 pip (índice normal 24), ..., fichas a 6 pips (índice normal 19)).
+    Cada distribución tiene un índice único en el archivo (sistema numérico combinatorio).
+
+    Formato del archivo:
+        Encabezado: MAGIC, versión (uint16), cantidad máxima de fichas (uint16), cantidad de tiradas (uint16).
+        Registros (uno por distribución, en orden de índice): tiradas esperadas (float32)
+        y probabilidad de terminar en 0, 1, ..., MAX_ROLLS - 1 tiradas (uint16, escaladas a PROBABILITY_SCALE).
+
+    Attributes:
+        __file__: El archivo abierto de la base de datos.
+        __mmap__: El mapeo en memoria del archivo.
+        __max_checkers__: La cantidad máxima de fichas de las distribuciones guardadas.
+        __num_positions__: La cantidad de distribuciones guardadas.
+        MAGIC: Los bytes que identifican el formato del archivo.
+        VERSION: La versión del formato del archivo.
+        HEADER: El formato (struct) del encabezado.
+        NUM_HOME_POINTS: La cantidad de puntos del área de retiro.
+        MAX_ROLLS: La cantidad de tiradas de la distribución guardada.
+        PROBABILITY_SCALE: El valor entero que representa la probabilidad 1.
+        RECORD: El formato (struct) de cada registro.
+    """
+    MAGIC = b"BGBO"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHH")
+    NUM_HOME_POINTS = 6
+    MAX_ROLLS = 32
+    PROBABILITY_SCALE = 65535
+    RECORD = struct.Struct(f"<f{MAX_ROLLS}H")
+
+    def __init__(self, path: str):
+        """Abre una base de datos de retiro de fichas.
+
+        Args:
+            path: La ruta del archivo generado con generate().
+        """
+        self.__file__ = open(path, "rb")
+        self.__mmap__ = mmap.mmap(self.__file__.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_checkers, max_rolls = self.HEADER.unpack_from(self.__mmap__, 0)
+        if magic != self.MAGIC or version != self.VERSION or max_rolls != self.MAX_ROLLS:
+            self.close()
+            raise ValueError("El archivo no es una base de datos de retiro de fichas válida.")
+        self.__max_checkers__ = max_checkers
+        self.__num_positions__ = comb(max_checkers + self.NUM_HOME_POINTS, self.NUM_HOME_POINTS)
+
+    @property
+    def max_checkers(self) -> int:
+        """La cantidad máxima de fichas de las distribuciones guardadas."""
+        return self.__max_checkers__
+
+    def __len__(self) -> int:
+        """La cantidad de distribuciones guardadas."""
+        return self.__num_positions__
+
+    def close(self):
+        """Cierra el mapeo en memoria y el archivo."""
+        self.__mmap__.close()
+        self.__file__.close()
+
+    @classmethod
+    def position_index(cls, home_counts: tuple[int, ...], max_checkers: int) -> int:
+        """Obtiene el índice único de una distribución de fichas.
+
+        Args:
+            home_counts: Las fichas en cada punto del área de retiro (a 1 pip, ..., a 6 pips).
+            max_checkers: La cantidad máxima de fichas de la base de datos.
+        Returns:
+            int: El índice de la distribución (0 a C(max_checkers + 6, 6) - 1).
+        """
+        # Cada distribución es una forma de separar max_checkers fichas (las retiradas incluidas)
+        # en 7 grupos con 6 separadores; el índice se obtiene de las posiciones de los separadores
+        index = 0
+        separator = -1
+        for point_num, checkers in enumerate(home_counts):
+            separator += checkers + 1
+            index += comb(separator, point_num + 1)
+        if separator >= max_checkers + cls.NUM_HOME_POINTS:
+            raise ValueError(f"La distribución tiene más de {max_checkers} fichas.")
+        return index
+
+    @classmethod
+    def get_home_counts(cls, board: Board, uses_white_checkers: bool) -> tuple[int, ...]:
+        """Obtiene la distribución de fichas del área de retiro de un jugador.
+
+        Args:
+            board: El tablero del juego.
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            tuple: Las fichas en cada punto del área de retiro (a 1 pip, ..., a 6 pips).
+        """
+        sign = 1 if uses_white_checkers else -1
+        normal_to_point = board.NORMAL_TO_POINT[uses_white_checkers]
+        return tuple(max(board.points[normal_to_point[25 - pips]] * sign, 0)
+                     for pips in range(1, cls.NUM_HOME_POINTS + 1))
+
+    def read_record(self, home_counts: tuple[int, ...]) -> tuple:
+        """Lee el registro de una distribución directamente del archivo.
+
+        Args:
+            home_counts: Las fichas en cada punto del área de retiro (a 1 pip, ..., a 6 pips).
+        Returns:
+            tuple: (tiradas esperadas, probabilidades escaladas de terminar en 0, 1, ... tiradas).
+        """
+        index = self.position_index(home_counts, self.__max_checkers__)
+        values = self.RECORD.unpack_from(self.__mmap__, self.HEADER.size + index * self.RECORD.size)
+        return values[0], values[1:]
+
+    def expected_rolls(self, home_counts: tuple[int, ...]) -> float:
+        """Obtiene la cantidad esperada de tiradas para retirar todas las fichas de una distribución.
+
+        Args:
+            home_counts: Las fichas en cada punto del área de retiro (a 1 pip, ..., a 6 pips).
+        Returns:
+            float: La cantidad esperada de tiradas.
+        """
+        return self.read_record(home_counts)[0]
+
+    def rolls_distribution(self, home_counts: tuple[int, ...]) -> tuple[float, ...]:
+        """Obtiene la distribución de probabilidad de la cantidad de tiradas para retirar todas las fichas.
+
+        Args:
+            home_counts: Las fichas en cada punto del área de retiro (a 1 pip, ..., a 6 pips).
+        Returns:
+            tuple: La probabilidad de terminar en exactamente 0, 1, ..., MAX_ROLLS - 1 tiradas.
+        """
+        return tuple(value / self.PROBABILITY_SCALE for value in self.read_record(home_counts)[1])
+
+    def win_probability(self, board: Board, uses_white_checkers: bool) -> float:
+        """Calcula la probabilidad de ganar del jugador con el turno cuando ambos están retirando fichas.
+
+        El jugador con el turno gana si termina en n tiradas y el oponente necesita más de n - 1.
+
+        Args:
+            board: El tablero del juego (todas las fichas de ambos jugadores en su área de retiro).
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas.
+        Returns:
+            float: La probabilidad (0-1) de que el jugador con el turno gane.
+        """
+        player_rolls = self.rolls_distribution(self.get_home_counts(board, uses_white_checkers))
+        opponent_rolls = self.rolls_distribution(self.get_home_counts(board, not uses_white_checkers))
+        win_probability = 0.0
+        opponent_not_finished = 1.0
+        for rolls in range(self.MAX_ROLLS):
+            win_probability += player_rolls[rolls] * opponent_not_finished
+            opponent_not_finished -= opponent_rolls[rolls]
+        return min(max(win_probability, 0.0), 1.0)
+
+    def best_play(self, board: Board, uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple:
+        """Elige la jugada legal que minimiza la cantidad esperada de tiradas restantes.
+
+        Args:
+            board: El tablero del juego (todas las fichas del jugador en su área de retiro).
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados lanzados.
+        Returns:
+            tuple: La mejor jugada (con el formato de Board.generate_legal_plays()).
+        """
+        best_play = None
+        best_expected_rolls = None
+        search_board = board.copy()
+        for play in board.generate_legal_plays(uses_white_checkers, dice_numbers):
+            search_board.make_play(play, uses_white_checkers)
+            expected_rolls = self.expected_rolls(self.get_home_counts(search_board, uses_white_checkers))
+            search_board.unmake_play(play)
+            if best_expected_rolls is None or expected_rolls < best_expected_rolls:
+                best_play, best_expected_rolls = play, expected_rolls
+        return best_play
+
+    @classmethod
+    def enumerate_positions(cls, max_checkers: int) -> list:
+        """Enumera todas las distribuciones de hasta max_checkers fichas en el área de retiro.
+
+        Args:
+            max_checkers: La cantidad máxima de fichas.
+        Returns:
+            list: Las distribuciones, ordenadas por cantidad de pips (de menor a mayor).
+        """
+        positions = [()]
+        for _ in range(cls.NUM_HOME_POINTS):
+            positions = [position + (checkers,) for position in positions
+                         for checkers in range(max_checkers - sum(position) + 1)]
+        return sorted(positions, key=lambda position: sum((pips + 1) * checkers
+                                                          for pips, checkers in enumerate(position)))
+
+    @staticmethod
+    def single_die_successors(position: tuple[int, ...], dice_number: int) -> set:
+        """Obtiene las distribuciones que se pueden alcanzar moviendo una ficha con un dado.
+
+        Args:
+            position: La distribución de fichas (a 1 pip, ..., a 6 pips).
+            dice_number: El número del dado.
+        Returns:
+            set: Las distribuciones alcanzables (vacío si no quedan fichas).
+        """
+        successors = set()
+        highest_point = max((pips for pips in range(len(position)) if position[pips]), default=-1)
+        for pips in range(highest_point + 1):
+            if not position[pips]:
+                continue
+            # Se puede retirar con el número exacto o con uno mayor desde el punto más alto ocupado
+            if pips + 1 < dice_number and pips != highest_point:
+                continue
+            successor = list(position)
+            successor[pips] -= 1
+            if pips + 1 > dice_number:
+                successor[pips - dice_number] += 1
+            successors.add(tuple(successor))
+        return successors
+
+    @classmethod
+    def generate(cls, path: str, max_checkers: int = 15):
+        """Genera la base de datos y la guarda en un archivo.
+
+        Recorre las distribuciones de menor a mayor cantidad de pips, ya que cada jugada
+        lleva a una distribución con menos pips, cuyos resultados ya están calculados.
+
+        Args:
+            path: La ruta del archivo a generar.
+            max_checkers: La cantidad máxima de fichas (15 para la base de datos completa).
+        """
+        positions = cls.enumerate_positions(max_checkers)
+        num_positions = len(positions)
+        expected_rolls = np.zeros(num_positions)
+        distributions = np.zeros((num_positions, cls.MAX_ROLLS))
+        roll_weights = np.array(RollCatalog.WEIGHTS)
+        single_moves = {}
+
+        def successors_for_die(position: tuple[int, ...], dice_number: int) -> set:
+            key = (position, dice_number)
+            if key not in single_moves:
+                single_moves[key] = cls.single_die_successors(position, dice_number)
+            return single_moves[key]
+
+        for position in positions:
+            index = cls.position_index(position, max_checkers)
+            if not any(position):
+                distributions[index, 0] = 1.0
+                continue
+
+            best_indexes = []
+            for play_orders in RollCatalog.PLAY_ORDERS:
+                reachable = set()
+                for sequence in play_orders:
+                    current = {position}
+                    for dice_number in sequence:
+                        # Una distribución sin fichas ya no puede mover (terminó de retirar)
+                        current = set().union(*(successors_for_die(state, dice_number) or {state}
+                                                for state in current))
+                    reachable |= current
+                successor_indexes = [cls.position_index(state, max_checkers) for state in reachable]
+                best_indexes.append(min(successor_indexes, key=expected_rolls.__getitem__))
+
+            expected_rolls[index] = 1.0 + roll_weights @ expected_rolls[best_indexes]
+            distributions[index, 1:] = (roll_weights @ distributions[best_indexes])[:-1]
+
+        scaled = np.rint(distributions * cls.PROBABILITY_SCALE).astype(np.uint16)
+        with open(path, "wb") as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, max_checkers, cls.MAX_ROLLS))
+            for index in range(num_positions):
+                file.write(cls.RECORD.pack(float(expected_rolls[index]), *scaled[index]))
+
@@ -1,4 +1,11 @@
-from itertools import combinations
+import base64
+import binascii
+from array import array
+from random import Random
+
+from core.Position import Position
+from core.RollCatalog import RollCatalog
+from core.TranspositionTable import TranspositionTable
 
 
 class Board:
@@ -16,40 +23,219 @@ class Board:
     (0 = Ninguno; 1 = Resaltador de ficha seleccionada; 2 = Posible movimiento).
     Entonces, en este ejemplo, se representan 5 fichas blancas
     con un posible movimiento sobre ellas.
+    El tablero solo guarda el estado de juego, por lo que los triángulos que genera
+    siempre tienen el símbolo de selección en 0; la selección la maneja SelectionOverlay.
 
     La clase se encarga de mediar toda clase de cambios
     en el tablero (ej.: movimiento de fichas).
 
+    Internamente, las fichas se almacenan en un único arreglo de enteros con signo
+    de 26 posiciones, indexado por punto absoluto:
+    los puntos 1-24 coinciden con el índice normal de las fichas blancas
+    (para las negras, el punto absoluto es 25 - índice normal),
+    el signo indica el dueño (positivo = blancas "●"; negativo = negras "○")
+    y la magnitud indica la cantidad de fichas.
+    El punto 0 guarda la barra de las blancas y el punto 25 la barra de las negras (en negativo).
+    Los triángulos en forma de lista son una vista generada a partir de este arreglo.
+
     Attributes:
-        __top_board_triangles__: Una lista que contiene los triángulos superiores.
-        __bot_board_triangles__: Una lista que contiene los triángulos inferiores.
+        __points__: El arreglo de enteros con signo (26 posiciones) con el estado de las fichas.
+        __zobrist_hash__: El hash Zobrist (64 bits) de la posición, actualizado en cada cambio de un punto.
+        __home_checkers__: Una lista con la cantidad de fichas en el área de retiro (índices normales 19-24).
+                [fichas blancas, fichas negras]
+        __outside_home_checkers__: Una lista con la cantidad de fichas fuera del área de retiro (incluida la barra).
+                [fichas blancas, fichas negras]
+        __home_points_mask__: Una lista de máscaras de 6 bits con los puntos ocupados del área de retiro
+                (bit 0 = índice normal 19, ..., bit 5 = índice normal 24). [fichas blancas, fichas negras]
+        __occupied_points_mask__: Una lista de máscaras de 24 bits con los puntos que tienen alguna ficha
+                (bit 0 = punto absoluto 1, ..., bit 23 = punto absoluto 24). [fichas blancas, fichas negras]
+        __held_points_mask__: Una lista de máscaras de 24 bits con los puntos tomados (2 o más fichas).
+                [fichas blancas, fichas negras]
+        __blot_points_mask__: Una lista de máscaras de 24 bits con los puntos con una sola ficha (blots).
+                [fichas blancas, fichas negras]
+        __pip_counts__: Una lista con la cantidad de puntos (pips) que le faltan a cada jugador
+                para retirar todas sus fichas. [fichas blancas, fichas negras]
+        __top_board_triangles__: Una lista (generada) que contiene los triángulos superiores.
+        __bot_board_triangles__: Una lista (generada) que contiene los triángulos inferiores.
         __num_checkers_board_player__: Una lista con la cantidad total de fichas en el tablero por jugador.
                 [fichas blancas, fichas negras]
         __num_checkers_total__: La cantidad total de fichas por jugador (15).
-        __selected_checker__: El índice normal (1-24) de la ficha seleccionada actualmente, o None si ninguna.
         __board_bar__: Una lista que contiene la cantidad de fichas en la barra.
                 [fichas blancas, fichas negras]
         __checkers_off__: Una lista que contiene la cantidad de fichas retiradas del tablero.
                 [fichas blancas, fichas negras]
         __is_bar_empty__: Una lista de booleanos que indica si la barra de cada jugador está vacía.
                 [fichas blancas, fichas negras]
-        __off_tray_posible_move__: Una lista que indica si el jugador puede mover una ficha al área de retiro.
-                [fichas blancas, fichas negras]
+        __undo_stack__: Una pila con los registros para deshacer los movimientos hechos con make_move().
+                Cada registro es una tupla (índice normal de origen, número de dado, usa fichas blancas, comió ficha).
+        __dice_combinations_table__: La tabla de transposición de las combinaciones de dados posibles
+                (por defecto, DICE_COMBINATIONS_TABLE).
+        __legal_plays_table__: La tabla de transposición de las jugadas legales (por defecto, LEGAL_PLAYS_TABLE).
+        WHITE_BAR_POINT: El punto absoluto que representa la barra de las fichas blancas.
+        BLACK_BAR_POINT: El punto absoluto que representa la barra de las fichas negras.
+        NEW_GAME_POINTS: El estado inicial del arreglo de puntos.
+        ZOBRIST_KEYS: Claves aleatorias (fijas) de 64 bits por punto absoluto y valor del punto.
+                El valor del punto se usa directamente como índice (los negativos indexan desde el final)
+                y el valor 0 (punto vacío) tiene clave 0.
+        NORMAL_TO_POINT: Tabla precalculada [usa fichas blancas][índice normal (0-25)] -> punto absoluto.
+        NORMAL_TO_TRIANGLE_INDEX: Tabla precalculada [usa fichas blancas][índice normal (0-25)]
+                -> (está en la parte superior, índice en la lista de triángulos), o None para 0 y 25.
+        HOME_POINT_BITS: Tabla precalculada [usa fichas blancas][punto absoluto] -> bit del punto en la máscara
+                del área de retiro, o 0 si el punto está fuera del área de retiro.
+        POINT_BITS: Tabla precalculada [punto absoluto] -> bit del punto en las máscaras de ocupación,
+                o 0 para las barras.
+        ALL_POINTS_MASK: La máscara de ocupación con los 24 puntos activos.
+        HOME_POINTS_MASKS: Las máscaras de ocupación del área de retiro. [fichas blancas, fichas negras]
+        PIP_WEIGHTS: Tabla precalculada [usa fichas blancas][punto absoluto] -> pips que le faltan
+                a una ficha del jugador en ese punto (25 en la barra).
+        DICE_COMBINATIONS_TABLE: Tabla de transposición compartida por defecto con las combinaciones de dados
+                posibles por posición, jugador, dados y ficha seleccionada (protegida con un lock).
+        LEGAL_PLAYS_TABLE: Tabla de transposición compartida por defecto con las jugadas legales
+                por posición, jugador y dados (protegida con un lock).
+        POSITION_ID_POINTS: Tabla precalculada [usa fichas blancas][punto del Position ID (0-24)] -> punto absoluto.
+                En el Position ID los puntos se cuentan desde el punto 1 del jugador (el último antes de retirar)
+                hasta su punto 24, y el 24 es la barra.
+        POSITION_ID_RUNS: Tabla precalculada [cantidad de fichas] -> bits de un punto en el Position ID
+                (un 1 por ficha seguido de un 0).
+        POSITION_ID_BITS: La cantidad de bits del Position ID.
     """
+    WHITE_BAR_POINT = 0
+    BLACK_BAR_POINT = 25
+    NEW_GAME_POINTS = (0, 2, 0, 0, 0, 0, -5, 0, -3, 0, 0, 0, 5,
+                       -5, 0, 0, 0, 3, 0, 5, 0, 0, 0, 0, -2, 0)
+    ZOBRIST_KEYS = tuple((0,) + tuple(point_random.getrandbits(64) for _ in range(255))
+                         for point_random in (Random(64011 + point) for point in range(26)))
+    NORMAL_TO_POINT = (tuple(25 - normal_index for normal_index in range(26)), tuple(range(26)))
+    NORMAL_TO_TRIANGLE_INDEX = tuple(
+        (None,) + tuple((uses_white_checkers == (normal_index <= 12),
+                         12 - normal_index if normal_index <= 12 else normal_index - 13)
+                        for normal_index in range(1, 25)) + (None,)
+        for uses_white_checkers in (False, True))
+    HOME_POINT_BITS = (tuple(1 << (6 - point) if 1 <= point <= 6 else 0 for point in range(26)),
+                       tuple(1 << (point - 19) if 19 <= point <= 24 else 0 for point in range(26)))
+    POINT_BITS = tuple(1 << (point - 1) if 1 <= point <= 24 else 0 for point in range(26))
+    ALL_POINTS_MASK = (1 << 24) - 1
+    HOME_POINTS_MASKS = (0xFC0000, 0x00003F)
+    PIP_WEIGHTS = (tuple(range(26)), tuple(25 - point for point in range(26)))
+    DICE_COMBINATIONS_TABLE = TranspositionTable()
+    LEGAL_PLAYS_TABLE = TranspositionTable()
+    POSITION_ID_POINTS = (tuple(range(1, 26)), tuple(range(24, -1, -1)))
+    POSITION_ID_RUNS = tuple("1" * count + "0" for count in range(16))
+    POSITION_ID_BITS = 80
+
+    def __init__(self, legal_plays_table: TranspositionTable | None = None,
+                 dice_combinations_table: TranspositionTable | None = None):
+        """Inicializa una instancia de tablero de juego por defecto.
 
-    def __init__(self):
-        """Inicializa una instancia de tablero de juego por defecto."""
-        self.__top_board_triangles__ = []
-        self.__bot_board_triangles__ = []
+        Args:
+            legal_plays_table: La tabla de transposición de las jugadas legales
+                               (por defecto, la compartida LEGAL_PLAYS_TABLE).
+            dice_combinations_table: La tabla de transposición de las combinaciones de dados posibles
+                                     (por defecto, la compartida DICE_COMBINATIONS_TABLE).
+        """
+        self.__legal_plays_table__ = legal_plays_table if legal_plays_table is not None \
+            else self.LEGAL_PLAYS_TABLE
+        self.__dice_combinations_table__ = dice_combinations_table if dice_combinations_table is not None \
+            else self.DICE_COMBINATIONS_TABLE
+        self.__points__ = array("b", bytes(26))
+        self.__zobrist_hash__ = 0
+        self.__home_checkers__ = [0, 0]
+        self.__outside_home_checkers__ = [0, 0]
+        self.__home_points_mask__ = [0, 0]
+        self.__occupied_points_mask__ = [0, 0]
+        self.__held_points_mask__ = [0, 0]
+        self.__blot_points_mask__ = [0, 0]
+        self.__pip_counts__ = [0, 0]
         self.__num_checkers_board_player__ = []
         self.__num_checkers_total__ = 15
-        self.__selected_checker__ = None
-        self.__board_bar__ = []
         self.__checkers_off__ = []
         self.__is_bar_empty__ = []
-        self.__off_tray_posible_move__ = []
+        self.__undo_stack__ = []
         self.new_game_board()
 
+    @property
+    def __top_board_triangles__(self) -> list:
+        """Vista de los triángulos superiores generada desde el arreglo de puntos (12 a 1)."""
+        return [self.get_triangle_from_point(point) for point in range(12, 0, -1)]
+
+    @property
+    def __bot_board_triangles__(self) -> list:
+        """Vista de los triángulos inferiores generada desde el arreglo de puntos (13 a 24)."""
+        return [self.get_triangle_from_point(point) for point in range(13, 25)]
+
+    @property
+    def __board_bar__(self) -> list:
+        """Vista de la barra generada desde el arreglo de puntos."""
+        return [self.__points__[self.WHITE_BAR_POINT], -self.__points__[self.BLACK_BAR_POINT]]
+
+    @__board_bar__.setter
+    def __board_bar__(self, board_bar: list):
+        """Redefine la cantidad de fichas en la barra.
+
+        Args:
+            board_bar: La nueva cantidad de fichas en la barra. [fichas blancas, fichas negras]
+        """
+        self.set_point(self.WHITE_BAR_POINT, board_bar[0])
+        self.set_point(self.BLACK_BAR_POINT, -board_bar[1])
+
+    @property
+    def points(self) -> array:
+        """Arreglo de enteros con signo (26 posiciones) con el estado de las fichas."""
+        return self.__points__
+
+    @property
+    def zobrist_hash(self) -> int:
+        """Hash Zobrist (64 bits) de la posición actual."""
+        return self.__zobrist_hash__
+
+    @property
+    def home_checkers(self) -> list:
+        """Cantidad de fichas en el área de retiro.
+
+        [fichas blancas, fichas negras]
+        """
+        return self.__home_checkers__
+
+    @property
+    def outside_home_checkers(self) -> list:
+        """Cantidad de fichas fuera del área de retiro (incluida la barra).
+
+        [fichas blancas, fichas negras]
+        """
+        return self.__outside_home_checkers__
+
+    @property
+    def occupied_points_mask(self) -> list:
+        """Máscaras de 24 bits con los puntos que tienen alguna ficha (bit 0 = punto absoluto 1).
+
+        [fichas blancas, fichas negras]
+        """
+        return self.__occupied_points_mask__
+
+    @property
+    def held_points_mask(self) -> list:
+        """Máscaras de 24 bits con los puntos tomados (2 o más fichas).
+
+        [fichas blancas, fichas negras]
+        """
+        return self.__held_points_mask__
+
+    @property
+    def blot_points_mask(self) -> list:
+        """Máscaras de 24 bits con los puntos con una sola ficha (blots).
+
+        [fichas blancas, fichas negras]
+        """
+        return self.__blot_points_mask__
+
+    @property
+    def pip_counts(self) -> list:
+        """Cantidad de pips que le faltan a cada jugador para retirar todas sus fichas.
+
+        [fichas blancas, fichas negras]
+        """
+        return self.__pip_counts__
+
     @property
     def top_board_triangles(self) -> list:
         """Triángulos superiores del tablero."""
@@ -60,11 +246,6 @@ class Board:
         """Triángulos inferiores del tablero."""
         return self.__bot_board_triangles__
 
-    @property
-    def selected_checker(self) -> int | None:
-        """Índice normal de la ficha seleccionada actualmente."""
-        return self.__selected_checker__
-
     @property
     def board_bar(self) -> list:
         """Cantidad de fichas en la barra del tablero.
@@ -89,28 +270,189 @@ class Board:
         """
         return self.__checkers_off__
 
-    @property
-    def off_tray_posible_move(self) -> list:
-        """Indica si el jugador puede mover una ficha al área de retiro.
-
-        [fichas blancas, fichas negras]
-        """
-        return self.__off_tray_posible_move__
-
     def new_game_board(self):
         """Resetea el tablero de juego a un estado inicial por defecto."""
-        self.__top_board_triangles__ = [[5, 0, "●"], [0, 0, " "], [0, 0, " "], [0, 0, " "], [3, 0, "○"], [0, 0, " "],
-                                        [5, 0, "○"], [0, 0, " "], [0, 0, " "], [0, 0, " "], [0, 0, " "], [2, 0, "●"]]
-
-        self.__bot_board_triangles__ = [[5, 0, "○"], [0, 0, " "], [0, 0, " "], [0, 0, " "], [3, 0, "●"], [0, 0, " "],
-                                        [5, 0, "●"], [0, 0, " "], [0, 0, " "], [0, 0, " "], [0, 0, " "], [2, 0, "○"]]
-        self.__num_checkers_board_player__ = [15, 15]
-        self.__selected_checker__ = None
-        self.__board_bar__ = [0, 0]
-        self.__checkers_off__ = [0, 0]
+        self.load_points(self.NEW_GAME_POINTS)
         self.__is_bar_empty__ = [True, True]
         self.__can_take_out__ = [False, False]
-        self.__off_tray_posible_move__ = [False, False]
+
+    def load_points(self, points):
+        """Carga un estado completo de fichas a partir de un arreglo de puntos.
+
+        Recalcula todo el estado derivado (cantidad de fichas en el tablero,
+        fichas retiradas, estado de la barra, contadores del área de retiro,
+        máscaras de ocupación, cantidad de pips y hash Zobrist).
+
+        Args:
+            points: Una secuencia de 26 enteros con signo con el formato del arreglo de puntos.
+        """
+        # Parte de un tablero vacío y carga cada punto para reutilizar las actualizaciones incrementales
+        self.__points__ = array("b", bytes(26))
+        self.__zobrist_hash__ = 0
+        self.__home_checkers__ = [0, 0]
+        self.__outside_home_checkers__ = [0, 0]
+        self.__home_points_mask__ = [0, 0]
+        self.__occupied_points_mask__ = [0, 0]
+        self.__held_points_mask__ = [0, 0]
+        self.__blot_points_mask__ = [0, 0]
+        self.__pip_counts__ = [0, 0]
+        for point, point_value in enumerate(points):
+            self.set_point(point, point_value)
+
+        white_on_board = sum(value for value in self.__points__[1:25] if value > 0)
+        black_on_board = -sum(value for value in self.__points__[1:25] if value < 0)
+        white_on_bar = self.__points__[self.WHITE_BAR_POINT]
+        black_on_bar = -self.__points__[self.BLACK_BAR_POINT]
+        self.__num_checkers_board_player__ = [white_on_board, black_on_board]
+        self.__checkers_off__ = [self.__num_checkers_total__ - white_on_board - white_on_bar,
+                                 self.__num_checkers_total__ - black_on_board - black_on_bar]
+        self.__is_bar_empty__ = [white_on_bar == 0, black_on_bar == 0]
+        self.__undo_stack__ = []
+
+    def export_position(self) -> Position:
+        """Exporta el estado de las fichas como una posición inmutable.
+
+        Returns:
+            Position: La instantánea de la posición actual.
+        """
+        return Position(self.__points__.tobytes())
+
+    def import_position(self, position: Position):
+        """Carga el estado de las fichas a partir de una posición inmutable.
+
+        Args:
+            position: La posición a cargar.
+        """
+        self.load_points(array("b", position.to_bytes()))
+
+    def export_position_id(self, uses_white_checkers: bool = True) -> str:
+        """Exporta la posición como Position ID (la codificación de GNU Backgammon).
+
+        Se escriben, primero para el jugador con el turno y después para el oponente,
+        un 1 por cada ficha y un 0 al final de cada punto (del punto 1 al 24 del jugador y la barra);
+        los 80 bits se guardan en 10 bytes (el primer bit es el menos significativo del primer byte)
+        y se codifican en base64 sin relleno.
+
+        Args:
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas.
+        Returns:
+            str: El Position ID (14 caracteres).
+        """
+        points = self.__points__
+        runs = self.POSITION_ID_RUNS
+        white_bits = "".join([runs[points[point]] if points[point] > 0 else "0"
+                              for point in self.POSITION_ID_POINTS[True]])
+        black_bits = "".join([runs[-points[point]] if points[point] < 0 else "0"
+                              for point in self.POSITION_ID_POINTS[False]])
+        bits = white_bits + black_bits if uses_white_checkers else black_bits + white_bits
+        key = int(bits[::-1], 2)
+        return base64.b64encode(key.to_bytes(self.POSITION_ID_BITS // 8, "little"))[:14].decode("ascii")
+
+    def import_position_id(self, position_id: str, uses_white_checkers: bool = True):
+        """Carga la posición a partir de un Position ID (ver export_position_id()).
+
+        Args:
+            position_id: El Position ID (14 caracteres).
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas.
+        """
+        try:
+            if len(position_id) != 14:
+                raise ValueError
+            key = int.from_bytes(base64.b64decode(position_id + "==", validate=True), "little")
+        except (binascii.Error, ValueError, TypeError):
+            raise ValueError(f"El Position ID {position_id!r} no es válido.") from None
+        runs = format(key, f"0{self.POSITION_ID_BITS}b")[::-1].split("0")
+        if len(runs) <= 50 or "1" in "".join(runs[50:]):
+            raise ValueError(f"El Position ID {position_id!r} no tiene las fichas de los dos jugadores.")
+        points = [0] * 26
+        for player_num, player_uses_white_checkers in enumerate((uses_white_checkers, not uses_white_checkers)):
+            player_runs = runs[25 * player_num:25 * player_num + 25]
+            if sum(len(run) for run in player_runs) > self.__num_checkers_total__:
+                raise ValueError(f"El Position ID {position_id!r} tiene más de "
+                                 f"{self.__num_checkers_total__} fichas de un jugador.")
+            sign = 1 if player_uses_white_checkers else -1
+            for point, run in zip(self.POSITION_ID_POINTS[player_uses_white_checkers], player_runs):
+                if run:
+                    if points[point]:
+                        raise ValueError(f"El Position ID {position_id!r} tiene fichas de los dos jugadores "
+                                         f"en el mismo punto.")
+                    points[point] = sign * len(run)
+        self.load_points(points)
+
+    def compute_zobrist_hash(self) -> int:
+        """Calcula el hash Zobrist de la posición recorriendo todo el arreglo de puntos.
+
+        Solo se usa para verificar el hash incremental.
+
+        Returns:
+            int: El hash Zobrist (64 bits) de la posición.
+        """
+        zobrist_hash = 0
+        for point, point_value in enumerate(self.__points__):
+            zobrist_hash ^= self.ZOBRIST_KEYS[point][point_value]
+        return zobrist_hash
+
+    def set_point(self, point: int, point_value: int):
+        """Redefine el valor de un punto absoluto y actualiza en O(1)
+        el hash Zobrist, los contadores del área de retiro, las máscaras de ocupación
+        y la cantidad de pips.
+
+        Args:
+            point: El punto absoluto (0-25).
+            point_value: El nuevo valor con signo del punto.
+        """
+        points = self.__points__
+        old_point_value = points[point]
+
+        # Si el punto pasa de un color al otro (al comer una ficha o deshacerlo),
+        # primero se vacía, para que cada paso cambie las fichas de un solo color
+        if old_point_value * point_value < 0:
+            self.set_point(point, 0)
+            old_point_value = 0
+
+        zobrist_keys = self.ZOBRIST_KEYS[point]
+        self.__zobrist_hash__ ^= zobrist_keys[old_point_value] ^ zobrist_keys[point_value]
+        points[point] = point_value
+
+        # Solo se actualizan los contadores del color cuyas fichas cambian en el punto
+        if old_point_value > 0 or point_value > 0:
+            player_num = 0
+            old_checkers = old_point_value
+            new_checkers = point_value
+        else:
+            player_num = 1
+            old_checkers = -old_point_value
+            new_checkers = -point_value
+        difference = new_checkers - old_checkers
+        if not difference:
+            return
+        self.__pip_counts__[player_num] += difference * self.PIP_WEIGHTS[not player_num][point]
+
+        # Las máscaras de ocupación solo cambian si el punto tenía o queda con menos de dos fichas
+        point_bit = self.POINT_BITS[point]
+        if point_bit and (old_checkers < 2 or new_checkers < 2):
+            if new_checkers:
+                self.__occupied_points_mask__[player_num] |= point_bit
+            else:
+                self.__occupied_points_mask__[player_num] &= ~point_bit
+            if new_checkers >= 2:
+                self.__held_points_mask__[player_num] |= point_bit
+            else:
+                self.__held_points_mask__[player_num] &= ~point_bit
+            if new_checkers == 1:
+                self.__blot_points_mask__[player_num] |= point_bit
+            else:
+                self.__blot_points_mask__[player_num] &= ~point_bit
+
+        home_point_bit = self.HOME_POINT_BITS[not player_num][point]
+        if home_point_bit:
+            self.__home_checkers__[player_num] += difference
+            if not new_checkers:
+                self.__home_points_mask__[player_num] &= ~home_point_bit
+            elif not old_checkers:
+                self.__home_points_mask__[player_num] |= home_point_bit
+        else:
+            self.__outside_home_checkers__[player_num] += difference
 
     @staticmethod
     def map_normal_index(normal_index: int, uses_white_checkers: bool) -> tuple[bool, int]:
@@ -126,36 +468,50 @@ class Board:
         """
         # Si el jugador usa fichas blancas, los triángulos 1-12
         # están en la parte superior y los triángulos 13-24
-        # están en la parte inferior.
-        if uses_white_checkers:
-            if 1 <= normal_index <= 12:
-                return True, 12 - normal_index
-            if 13 <= normal_index <= 24:
-                return False, normal_index - 13
-
-        # Si el jugador usa fichas negras, los triángulos 1-12
-        # están en la parte inferior y los triángulos 13-24
-        # están en la parte superior.
-        else:
-            if 1 <= normal_index <= 12:
-                return False, 12 - normal_index
-            if 13 <= normal_index <= 24:
-                return True, normal_index - 13
+        # están en la parte inferior (al revés para las fichas negras).
+        # El mapeo está precalculado en NORMAL_TO_TRIANGLE_INDEX.
+        return Board.NORMAL_TO_TRIANGLE_INDEX[uses_white_checkers][normal_index]
+
+    @staticmethod
+    def map_normal_to_point(normal_index: int, uses_white_checkers: bool) -> int:
+        """Mapea un índice normal al punto absoluto del arreglo de puntos.
+
+        Args:
+            normal_index: El índice normal (0-25).
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            int: El punto absoluto (0-25).
+        """
+        return Board.NORMAL_TO_POINT[uses_white_checkers][normal_index]
+
+    def get_triangle_from_point(self, point: int) -> list:
+        """Genera el triángulo (en forma de lista) correspondiente a un punto absoluto.
+
+        Args:
+            point: El punto absoluto (1-24).
+        Returns:
+            list: El triángulo del tablero.
+        """
+        point_value = self.__points__[point]
+        if point_value > 0:
+            return [point_value, 0, "●"]
+        if point_value < 0:
+            return [-point_value, 0, "○"]
+        return [0, 0, " "]
 
     def get_triangle_from_normal(self, normal_index: int, uses_white_checker: bool) -> list:
         """Obiene el triángulo correspondiente a un índice normal.
 
+        El triángulo es una copia generada desde el arreglo de puntos,
+        por lo que los cambios sobre él deben aplicarse con replace_triangle().
+
         Args:
             normal_index: El índice normal (1-24).
             uses_white_checkers: Indica si el jugador usa fichas blancas.
         Returns:
             list: El triángulo del tablero.
         """
-        is_top, index = self.map_normal_index(normal_index, uses_white_checker)
-        if is_top:
-            return self.__top_board_triangles__[index]
-        else:
-            return self.__bot_board_triangles__[index]
+        return self.get_triangle_from_point(self.NORMAL_TO_POINT[uses_white_checker][normal_index])
 
     def replace_triangle(self, normal_index: int, uses_white_checkers: bool, new_triangle: list):
         """Reemplaza un triángulo en el tablero de juego.
@@ -163,13 +519,16 @@ class Board:
         Args:
             normal_index: El ínidce normal (1-24).
             uses_white_checkers: Indica si el jugador usa fichas blancas.
-            new_triangle: El nuevo triángulo que reemplazará al existente.
+            new_triangle: El nuevo triángulo que reemplazará al existente
+                        (su símbolo de selección se ignora).
         """
-        is_top, index = self.map_normal_index(normal_index, uses_white_checkers)
-        if is_top:
-            self.__top_board_triangles__[index] = new_triangle
+        point = self.NORMAL_TO_POINT[uses_white_checkers][normal_index]
+        if new_triangle[2] == "●":
+            self.set_point(point, new_triangle[0])
+        elif new_triangle[2] == "○":
+            self.set_point(point, -new_triangle[0])
         else:
-            self.__bot_board_triangles__[index] = new_triangle
+            self.set_point(point, 0)
 
     def replace_multiple_triangles(self, replacements: list, uses_white_checkers: bool):
         """Reemplaza múltiples triángulos en el tablero de juego.
@@ -192,25 +551,9 @@ class Board:
         Returns:
             True si la ficha puede ser colocada, False en caso contrario.
         """
-        # Obtiene el triángulo a verificar
-        verify_triangle = self.get_triangle_from_normal(normal_index, uses_white_checkers)
-
-        # Si el triángulo está vacío, se puede colocar la ficha
-        if verify_triangle[0] == 0:
-            return True
-
-        if verify_triangle[0] > 0:
-            # Si el triángulo tiene fichas del mismo color, se puede colocar la ficha
-            if ((uses_white_checkers and verify_triangle[2] == "●") or
-                    (not uses_white_checkers and verify_triangle[2] == "○")):
-                return True
-
-            # Si el triángulo tiene una sola ficha del color opuesto, se puede colocar la ficha
-            elif verify_triangle[0] == 1:
-                return True
-
-        # Si ninguna de las condiciones anteriores se cumple, no se puede colocar la ficha
-        return False
+        # Se puede colocar la ficha si el punto no está tomado (2 o más fichas) por el oponente
+        opponent_held_mask = self.__held_points_mask__[1 if uses_white_checkers else 0]
+        return not opponent_held_mask & self.POINT_BITS[self.NORMAL_TO_POINT[uses_white_checkers][normal_index]]
 
     def verify_movable_checker(self, normal_index: int, uses_white_checkers: bool) -> bool:
         """Verifica si una ficha en un triángulo específico puede ser movida.
@@ -221,15 +564,9 @@ class Board:
         Returns:
             True si la ficha puede ser movida, False en caso contrario.
         """
-        # Obtiene el triángulo a verificar
-        verify_triangle = self.get_triangle_from_normal(normal_index, uses_white_checkers)
-
-        # Si el triángulo tiene fichas del mismo color, se puede mover la ficha
-        if verify_triangle[0] > 0 and ((uses_white_checkers and verify_triangle[2] == "●") or (
-                not uses_white_checkers and verify_triangle[2] == "○")):
-            return True
-        # En caso contrario, no se puede mover la ficha
-        return False
+        # Si el punto tiene fichas del mismo color, se puede mover la ficha
+        sign = 1 if uses_white_checkers else -1
+        return self.__points__[self.NORMAL_TO_POINT[uses_white_checkers][normal_index]] * sign > 0
 
     def move_checker(self, normal_origin: int, normal_dest: int, uses_white_checkers: bool) -> bool:
         """Mueve una ficha de un triángulo a otro.
@@ -238,62 +575,88 @@ class Board:
         Ya debe haberse verificado previamente.
 
         Args:
-            normal_origin: El índice normal (1-24) del triángulo de origen.
+            normal_origin: El índice normal (1-24) del triángulo de origen
+                        (0 para ingresar una ficha desde la barra).
             normal_dest: El índice normal (1-24) del triángulo de destino.
             uses_white_checkers: Indica si el jugador usa fichas blancas.
         Returns:
             True si una ficha fue comida durante el movimiento, False en caso contrario.
         """
-        # Obtiene los triángulos de origen y destino
-        origin_triangle = self.get_triangle_from_normal(normal_origin, uses_white_checkers)
-        dest_triangle = self.get_triangle_from_normal(normal_dest, uses_white_checkers)
+        # Obtiene los puntos absolutos de origen y destino
+        sign = 1 if uses_white_checkers else -1
+        origin_point = self.NORMAL_TO_POINT[uses_white_checkers][normal_origin]
+        dest_point = self.NORMAL_TO_POINT[uses_white_checkers][normal_dest]
 
         # Realiza el movimiento
 
-        # Disminuye el conteo en el triángulo de origen
-        # y actualiza el símbolo si es necesario
-        origin_triangle[0] -= 1
-        if origin_triangle[0] == 0:
-            origin_triangle[2] = " "
+        # Disminuye el conteo en el punto de origen (o en la barra)
+        if normal_origin == 0:
+            self.remove_checker_from_bar(uses_white_checkers)
+        else:
+            self.set_point(origin_point, self.__points__[origin_point] - sign)
 
-        # Si el triángulo de destino tiene una sola ficha del color opuesto,
+        # Si el punto de destino tiene una sola ficha del color opuesto,
         # la ficha es comida y se actualiza la barra
         eaten_checker = False
-        if dest_triangle[0] == 1 and ((uses_white_checkers and dest_triangle[2] == "○") or
-                                      (not uses_white_checkers and dest_triangle[2] == "●")):
-            if uses_white_checkers:
-                self.add_checker_to_bar(uses_white_checkers)
-                dest_triangle = [1, 0, "●"]
-            else:
-                self.add_checker_to_bar(uses_white_checkers)
-                dest_triangle = [1, 0, "○"]
+        if self.__points__[dest_point] == -sign:
+            self.add_checker_to_bar(uses_white_checkers)
+            self.set_point(dest_point, sign)
             eaten_checker = True
 
-        # Si el triángulo de destino está vacío o tiene fichas del mismo color,
-        # simplemente se aumenta el conteo y se actualiza el símbolo si es necesario
+        # Si el punto de destino está vacío o tiene fichas del mismo color,
+        # simplemente se aumenta el conteo
         else:
-            dest_triangle[0] += 1
-            dest_triangle[2] = "●" if uses_white_checkers else "○"
+            self.set_point(dest_point, self.__points__[dest_point] + sign)
 
-        self.replace_multiple_triangles([(normal_origin, origin_triangle), (normal_dest, dest_triangle)],
-                                        uses_white_checkers)
         return eaten_checker
 
     @staticmethod
     def generate_all_dice_combinations(dice_numbers: tuple[int, ...]) -> tuple:
-        dice_numbers = tuple([num for num in dice_numbers if num > 0])
-        dice_combinations = []
-        for i in range(1, len(dice_numbers) + 1):
-            for combo in combinations(dice_numbers, i):
-                if combo not in dice_combinations:
-                    dice_combinations.append(combo)
-                if 2 <= len(combo) == len(set(combo)):
-                    dice_combinations.append(combo[::-1])
+        """Obtiene las secuencias ordenadas de dados con las que se puede mover una ficha.
 
-        return tuple(dice_combinations)
+        Las secuencias están precalculadas en el catálogo de tiradas (ver RollCatalog.DIE_SEQUENCES).
+
+        Args:
+            dice_numbers: Una tupla de números representando los dados disponibles (los 0 se ignoran).
+        Returns:
+            tuple: Las secuencias de dados, de menos a más dados.
+        """
+        return RollCatalog.die_sequences(dice_numbers)
 
     def get_possible_dice_combinations(self, selected_checker_normal: int,
                                        uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple:
+        """Obtiene las combinaciones de dados con las que puede moverse una ficha.
+
+        Los resultados se guardan en la tabla de transposición del tablero (por defecto, DICE_COMBINATIONS_TABLE).
+
+        Args:
+            selected_checker_normal: El índice normal (1-24) de la ficha.
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados (se ordenan de menor a mayor).
+        Returns:
+            tuple: Las combinaciones de dados posibles.
+        """
+        cache_key = TranspositionTable.make_key(self.__zobrist_hash__, uses_white_checkers,
+                                                dice_numbers) + (selected_checker_normal,)
+        possible_dice_combs = self.__dice_combinations_table__.get(cache_key)
+        if possible_dice_combs is None:
+            possible_dice_combs = self.calculate_possible_dice_combinations(selected_checker_normal,
+                                                                            uses_white_checkers, cache_key[2])
+            self.__dice_combinations_table__.store(cache_key, possible_dice_combs)
+        return possible_dice_combs
+
+    def calculate_possible_dice_combinations(self, selected_checker_normal: int,
+                                             uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple:
+        """Calcula (sin usar la tabla de transposición) las combinaciones de dados
+        con las que puede moverse una ficha.
+
+        Args:
+            selected_checker_normal: El índice normal (1-24) de la ficha.
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados.
+        Returns:
+            tuple: Las combinaciones de dados posibles.
+        """
         possible_dice_combs = []
         dice_combs_to_check = self.generate_all_dice_combinations(dice_numbers)
 
@@ -331,75 +694,6 @@ class Board:
             possible_moves_normal[dest_normal_index] = dice_comb
         return possible_moves_normal
 
-    def select_checker(self, normal_index: int, uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> dict:
-        """Selecciona una ficha en un triángulo específico si es movible
-        y marca los movimientos posibles en el tablero.
-
-        Args:
-            normal_index: El índice normal (1-24) del triángulo.
-            uses_white_checkers: Indica si el jugador usa fichas blancas.
-            dice_numbers: Una tupla de números representando los dados lanzados.
-        Returns:
-            bool: True si la ficha fue seleccionada, False en caso contrario.
-        """
-        # Deselecciona cualquier ficha previamente seleccionada
-        self.deselect_checker(uses_white_checkers)
-
-        # Obtiene el triángulo seleccionado
-        selected_triangle = self.get_triangle_from_normal(normal_index, uses_white_checkers)
-
-        # Verifica si la ficha puede ser movida
-        if self.verify_movable_checker(normal_index, uses_white_checkers):
-            poss_dice_combs = self.get_possible_dice_combinations(normal_index, uses_white_checkers, dice_numbers)
-            if poss_dice_combs:
-                # Actualiza el estado de la variable de ficha seleccionada
-                self.__selected_checker__ = normal_index
-                # Marca la ficha en el tablero como seleccionada
-                # (1 = Resaltador de ficha seleccionada)
-                selected_triangle[1] = 1
-                self.replace_triangle(normal_index, uses_white_checkers, selected_triangle)
-
-                poss_moves = self.map_dice_combinations_to_normal_indexes(normal_index, poss_dice_combs)
-                possible_moves_normals = list(poss_moves.keys())
-                for move_normal in possible_moves_normals:
-                    if move_normal == 25:
-                        self.__off_tray_posible_move__[0 if uses_white_checkers else 1] = True
-                        continue
-                    move_triangle = self.get_triangle_from_normal(move_normal, uses_white_checkers)
-                    # Marca el triángulo como un posible movimiento
-                    # (2 = Posible movimiento)
-                    move_triangle[1] = 2
-                    self.replace_triangle(move_normal, uses_white_checkers, move_triangle)
-                return poss_moves
-        return {}
-
-    def deselect_checker(self, uses_white_checkers: bool):
-        """Verifica si hay un triángulo seleccionado. Si es así, lo deselecciona.
-        Además, limpia todas las marcas de posibles movimientos en el tablero.
-
-        Args:
-            uses_white_checkers: Indica si el jugador usa fichas blancas.
-        """
-        # Si hay una ficha seleccionada la deselecciona
-        if self.__selected_checker__ is not None:
-            # Obtiene el triángulo seleccionado
-            selected_triangle = self.get_triangle_from_normal(self.__selected_checker__, uses_white_checkers)
-            # Si el triángulo está marcado como seleccionado para el jugador, lo deselecciona
-            if selected_triangle[1] == 1:
-                selected_triangle[1] = 0
-                self.replace_triangle(self.__selected_checker__, uses_white_checkers, selected_triangle)
-                self.__selected_checker__ = None
-
-        # Quita como posible movimiento el retiro de ficha
-        self.__off_tray_posible_move__ = [False, False]
-
-        # Limpia todas las marcas de posibles movimientos en el tablero
-        for normal_index in range(1, 25):
-            triangle_to_check = self.get_triangle_from_normal(normal_index, uses_white_checkers)
-            if triangle_to_check[1] == 2:
-                triangle_to_check[1] = 0
-                self.replace_triangle(normal_index, uses_white_checkers, triangle_to_check)
-
     def add_checker_to_bar(self, uses_white_checkers: bool):
         """Agrega una ficha a la barra del tablero.
 
@@ -407,51 +701,44 @@ class Board:
             uses_white_checkers: Indica si el jugador usa fichas blancas.
         """
         player_num = 1 if uses_white_checkers else 0
-        self.__board_bar__[player_num] += 1
+        if uses_white_checkers:
+            self.set_point(self.BLACK_BAR_POINT, self.__points__[self.BLACK_BAR_POINT] - 1)
+        else:
+            self.set_point(self.WHITE_BAR_POINT, self.__points__[self.WHITE_BAR_POINT] + 1)
         self.__num_checkers_board_player__[player_num] -= 1
         self.__is_bar_empty__[player_num] = False
 
     def remove_checker_from_bar(self, uses_white_checkers: bool):
-        """Remueve una ficha de la barra del tablero.
+        """Remueve una ficha de la barra del tablero para que vuelva a ingresar.
         Actualiza el estado de la barra si queda vacía.
 
         Args:
             uses_white_checkers: Indica si el jugador usa fichas blancas.
         """
         player_num = 0 if uses_white_checkers else 1
-        if self.__board_bar__[player_num] > 0:
-            self.__board_bar__[player_num] -= 1
-            if self.__board_bar__[player_num] == 0:
+        bar_point = self.WHITE_BAR_POINT if uses_white_checkers else self.BLACK_BAR_POINT
+        sign = 1 if uses_white_checkers else -1
+        if self.__points__[bar_point] * sign > 0:
+            self.set_point(bar_point, self.__points__[bar_point] - sign)
+            self.__num_checkers_board_player__[player_num] += 1
+            if self.__points__[bar_point] == 0:
                 self.__is_bar_empty__[player_num] = True
 
     def verify_player_can_take_out(self, uses_white_checkers: bool) -> bool:
         """Verifica si un jugador puede comenzar a retirar sus fichas del tablero.
 
+        Guarda el resultado en __can_take_out__.
+
         Args:
             uses_white_checkers: Indica si el jugador usa fichas blancas.
         Returns:
             bool: True si el jugador puede comenzar a retirar fichas, False en caso contrario.
         """
         player_num = 0 if uses_white_checkers else 1
-        # Si hay fichas en la barra, no puede retirar
-        if self.__board_bar__[player_num] > 0:
-            return False
-
-        # Verifica si todas las fichas están en el área de retiro
-        total_num_checkers = self.__num_checkers_board_player__[player_num]
-        checkers_count = 0
-        home_start = 19
-        home_end = 25
-        for normal_index in range(home_start, home_end):
-            triangle_to_check = self.get_triangle_from_normal(normal_index, uses_white_checkers)
-            count_checkers_in_triangle = triangle_to_check[0]
-            if count_checkers_in_triangle > 0 and ((uses_white_checkers and triangle_to_check[2] == "●") or
-                                                   (not uses_white_checkers and triangle_to_check[2] == "○")):
-                checkers_count += count_checkers_in_triangle
-        # Si todas las fichas están en el área de retiro, puede comenzar a retirar
-        if checkers_count == total_num_checkers:
-            return True
-        return False
+        # Puede retirar si no tiene fichas fuera del área de retiro (ni en la barra)
+        can_take_out = self.__outside_home_checkers__[player_num] == 0
+        self.__can_take_out__[player_num] = can_take_out
+        return can_take_out
 
     def take_out_checker(self, normal_index: int, uses_white_checkers: bool):
         """Retira una ficha del tablero de juego.
@@ -459,13 +746,9 @@ class Board:
         Args:
             uses_white_checkers: Indica si el jugador usa fichas blancas.
         """
-        origin_triangle = self.get_triangle_from_normal(normal_index, uses_white_checkers)
-        # Disminuye el conteo en el triángulo de origen
-        # y actualiza el símbolo si es necesario
-        origin_triangle[0] -= 1
-        if origin_triangle[0] == 0:
-            origin_triangle[2] = " "
-        self.replace_triangle(normal_index, uses_white_checkers, origin_triangle)
+        # Disminuye el conteo en el punto de origen
+        origin_point = self.NORMAL_TO_POINT[uses_white_checkers][normal_index]
+        self.set_point(origin_point, self.__points__[origin_point] - (1 if uses_white_checkers else -1))
 
         # Actualiza el conteo de fichas retiradas
         player_num = 0 if uses_white_checkers else 1
@@ -486,6 +769,26 @@ class Board:
             return True, False
         return False, False
 
+    def get_win_type(self, winner_uses_white_checkers: bool) -> int:
+        """Obtiene el tipo de victoria de un jugador que ya retiró todas sus fichas.
+
+        Args:
+            winner_uses_white_checkers: Indica si el ganador usa fichas blancas.
+        Returns:
+            int: 1 si es una victoria simple, 2 si es un gammon (el perdedor no retiró fichas)
+            y 3 si es un backgammon (además, el perdedor tiene fichas en la barra
+            o en el área de retiro del ganador).
+        """
+        loser_num = 1 if winner_uses_white_checkers else 0
+        if self.__checkers_off__[loser_num] > 0:
+            return 1
+        # El área de retiro del ganador son los índices normales 1-6 del perdedor
+        loser_bar_point = self.BLACK_BAR_POINT if winner_uses_white_checkers else self.WHITE_BAR_POINT
+        winner_home_mask = self.HOME_POINTS_MASKS[1 - loser_num]
+        if self.__points__[loser_bar_point] != 0 or self.__occupied_points_mask__[loser_num] & winner_home_mask:
+            return 3
+        return 2
+
     def get_most_advanced_checker(self, uses_white_checkers: bool) -> int:
         """Obtiene el índice normal de la ficha más avanzada en el tablero para un jugador.
 
@@ -495,11 +798,329 @@ class Board:
             int: El índice normal (1-24) de la ficha más avanzada.
             Retorna -1 si no hay fichas en el tablero.
         """
-        home_start = 19
-        home_end = 25
-        for normal_index in range(home_start, home_end):
-            triangle_to_check = self.get_triangle_from_normal(normal_index, uses_white_checkers)
-            if triangle_to_check[0] > 0 and ((uses_white_checkers and triangle_to_check[2] == "●") or
-                                             (not uses_white_checkers and triangle_to_check[2] == "○")):
-                return normal_index
-        return -1
+        home_points_mask = self.__home_points_mask__[0 if uses_white_checkers else 1]
+        if home_points_mask == 0:
+            return -1
+        # El bit activo más bajo corresponde al índice normal más bajo del área de retiro
+        return 18 + (home_points_mask & -home_points_mask).bit_length()
+
+    def get_legal_single_moves(self, uses_white_checkers: bool, dice_number: int) -> tuple:
+        """Obtiene todos los movimientos legales de una sola ficha con un solo dado.
+
+        Si el jugador tiene fichas en la barra, solo puede ingresarlas (origen 0).
+
+        Args:
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+            dice_number: El número del dado a usar.
+        Returns:
+            tuple: Los índices normales de origen (0-24) de las fichas que pueden moverse.
+        """
+        sign = 1 if uses_white_checkers else -1
+        bar_point = self.WHITE_BAR_POINT if uses_white_checkers else self.BLACK_BAR_POINT
+
+        # Si hay fichas en la barra, solo se puede ingresar desde la barra
+        if self.__points__[bar_point] != 0:
+            if self.verify_checker_placement(dice_number, uses_white_checkers):
+                return (0,)
+            return ()
+
+        # Movimientos dentro del tablero: todas las fichas a la vez con las máscaras de ocupación
+        legal_origins = self.get_normal_indexes_from_mask(self.get_movable_checkers_mask(uses_white_checkers,
+                                                                                          dice_number),
+                                                          uses_white_checkers)
+
+        # Retiro de fichas: con el número exacto o, si es la ficha más atrasada, con uno mayor
+        if not self.verify_player_can_take_out(uses_white_checkers):
+            return legal_origins
+        normal_to_point = self.NORMAL_TO_POINT[uses_white_checkers]
+        most_advanced_checker = self.get_most_advanced_checker(uses_white_checkers)
+        for normal_origin in range(max(25 - dice_number, 19), 25):
+            if self.__points__[normal_to_point[normal_origin]] * sign <= 0:
+                continue
+            if normal_origin + dice_number == 25 or normal_origin == most_advanced_checker:
+                legal_origins += (normal_origin,)
+        return legal_origins
+
+    def get_movable_checkers_mask(self, uses_white_checkers: bool, dice_number: int) -> int:
+        """Obtiene la máscara de los puntos desde los que una ficha puede moverse
+        dentro del tablero con un dado (sin contar el retiro de fichas).
+
+        Desplaza la máscara de destinos bloqueados por el oponente en lugar de recorrer los puntos.
+
+        Args:
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+            dice_number: El número del dado a usar.
+        Returns:
+            int: La máscara de ocupación (bit 0 = punto absoluto 1) de los puntos de origen.
+        """
+        player_num = 0 if uses_white_checkers else 1
+        occupied_mask = self.__occupied_points_mask__[player_num]
+        opponent_held_mask = self.__held_points_mask__[1 - player_num]
+        # Las blancas avanzan hacia los puntos absolutos más altos y las negras hacia los más bajos
+        if uses_white_checkers:
+            return occupied_mask & ~(opponent_held_mask >> dice_number) & (self.ALL_POINTS_MASK >> dice_number)
+        return occupied_mask & ~(opponent_held_mask << dice_number) & (self.ALL_POINTS_MASK << dice_number)
+
+    @staticmethod
+    def get_normal_indexes_from_mask(points_mask: int, uses_white_checkers: bool) -> tuple:
+        """Convierte una máscara de ocupación en los índices normales de sus puntos activos.
+
+        Args:
+            points_mask: La máscara de ocupación (bit 0 = punto absoluto 1).
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            tuple: Los índices normales (1-24), ordenados de menor a mayor.
+        """
+        points = []
+        while points_mask:
+            lowest_bit = points_mask & -points_mask
+            points.append(lowest_bit.bit_length())
+            points_mask ^= lowest_bit
+        if uses_white_checkers:
+            return tuple(points)
+        return tuple(25 - point for point in reversed(points))
+
+    def get_prime_length(self, uses_white_checkers: bool) -> int:
+        """Obtiene la longitud del prime más largo (puntos tomados consecutivos) de un jugador.
+
+        Args:
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            int: La cantidad de puntos tomados consecutivos del prime más largo (0 si no hay puntos tomados).
+        """
+        held_mask = self.__held_points_mask__[0 if uses_white_checkers else 1]
+        prime_length = 0
+        # Cada iteración acorta en uno todas las secuencias de bits consecutivos
+        while held_mask:
+            held_mask &= held_mask >> 1
+            prime_length += 1
+        return prime_length
+
+    def count_exposed_blots(self, uses_white_checkers: bool) -> int:
+        """Cuenta los blots de un jugador que el oponente puede comer con un tiro directo (1 a 6 puntos).
+
+        Solo considera la distancia a las fichas del oponente (incluidas las de la barra),
+        sin verificar los puntos intermedios ni los tiros indirectos.
+
+        Args:
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            int: La cantidad de blots expuestos.
+        """
+        player_num = 0 if uses_white_checkers else 1
+        blot_mask = self.__blot_points_mask__[player_num]
+        attackers_mask = self.__occupied_points_mask__[1 - player_num]
+        exposed_mask = 0
+        # Las fichas del oponente en la barra ingresan en el área de retiro del jugador
+        if self.__points__[self.BLACK_BAR_POINT if uses_white_checkers else self.WHITE_BAR_POINT] != 0:
+            exposed_mask = self.HOME_POINTS_MASKS[player_num]
+        for dice_number in range(1, 7):
+            # El oponente avanza en la dirección contraria a la del jugador
+            if uses_white_checkers:
+                exposed_mask |= attackers_mask >> dice_number
+            else:
+                exposed_mask |= attackers_mask << dice_number
+        return (blot_mask & exposed_mask).bit_count()
+
+    def apply_single_move(self, normal_origin: int, dice_number: int, uses_white_checkers: bool) -> bool:
+        """Aplica el movimiento de una ficha con un solo dado (ingreso, movimiento o retiro).
+
+        No realiza ninguna verificación de validez del movimiento.
+
+        Args:
+            normal_origin: El índice normal (0-24) de origen (0 = barra).
+            dice_number: El número del dado usado.
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            True si una ficha fue comida durante el movimiento, False en caso contrario.
+        """
+        normal_dest = normal_origin + dice_number
+        if normal_dest >= 25:
+            self.take_out_checker(normal_origin, uses_white_checkers)
+            return False
+        return self.move_checker(normal_origin, normal_dest, uses_white_checkers)
+
+    def apply_play(self, play: tuple, uses_white_checkers: bool):
+        """Aplica una jugada completa (secuencia de movimientos simples).
+
+        Args:
+            play: Una tupla de movimientos (índice normal de origen, número de dado).
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        """
+        for normal_origin, dice_number in play:
+            self.apply_single_move(normal_origin, dice_number, uses_white_checkers)
+
+    def make_move(self, normal_origin: int, dice_number: int, uses_white_checkers: bool) -> bool:
+        """Aplica un movimiento simple guardando un registro para poder deshacerlo con unmake_move().
+
+        No realiza ninguna verificación de validez del movimiento.
+
+        Args:
+            normal_origin: El índice normal (0-24) de origen (0 = barra).
+            dice_number: El número del dado usado.
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            True si una ficha fue comida durante el movimiento, False en caso contrario.
+        """
+        eaten_checker = self.apply_single_move(normal_origin, dice_number, uses_white_checkers)
+        self.__undo_stack__.append((normal_origin, dice_number, uses_white_checkers, eaten_checker))
+        return eaten_checker
+
+    def unmake_move(self):
+        """Deshace el último movimiento hecho con make_move().
+
+        Restaura exactamente los puntos, la barra, las fichas retiradas,
+        la cantidad de fichas en el tablero y la ficha comida (si la hubo).
+        """
+        normal_origin, dice_number, uses_white_checkers, eaten_checker = self.__undo_stack__.pop()
+        sign = 1 if uses_white_checkers else -1
+        player_num = 0 if uses_white_checkers else 1
+        normal_to_point = self.NORMAL_TO_POINT[uses_white_checkers]
+        normal_dest = normal_origin + dice_number
+
+        # Deshace la llegada al destino (o el retiro de la ficha)
+        if normal_dest >= 25:
+            self.__checkers_off__[player_num] -= 1
+            self.__num_checkers_board_player__[player_num] += 1
+        else:
+            dest_point = normal_to_point[normal_dest]
+            if eaten_checker:
+                # Devuelve la ficha comida desde la barra del oponente
+                opponent_num = 1 - player_num
+                opponent_bar_point = self.BLACK_BAR_POINT if uses_white_checkers else self.WHITE_BAR_POINT
+                self.set_point(dest_point, -sign)
+                self.set_point(opponent_bar_point, self.__points__[opponent_bar_point] + sign)
+                self.__num_checkers_board_player__[opponent_num] += 1
+                self.__is_bar_empty__[opponent_num] = self.__points__[opponent_bar_point] == 0
+            else:
+                self.set_point(dest_point, self.__points__[dest_point] - sign)
+
+        # Devuelve la ficha al origen (o a la barra)
+        origin_point = normal_to_point[normal_origin]
+        self.set_point(origin_point, self.__points__[origin_point] + sign)
+        if normal_origin == 0:
+            self.__num_checkers_board_player__[player_num] -= 1
+            self.__is_bar_empty__[player_num] = False
+
+    def make_play(self, play: tuple, uses_white_checkers: bool):
+        """Aplica una jugada completa con make_move(), para poder deshacerla con unmake_play().
+
+        Args:
+            play: Una tupla de movimientos (índice normal de origen, número de dado).
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        """
+        for normal_origin, dice_number in play:
+            self.make_move(normal_origin, dice_number, uses_white_checkers)
+
+    def unmake_play(self, play: tuple):
+        """Deshace una jugada completa hecha con make_play().
+
+        Args:
+            play: La jugada a deshacer (debe ser la última hecha).
+        """
+        for _ in play:
+            self.unmake_move()
+
+    def generate_legal_plays(self, uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple:
+        """Genera todas las jugadas completas legales para una tirada de dados.
+
+        Cada jugada es una tupla de movimientos (índice normal de origen, número de dado),
+        en donde el origen 0 representa la barra y un destino mayor a 24 representa un retiro.
+        Las jugadas que llevan a la misma posición final se consideran una sola.
+        Se aplica la regla de uso máximo de dados: solo se devuelven las jugadas que usan
+        la mayor cantidad de dados posible y, si solo se puede usar uno de dos dados distintos,
+        las que usan el mayor.
+        Los resultados se guardan en la tabla de transposición del tablero (por defecto, LEGAL_PLAYS_TABLE).
+
+        Args:
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados disponibles (los 0 se ignoran).
+        Returns:
+            tuple: Las jugadas legales. Si no hay ningún movimiento posible,
+            devuelve una única jugada vacía.
+        """
+        cache_key = TranspositionTable.make_key(self.__zobrist_hash__, uses_white_checkers, dice_numbers)
+        legal_plays = self.__legal_plays_table__.get(cache_key)
+        if legal_plays is None:
+            legal_plays = self.calculate_legal_plays(uses_white_checkers, cache_key[2])
+            self.__legal_plays_table__.store(cache_key, legal_plays)
+        return legal_plays
+
+    def calculate_legal_plays(self, uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple:
+        """Calcula (sin usar la tabla de transposición) todas las jugadas completas legales
+        para una tirada de dados. Ver generate_legal_plays().
+
+        Args:
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados disponibles (los 0 se ignoran).
+        Returns:
+            tuple: Las jugadas legales.
+        """
+        dice_numbers = tuple(sorted((num for num in dice_numbers if num > 0), reverse=True))
+        final_plays = {}
+        visited_states = set()
+
+        # Se busca sobre una única copia del tablero, haciendo y deshaciendo movimientos
+        board = self.copy()
+
+        def search_plays(remaining_dice: tuple, play: tuple):
+            # Evita explorar dos veces el mismo estado con los mismos dados restantes
+            state_key = (board.__points__.tobytes(), remaining_dice)
+            if state_key in visited_states:
+                return
+            visited_states.add(state_key)
+
+            any_move = False
+            for i, dice_number in enumerate(remaining_dice):
+                # Con dados repetidos basta con probar el primero
+                if i > 0 and dice_number == remaining_dice[i - 1]:
+                    continue
+                next_dice = remaining_dice[:i] + remaining_dice[i + 1:]
+                for normal_origin in board.get_legal_single_moves(uses_white_checkers, dice_number):
+                    any_move = True
+                    board.make_move(normal_origin, dice_number, uses_white_checkers)
+                    search_plays(next_dice, play + ((normal_origin, dice_number),))
+                    board.unmake_move()
+
+            # Se conserva, para cada posición final, la jugada que usa más dados
+            final_key = board.__points__.tobytes()
+            if not any_move and len(play) >= len(final_plays.get(final_key, play)):
+                final_plays[final_key] = play
+
+        search_plays(dice_numbers, ())
+
+        # Regla de uso máximo de dados
+        max_dice_used = max(len(play) for play in final_plays.values())
+        legal_plays = [play for play in final_plays.values() if len(play) == max_dice_used]
+        if max_dice_used == 1 and len(set(dice_numbers)) > 1:
+            max_dice_number = max(play[0][1] for play in legal_plays)
+            legal_plays = [play for play in legal_plays if play[0][1] == max_dice_number]
+        return tuple(legal_plays)
+
+    def copy(self) -> "Board":
+        """Crea una copia independiente del tablero.
+
+        El estado de las fichas se copia como un único buffer (el arreglo de puntos).
+
+        Returns:
+            Board: La copia del tablero.
+        """
+        board_copy = Board.__new__(Board)
+        board_copy.__points__ = self.__points__[:]
+        board_copy.__zobrist_hash__ = self.__zobrist_hash__
+        board_copy.__home_checkers__ = self.__home_checkers__.copy()
+        board_copy.__outside_home_checkers__ = self.__outside_home_checkers__.copy()
+        board_copy.__home_points_mask__ = self.__home_points_mask__.copy()
+        board_copy.__occupied_points_mask__ = self.__occupied_points_mask__.copy()
+        board_copy.__held_points_mask__ = self.__held_points_mask__.copy()
+        board_copy.__blot_points_mask__ = self.__blot_points_mask__.copy()
+        board_copy.__pip_counts__ = self.__pip_counts__.copy()
+        board_copy.__num_checkers_board_player__ = self.__num_checkers_board_player__.copy()
+        board_copy.__num_checkers_total__ = self.__num_checkers_total__
+        board_copy.__checkers_off__ = self.__checkers_off__.copy()
+        board_copy.__is_bar_empty__ = self.__is_bar_empty__.copy()
+        board_copy.__can_take_out__ = self.__can_take_out__.copy()
+        board_copy.__undo_stack__ = self.__undo_stack__.copy()
+        board_copy.__legal_plays_table__ = self.__legal_plays_table__
+        board_copy.__dice_combinations_table__ = self.__dice_combinations_table__
+        return board_copy
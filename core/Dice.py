@@ -1,4 +1,9 @@
 import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Solo para las anotaciones: DiceSource usa NumPy, que no hace falta para tirar con el módulo random
+    from core.DiceSource import DiceSource
 
 
 class Dice:
@@ -6,11 +11,14 @@ class Dice:
 
     Permite simular el lanzamiento de un dado, almacenar su valor numérico
     y obtener una representación ASCII del mismo.
+    Los valores se toman de una fuente de dados inyectable (ver DiceSource)
+    o, si no se indica, del módulo random.
 
     Attributes:
         DICES_STR: Un diccionario de clase (estático) que mapea el valor numérico de un dado (0-6) a su representación ASCII como una tupla de cadenas.
         __dice_number__: Un entero que representa el valor numérico actual del dado.
         __dice_str__: Una tupla de cadenas de texto que forma una representación ASCII del valor actual del dado.
+        __dice_source__: La fuente de dados de la que se toman los lanzamientos (None = módulo random).
     """
     DICES_STR = {
         0: ("┌─────────┐",
@@ -50,14 +58,16 @@ class Dice:
             "└─────────┘")
     }
 
-    def __init__(self, dice_number=0):
+    def __init__(self, dice_number=0, dice_source: "DiceSource | None" = None):
         """Inicializa una instancia del dado.
 
         Args:
             dice_number: El valor inicial del dado.
+            dice_source: La fuente de dados de la que se toman los lanzamientos (None = módulo random).
         """
         self.__dice_number__ = dice_number
         self.__dice_str__ = self.DICES_STR[self.__dice_number__]
+        self.__dice_source__ = dice_source
 
     @property
     def dice_number(self) -> int:
@@ -75,7 +85,10 @@ class Dice:
         Asigna un nuevo valor aleatorio (entre 1 y 6) al dado y actualiza
         su representación ASCII.
         """
-        self.__dice_number__ = random.randint(1, 6)
+        if self.__dice_source__ is not None:
+            self.__dice_number__ = self.__dice_source__.next_die()
+        else:
+            self.__dice_number__ = random.randint(1, 6)
         self.__dice_str__ = self.DICES_STR[self.__dice_number__]
 
     def reset_dice(self):
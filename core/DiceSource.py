@@ -0,0 +1,112 @@
+import numpy as np
+
+
+class DiceSource:
+    """Fuente de dados inyectable que tira los dados por bloques con un generador de NumPy.
+
+    En lugar de llamar al generador en cada tirada, tira por adelantado un bloque grande de dados
+    (una sola llamada vectorizada) y los entrega de a uno, sin crear objetos por tirada.
+    Cada fuente tiene su propio flujo de números aleatorios: las fuentes creadas con spawn()
+    o for_game() son independientes entre sí, por lo que cada partida o proceso puede tener
+    la suya y los resultados son reproducibles con la misma semilla.
+
+    Attributes:
+        __rng__: El generador de números aleatorios (numpy.random.Generator).
+        __block_size__: La cantidad de dados de cada bloque.
+        __block__: Los dados del bloque actual.
+        __index__: La posición del próximo dado a entregar en el bloque actual.
+        DEFAULT_BLOCK_SIZE: La cantidad de dados por bloque por defecto.
+    """
+    DEFAULT_BLOCK_SIZE = 4096
+
+    def __init__(self, seed=None, block_size: int = DEFAULT_BLOCK_SIZE):
+        """Inicializa una instancia de la fuente de dados.
+
+        Args:
+            seed: La semilla: un entero, un numpy.random.SeedSequence, un numpy.random.Generator
+                  o None (semilla tomada del sistema operativo).
+            block_size: La cantidad de dados de cada bloque.
+        """
+        if block_size < 1:
+            raise ValueError("El tamaño del bloque debe ser al menos 1.")
+        self.__rng__ = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        self.__block_size__ = block_size
+        self.__block__ = []
+        self.__index__ = 0
+
+    @staticmethod
+    def new_seed() -> int:
+        """Obtiene una semilla nueva tomada del sistema operativo.
+
+        Returns:
+            int: La semilla (128 bits).
+        """
+        return np.random.SeedSequence().entropy
+
+    @staticmethod
+    def game_seed(seed: int, game_num: int) -> int:
+        """Obtiene la semilla independiente de una partida a partir de una semilla común.
+
+        Se deriva del hijo número game_num de SeedSequence(seed).spawn(), sin tener que crear los anteriores,
+        y es un entero para poder guardarla junto al registro de la partida (ver GameRecord).
+
+        Args:
+            seed: La semilla común (ej.: la de un torneo).
+            game_num: El número de la partida.
+        Returns:
+            int: La semilla de la partida (128 bits).
+        """
+        words = np.random.SeedSequence(seed, spawn_key=(game_num,)).generate_state(4, np.uint32)
+        return sum(int(word) << (32 * word_num) for word_num, word in enumerate(words))
+
+    @classmethod
+    def for_game(cls, seed: int, game_num: int, block_size: int = DEFAULT_BLOCK_SIZE) -> "DiceSource":
+        """Crea la fuente de dados independiente de una partida (ver game_seed()).
+
+        Args:
+            seed: La semilla común (ej.: la de un torneo).
+            game_num: El número de la partida.
+            block_size: La cantidad de dados de cada bloque.
+        Returns:
+            DiceSource: La fuente de dados de la partida.
+        """
+        return cls(cls.game_seed(seed, game_num), block_size)
+
+    def spawn(self, num_sources: int) -> list["DiceSource"]:
+        """Crea fuentes de dados independientes derivadas de esta (ej.: una por proceso).
+
+        Args:
+            num_sources: La cantidad de fuentes a crear.
+        Returns:
+            list: Las fuentes de dados.
+        """
+        return [DiceSource(rng, self.__block_size__) for rng in self.__rng__.spawn(num_sources)]
+
+    def refill(self):
+        """Tira un bloque nuevo de dados."""
+        self.__block__ = self.__rng__.integers(1, 7, size=self.__block_size__, dtype=np.int8).tolist()
+        self.__index__ = 0
+
+    def next_die(self) -> int:
+        """Entrega el próximo dado.
+
+        Returns:
+            int: El valor del dado (1-6).
+        """
+        if self.__index__ >= len(self.__block__):
+            self.refill()
+        dice_number = self.__block__[self.__index__]
+        self.__index__ += 1
+        return dice_number
+
+    def next_pair(self) -> tuple[int, int]:
+        """Entrega los dos dados de una tirada.
+
+        Returns:
+            tuple: Los dos dados (1-6), en el orden en que salieron.
+        """
+        index = self.__index__
+        if index + 2 > len(self.__block__):
+            return self.next_die(), self.next_die()
+        self.__index__ = index + 2
+        return self.__block__[index], self.__block__[index + 1]
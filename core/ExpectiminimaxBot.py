@@ -0,0 +1,252 @@
+from time import perf_counter
+
+from core.Board import Board
+from core.RaceEvaluator import RaceEvaluator
+from core.RollCatalog import RollCatalog
+
+
+class ExpectiminimaxBot:
+    """Representa un jugador automático que elige su jugada con una búsqueda expectiminimax.
+
+    Busca de 1 a max_depth jugadas (plies) sobre las 21 tiradas distintas de dados,
+    con poda alfa-beta en los nodos de decisión y poda Star1/Star2 en los nodos de azar:
+    antes de buscar cada tirada completa se sondea la primera jugada del oponente
+    para acotar el valor de la tirada (Star2), y durante la búsqueda se corta
+    cuando las cotas de las tiradas restantes ya no pueden cambiar el resultado (Star1).
+
+    La búsqueda es por profundización iterativa: si se agota el presupuesto de nodos
+    o de tiempo, se devuelve la mejor jugada de la última profundidad completa.
+
+    Si tiene un libro de aperturas (ver OpeningBook), lo consulta antes de buscar
+    y juega la jugada del libro cuando la posición está en él.
+
+    El evaluador es intercambiable: una función (tablero, usa fichas blancas) -> probabilidad (0-1)
+    de que gane el jugador que tiene el turno (ej.: RaceEvaluator.win_probability).
+
+    Attributes:
+        __evaluator__: La función de evaluación de posiciones.
+        __max_depth__: La cantidad máxima de jugadas (plies) a buscar.
+        __max_nodes__: La cantidad máxima de nodos por búsqueda (None = sin límite).
+        __max_seconds__: El tiempo máximo por búsqueda en segundos (None = sin límite).
+        __nodes__: La cantidad de nodos visitados en la búsqueda actual.
+        __chance_rolls__: La cantidad de tiradas consideradas en los nodos de azar.
+        __pruned_rolls__: La cantidad de tiradas que no hizo falta buscar por la poda.
+        __deadline__: El instante (perf_counter) en el que se agota el tiempo de la búsqueda.
+        __budget_exceeded__: Indica si se agotó el presupuesto durante la búsqueda actual.
+        __last_search_stats__: Las estadísticas de la última búsqueda.
+        __opening_book__: El libro de aperturas consultado antes de buscar (None = sin libro).
+        ROLLS: Las 21 tiradas distintas con su probabilidad ((dados jugables), probabilidad), del catálogo de tiradas.
+        MIN_VALUE: El valor mínimo de una posición (derrota segura).
+        MAX_VALUE: El valor máximo de una posición (victoria segura).
+    """
+    ROLLS = RollCatalog.ROLLS
+    MIN_VALUE = 0.0
+    MAX_VALUE = 1.0
+
+    def __init__(self, evaluator=RaceEvaluator.win_probability, max_depth: int = 2,
+                 max_nodes: int | None = None, max_seconds: float | None = None, opening_book=None):
+        """Inicializa una instancia del jugador automático.
+
+        Args:
+            evaluator: La función (tablero, usa fichas blancas) -> probabilidad de ganar del jugador con el turno.
+            max_depth: La cantidad máxima de jugadas (plies) a buscar (1 a 3).
+            max_nodes: La cantidad máxima de nodos por búsqueda (None = sin límite).
+            max_seconds: El tiempo máximo por búsqueda en segundos (None = sin límite).
+            opening_book: El libro de aperturas (OpeningBook) a consultar antes de buscar (None = sin libro).
+        """
+        if max_depth < 1:
+            raise ValueError("La profundidad de búsqueda debe ser al menos 1.")
+        self.__evaluator__ = evaluator
+        self.__max_depth__ = max_depth
+        self.__max_nodes__ = max_nodes
+        self.__max_seconds__ = max_seconds
+        self.__nodes__ = 0
+        self.__chance_rolls__ = 0
+        self.__pruned_rolls__ = 0
+        self.__deadline__ = None
+        self.__budget_exceeded__ = False
+        self.__last_search_stats__ = {}
+        self.__opening_book__ = opening_book
+
+    @property
+    def last_search_stats(self) -> dict:
+        """Estadísticas de la última búsqueda.
+
+        Claves: "depth" (profundidad completa), "nodes", "seconds", "nodes_per_second", "pruning_ratio"
+        (fracción de las tiradas de los nodos de azar que no hizo falta buscar) y "book"
+        (si la jugada salió del libro de aperturas, sin búsqueda).
+        """
+        return self.__last_search_stats__
+
+    def choose_play(self, board: Board, uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple:
+        """Elige la jugada a realizar.
+
+        Args:
+            board: El tablero del juego (no se modifica).
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados lanzados.
+        Returns:
+            tuple: La jugada elegida (con el formato de Board.generate_legal_plays()).
+        """
+        search_board = board.copy()
+        plays = list(search_board.generate_legal_plays(uses_white_checkers, dice_numbers))
+        self.__nodes__ = 0
+        self.__chance_rolls__ = 0
+        self.__pruned_rolls__ = 0
+        self.__budget_exceeded__ = False
+        start = perf_counter()
+        self.__deadline__ = start + self.__max_seconds__ if self.__max_seconds__ is not None else None
+
+        best_play = plays[0]
+        completed_depth = 0
+        book_play = (self.__opening_book__.get_play(search_board, uses_white_checkers, dice_numbers)
+                     if self.__opening_book__ is not None and len(plays) > 1 else None)
+        if book_play in plays:
+            best_play = book_play
+        elif len(plays) > 1:
+            for depth in range(1, self.__max_depth__ + 1):
+                values = {}
+                alpha = self.MIN_VALUE
+                for play in plays:
+                    value = self.play_value(search_board, uses_white_checkers, play, depth,
+                                            alpha, self.MAX_VALUE)
+                    if self.__budget_exceeded__:
+                        break
+                    values[play] = value
+                    alpha = max(alpha, value)
+                if self.__budget_exceeded__:
+                    break
+                # Ordena las jugadas de la mejor a la peor para podar más en la siguiente profundidad
+                plays.sort(key=values.__getitem__, reverse=True)
+                best_play = plays[0]
+                completed_depth = depth
+
+        seconds = perf_counter() - start
+        self.__last_search_stats__ = {
+            "depth": completed_depth,
+            "nodes": self.__nodes__,
+            "seconds": seconds,
+            "nodes_per_second": self.__nodes__ / seconds if seconds > 0 else 0.0,
+            "pruning_ratio": self.__pruned_rolls__ / self.__chance_rolls__ if self.__chance_rolls__ else 0.0,
+            "book": book_play in plays,
+        }
+        return best_play
+
+    def check_budget(self) -> bool:
+        """Cuenta un nodo y verifica si se agotó el presupuesto de nodos o de tiempo.
+
+        Returns:
+            bool: True si se agotó el presupuesto.
+        """
+        self.__nodes__ += 1
+        if self.__max_nodes__ is not None and self.__nodes__ > self.__max_nodes__:
+            self.__budget_exceeded__ = True
+        elif self.__deadline__ is not None and self.__nodes__ % 256 == 0 and perf_counter() > self.__deadline__:
+            self.__budget_exceeded__ = True
+        return self.__budget_exceeded__
+
+    def play_value(self, board: Board, uses_white_checkers: bool, play: tuple, depth: int,
+                   alpha: float, beta: float) -> float:
+        """Calcula el valor de una jugada para el jugador que la realiza.
+
+        Args:
+            board: El tablero de búsqueda (se restaura al terminar).
+            uses_white_checkers: Indica si el jugador que realiza la jugada usa fichas blancas.
+            play: La jugada a evaluar.
+            depth: La cantidad de jugadas (plies) que quedan por buscar, incluida esta.
+            alpha: La cota inferior de la ventana de búsqueda.
+            beta: La cota superior de la ventana de búsqueda.
+        Returns:
+            float: La probabilidad de ganar del jugador que realiza la jugada.
+        """
+        if self.check_budget():
+            return self.MIN_VALUE
+        board.make_play(play, uses_white_checkers)
+        if board.checkers_off[0 if uses_white_checkers else 1] >= board.__num_checkers_total__:
+            value = self.MAX_VALUE
+        elif depth == 1:
+            value = self.MAX_VALUE - self.__evaluator__(board, not uses_white_checkers)
+        else:
+            value = self.chance_value(board, uses_white_checkers, depth - 1, alpha, beta)
+        board.unmake_play(play)
+        return value
+
+    def decision_value(self, board: Board, uses_white_checkers: bool, dice_numbers: tuple[int, ...],
+                       depth: int, alpha: float, beta: float) -> float:
+        """Calcula el valor de un nodo de decisión (el jugador con el turno elige su mejor jugada).
+
+        Args:
+            board: El tablero de búsqueda.
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas.
+            dice_numbers: Los dados del jugador con el turno.
+            depth: La cantidad de jugadas (plies) que quedan por buscar, incluida esta.
+            alpha: La cota inferior de la ventana de búsqueda.
+            beta: La cota superior de la ventana de búsqueda.
+        Returns:
+            float: La probabilidad de ganar del jugador con el turno
+            (una cota si el valor queda fuera de la ventana).
+        """
+        best_value = self.MIN_VALUE
+        for play in board.generate_legal_plays(uses_white_checkers, dice_numbers):
+            value = self.play_value(board, uses_white_checkers, play, depth, max(alpha, best_value), beta)
+            if self.__budget_exceeded__:
+                break
+            if value > best_value:
+                best_value = value
+                if best_value >= beta:
+                    break
+        return best_value
+
+    def chance_value(self, board: Board, uses_white_checkers: bool, depth: int, alpha: float, beta: float) -> float:
+        """Calcula el valor de un nodo de azar (el oponente tira los dados) con poda Star1/Star2.
+
+        Args:
+            board: El tablero de búsqueda.
+            uses_white_checkers: Indica si el jugador que acaba de mover usa fichas blancas.
+            depth: La cantidad de jugadas (plies) que quedan por buscar.
+            alpha: La cota inferior de la ventana de búsqueda.
+            beta: La cota superior de la ventana de búsqueda.
+        Returns:
+            float: La probabilidad de ganar del jugador que acaba de mover
+            (una cota si el valor queda fuera de la ventana).
+        """
+        opponent_uses_white = not uses_white_checkers
+        self.__chance_rolls__ += len(self.ROLLS)
+
+        # Star2: sondea la primera jugada del oponente en cada tirada.
+        # El oponente puede jugar al menos así de bien, por lo que se obtiene una cota superior
+        upper_bounds = []
+        for dice_numbers, _ in self.ROLLS:
+            first_play = board.generate_legal_plays(opponent_uses_white, dice_numbers)[0]
+            probe_value = self.play_value(board, opponent_uses_white, first_play, depth,
+                                          self.MIN_VALUE, self.MAX_VALUE)
+            if self.__budget_exceeded__:
+                return self.MIN_VALUE
+            upper_bounds.append(self.MAX_VALUE - probe_value)
+        remaining_upper = sum(weight * upper_bound for (_, weight), upper_bound in zip(self.ROLLS, upper_bounds))
+        if remaining_upper <= alpha:
+            self.__pruned_rolls__ += len(self.ROLLS)
+            return remaining_upper
+
+        # Star1: busca cada tirada con una ventana derivada de las cotas de las tiradas restantes
+        value_sum = 0.0
+        remaining_weight = 1.0
+        for roll_num, ((dice_numbers, weight), upper_bound) in enumerate(zip(self.ROLLS, upper_bounds)):
+            remaining_upper -= weight * upper_bound
+            remaining_weight -= weight
+            child_alpha = max((alpha - value_sum - remaining_upper) / weight, self.MIN_VALUE)
+            child_beta = min((beta - value_sum - remaining_weight * self.MIN_VALUE) / weight, upper_bound)
+            value = self.MAX_VALUE - self.decision_value(board, opponent_uses_white, dice_numbers, depth,
+                                                         self.MAX_VALUE - child_beta,
+                                                         self.MAX_VALUE - child_alpha)
+            if self.__budget_exceeded__:
+                return self.MIN_VALUE
+            value_sum += weight * min(value, upper_bound)
+            pruned_rolls = len(self.ROLLS) - roll_num - 1
+            if value_sum + remaining_upper <= alpha:
+                self.__pruned_rolls__ += pruned_rolls
+                return value_sum + remaining_upper
+            if value_sum + remaining_weight * self.MIN_VALUE >= beta:
+                self.__pruned_rolls__ += pruned_rolls
+                return value_sum + remaining_weight * self.MIN_VALUE
+        return value_sum
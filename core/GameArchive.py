@@ -0,0 +1,229 @@
+import os
+import struct
+
+from core.Board import Board
+from core.GameRecord import GameRecord
+
+
+class GameArchive:
+    """Archivo binario compacto de registros de partidas (GameRecord), de solo agregado.
+
+    Cada movimiento ocupa 2 bytes (índice normal de origen; número de dado y si comió una ficha),
+    detrás de un encabezado corto por partida (semilla, jugadores y resultado), por lo que se pueden
+    guardar millones de partidas de autojuego. Una instancia agrega partidas al final del archivo
+    de a una (write()) y read() las lee de a una con un generador, sin cargar el archivo completo.
+
+    Las jugadas se repiten con Board.move_checker() y Board.take_out_checker() (ver replay()),
+    que también calculan las marcas de ficha comida que se guardan en el archivo.
+
+    Formato del archivo:
+        Encabezado: MAGIC, versión (uint16).
+        Partidas: encabezado de la partida (GAME_HEADER): marcas (FLAG_*), semilla (16 bytes,
+        little-endian), largo en bytes de cada nombre (uint8), cantidad de jugadas (uint16)
+        y largo del cuerpo (uint32). Cuerpo: los nombres (UTF-8) y, por cada jugada,
+        la cantidad de movimientos (1 byte) y los movimientos (origen, dado | HIT_FLAG).
+
+    Attributes:
+        __path__: La ruta del archivo.
+        __file__: El archivo abierto para agregar partidas.
+        __board__: El tablero de trabajo en el que se repiten las partidas a guardar.
+        MAGIC: Los bytes que identifican el formato del archivo.
+        VERSION: La versión del formato del archivo.
+        HEADER: El formato (struct) del encabezado del archivo.
+        GAME_HEADER: El formato (struct) del encabezado de cada partida.
+        FLAG_HAS_SEED: Marca de partida con semilla conocida.
+        FLAG_STARTS_WHITE: Marca de partida empezada por el jugador de fichas blancas.
+        FLAG_FINISHED: Marca de partida terminada.
+        FLAG_WHITE_WON: Marca de partida ganada por el jugador de fichas blancas.
+        WIN_TYPE_SHIFT: La posición (en bits) del tipo de victoria dentro de las marcas.
+        HIT_FLAG: El bit del byte del dado que indica que el movimiento comió una ficha.
+        SEED_BYTES: La cantidad de bytes de la semilla.
+    """
+    MAGIC = b"BGGA"
+    VERSION = 1
+    HEADER = struct.Struct("<4sH")
+    GAME_HEADER = struct.Struct("<B16sBBHI")
+    FLAG_HAS_SEED = 0x01
+    FLAG_STARTS_WHITE = 0x02
+    FLAG_FINISHED = 0x04
+    FLAG_WHITE_WON = 0x08
+    WIN_TYPE_SHIFT = 4
+    HIT_FLAG = 0x80
+    SEED_BYTES = 16
+
+    def __init__(self, path: str):
+        """Abre un archivo de partidas para agregar partidas al final (lo crea si no existe).
+
+        Args:
+            path: La ruta del archivo.
+        """
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as archive_file:
+                self.check_header(archive_file.read(self.HEADER.size))
+        self.__path__ = path
+        self.__file__ = open(path, "ab")
+        if self.__file__.tell() == 0:
+            self.__file__.write(self.HEADER.pack(self.MAGIC, self.VERSION))
+        self.__board__ = Board()
+
+    @property
+    def path(self) -> str:
+        """La ruta del archivo."""
+        return self.__path__
+
+    def __enter__(self) -> "GameArchive":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @classmethod
+    def check_header(cls, data: bytes):
+        """Verifica el encabezado de un archivo de partidas.
+
+        Args:
+            data: Los primeros bytes del archivo.
+        """
+        if len(data) != cls.HEADER.size or cls.HEADER.unpack(data) != (cls.MAGIC, cls.VERSION):
+            raise ValueError("El archivo no es un archivo de partidas válido.")
+
+    @staticmethod
+    def replay(record: GameRecord, board: Board | None = None) -> tuple[Board, tuple]:
+        """Repite las jugadas de una partida con Board.move_checker() y Board.take_out_checker().
+
+        No valida las jugadas (ver GameRecord.verify()): solo mueve las fichas desde la posición inicial,
+        alternando los jugadores desde el que empezó la partida.
+
+        Args:
+            record: El registro de la partida.
+            board: El tablero a usar (por defecto, uno nuevo); se vuelve a la posición inicial.
+        Returns:
+            tuple: El tablero con la posición final y, por cada jugada, las marcas de ficha comida
+            de cada movimiento.
+        """
+        if board is None:
+            board = Board()
+        else:
+            board.new_game_board()
+        uses_white_checkers = record.starts_white
+        hits = []
+        for play in record.plays:
+            play_hits = []
+            for normal_origin, dice_number in play:
+                normal_dest = normal_origin + dice_number
+                if normal_dest >= 25:
+                    board.take_out_checker(normal_origin, uses_white_checkers)
+                    play_hits.append(False)
+                else:
+                    play_hits.append(board.move_checker(normal_origin, normal_dest, uses_white_checkers))
+            hits.append(tuple(play_hits))
+            uses_white_checkers = not uses_white_checkers
+        return board, tuple(hits)
+
+    @classmethod
+    def encode(cls, record: GameRecord, hits: tuple) -> bytes:
+        """Codifica una partida en el formato del archivo.
+
+        Args:
+            record: El registro de la partida.
+            hits: Las marcas de ficha comida de cada movimiento (ver replay()).
+        Returns:
+            bytes: El encabezado y el cuerpo de la partida.
+        """
+        flags = cls.FLAG_STARTS_WHITE if record.starts_white else 0
+        seed = 0
+        if record.seed is not None:
+            if not 0 <= record.seed < 1 << (8 * cls.SEED_BYTES):
+                raise ValueError(f"La semilla debe ser un entero de hasta {8 * cls.SEED_BYTES} bits sin signo.")
+            flags |= cls.FLAG_HAS_SEED
+            seed = record.seed
+        if record.result is not None:
+            white_won, win_type = record.result
+            flags |= cls.FLAG_FINISHED | (cls.FLAG_WHITE_WON if white_won else 0) | (win_type << cls.WIN_TYPE_SHIFT)
+        names = [name.encode("utf-8") for name in record.player_names]
+        if any(len(name) > 255 for name in names):
+            raise ValueError("Los nombres de los jugadores deben ocupar hasta 255 bytes.")
+        body = bytearray(names[0] + names[1])
+        for play, play_hits in zip(record.plays, hits):
+            body.append(len(play))
+            for (normal_origin, dice_number), hit in zip(play, play_hits):
+                body.append(normal_origin)
+                body.append(dice_number | cls.HIT_FLAG if hit else dice_number)
+        return cls.GAME_HEADER.pack(flags, seed.to_bytes(cls.SEED_BYTES, "little"), len(names[0]), len(names[1]),
+                                    len(record.plays), len(body)) + body
+
+    @classmethod
+    def decode(cls, header: bytes, body: bytes) -> tuple[GameRecord, tuple]:
+        """Decodifica una partida del formato del archivo (ver encode()).
+
+        Args:
+            header: El encabezado de la partida.
+            body: El cuerpo de la partida.
+        Returns:
+            tuple: El registro de la partida y las marcas de ficha comida de cada movimiento.
+        """
+        flags, seed, white_name_size, black_name_size, num_plays, _ = cls.GAME_HEADER.unpack(header)
+        names_size = white_name_size + black_name_size
+        player_names = (body[:white_name_size].decode("utf-8"), body[white_name_size:names_size].decode("utf-8"))
+        result = None
+        if flags & cls.FLAG_FINISHED:
+            result = (bool(flags & cls.FLAG_WHITE_WON), flags >> cls.WIN_TYPE_SHIFT)
+        plays = []
+        hits = []
+        index = names_size
+        for _ in range(num_plays):
+            num_moves = body[index]
+            moves = body[index + 1:index + 1 + 2 * num_moves]
+            plays.append(tuple((normal_origin, dice_number & ~cls.HIT_FLAG)
+                               for normal_origin, dice_number in zip(moves[0::2], moves[1::2])))
+            hits.append(tuple(bool(dice_number & cls.HIT_FLAG) for dice_number in moves[1::2]))
+            index += 1 + 2 * num_moves
+        if index != len(body):
+            raise ValueError("El cuerpo de la partida no coincide con su encabezado.")
+        record = GameRecord(int.from_bytes(seed, "little") if flags & cls.FLAG_HAS_SEED else None, plays,
+                            player_names, result, bool(flags & cls.FLAG_STARTS_WHITE))
+        return record, tuple(hits)
+
+    def write(self, record: GameRecord):
+        """Agrega una partida al final del archivo.
+
+        Args:
+            record: El registro de la partida (si no tiene semilla, debe indicar quién empezó).
+        """
+        _, hits = self.replay(record, self.__board__)
+        self.__file__.write(self.encode(record, hits))
+
+    def flush(self):
+        """Escribe en el disco las partidas agregadas."""
+        self.__file__.flush()
+
+    def close(self):
+        """Cierra el archivo."""
+        self.__file__.close()
+
+    @classmethod
+    def read(cls, path: str, with_hits: bool = False):
+        """Lee las partidas de un archivo de a una, sin cargar el archivo completo.
+
+        Args:
+            path: La ruta del archivo.
+            with_hits: Indica si también se devuelven las marcas de ficha comida de cada movimiento.
+        Yields:
+            GameRecord: El registro de cada partida o, si with_hits es True,
+            una tupla (registro, marcas de ficha comida).
+        """
+        with open(path, "rb") as archive_file:
+            cls.check_header(archive_file.read(cls.HEADER.size))
+            while True:
+                header = archive_file.read(cls.GAME_HEADER.size)
+                if not header:
+                    return
+                if len(header) != cls.GAME_HEADER.size:
+                    raise ValueError("El archivo de partidas está truncado.")
+                body_size = cls.GAME_HEADER.unpack(header)[-1]
+                body = archive_file.read(body_size)
+                if len(body) != body_size:
+                    raise ValueError("El archivo de partidas está truncado.")
+                record, hits = cls.decode(header, body)
+                yield (record, hits) if with_hits else record
+
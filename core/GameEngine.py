@@ -0,0 +1,170 @@
+from core.Board import Board
+from core.GameState import GameState
+
+
+class GameEngine:
+    """Motor de pasos del juego sin efectos secundarios ni interfaz.
+
+    Aplica las mismas reglas que Board (jugadas legales, regla de uso máximo de dados,
+    retiro de fichas y tipo de victoria) sobre estados inmutables (GameState):
+    cada operación recibe un estado y devuelve uno nuevo sin modificar el original,
+    sin leer la entrada estándar, sin escribir en la salida y sin crear objetos de interfaz.
+
+    Un turno es: state = engine.roll(state, rng), elegir una de engine.legal_plays(state)
+    y state = engine.apply(state, play), hasta que engine.result(state) no sea None.
+
+    Attributes:
+        __board__: El tablero de trabajo en el que se cargan las posiciones (no se expone).
+    """
+
+    def __init__(self):
+        """Inicializa una instancia del motor."""
+        self.__board__ = Board()
+
+    def initial_state(self, uses_white_checkers: bool = True) -> GameState:
+        """Obtiene el estado inicial de una partida, sin dados tirados.
+
+        Args:
+            uses_white_checkers: Indica si empieza el jugador de fichas blancas.
+        Returns:
+            GameState: El estado con la posición inicial.
+        """
+        return GameState(Board().export_position(), uses_white_checkers)
+
+    @staticmethod
+    def roll_dice_pair(rng) -> tuple[int, int]:
+        """Tira dos dados con un generador de números aleatorios.
+
+        Args:
+            rng: Una fuente de dados (DiceSource), un numpy.random.Generator o un random.Random.
+        Returns:
+            tuple: Los dos dados.
+        """
+        if hasattr(rng, "next_pair"):
+            return rng.next_pair()
+        if hasattr(rng, "integers"):
+            first_die, second_die = rng.integers(1, 7, size=2).tolist()
+            return first_die, second_die
+        return rng.randint(1, 6), rng.randint(1, 6)
+
+    def start(self, rng) -> GameState:
+        """Obtiene el estado inicial decidiendo quién empieza con la tirada inicial.
+
+        Como en BackgammonGame.start_dice_roll(), se tiran dos dados hasta que sean distintos:
+        si el primero es mayor empieza el jugador de fichas blancas.
+
+        Args:
+            rng: Una fuente de dados (DiceSource), un numpy.random.Generator o un random.Random.
+        Returns:
+            GameState: El estado inicial, sin dados tirados.
+        """
+        first_die, second_die = self.roll_dice_pair(rng)
+        while first_die == second_die:
+            first_die, second_die = self.roll_dice_pair(rng)
+        return self.initial_state(first_die > second_die)
+
+    def roll(self, state: GameState, rng) -> GameState:
+        """Tira los dados del jugador con el turno.
+
+        Args:
+            state: El estado sin dados tirados.
+            rng: Una fuente de dados (DiceSource), un numpy.random.Generator o un random.Random.
+        Returns:
+            GameState: El estado con los dados tirados (4 valores si salieron dobles
+            y, si no, ordenados de menor a mayor, como en BackgammonGame.roll_dices()).
+        """
+        if state.dice:
+            raise ValueError("Los dados ya fueron tirados.")
+        first_die, second_die = self.roll_dice_pair(rng)
+        dice = (first_die,) * 4 if first_die == second_die else (min(first_die, second_die),
+                                                                  max(first_die, second_die))
+        return GameState(state.position, state.uses_white_checkers, dice)
+
+    def legal_plays(self, state: GameState) -> tuple:
+        """Obtiene las jugadas legales del jugador con el turno (ver Board.generate_legal_plays()).
+
+        Args:
+            state: El estado con los dados tirados.
+        Returns:
+            tuple: Las jugadas legales (una única jugada vacía si no hay movimientos posibles).
+        """
+        if not state.dice:
+            raise ValueError("Hay que tirar los dados antes de jugar.")
+        self.__board__.import_position(state.position)
+        return self.__board__.generate_legal_plays(state.uses_white_checkers, state.dice)
+
+    def is_legal_play(self, state: GameState, play: tuple) -> bool:
+        """Verifica si una jugada es legal, con sus movimientos en cualquier orden válido.
+
+        legal_plays() deja un solo orden de movimientos por posición final, por lo que una jugada
+        en otro orden es legal si cada movimiento es legal al momento de hacerlo, usa los dados
+        de la tirada y llega a la posición final de una de las jugadas legales.
+
+        Args:
+            state: El estado con los dados tirados.
+            play: La jugada (secuencia de movimientos (índice normal de origen, número de dado)).
+        Returns:
+            bool: True si la jugada es legal, False en caso contrario.
+        """
+        legal_plays = self.legal_plays(state)
+        if play in legal_plays:
+            return True
+        board = self.__board__
+        uses_white_checkers = state.uses_white_checkers
+        remaining_dice = list(state.dice)
+        for normal_origin, dice_number in play:
+            if dice_number not in remaining_dice \
+                    or normal_origin not in board.get_legal_single_moves(uses_white_checkers, dice_number):
+                return False
+            remaining_dice.remove(dice_number)
+            board.apply_single_move(normal_origin, dice_number, uses_white_checkers)
+        final_position = board.export_position()
+        for legal_play in legal_plays:
+            if len(legal_play) == len(play):
+                board.import_position(state.position)
+                board.apply_play(legal_play, uses_white_checkers)
+                if board.export_position() == final_position:
+                    return True
+        return False
+
+    def apply(self, state: GameState, play: tuple) -> GameState:
+        """Aplica una jugada legal y pasa el turno al oponente.
+
+        Args:
+            state: El estado con los dados tirados.
+            play: Una jugada legal (ver is_legal_play()), en cualquier orden válido de sus movimientos.
+        Returns:
+            GameState: El estado siguiente, con el turno del oponente y sin dados tirados.
+        """
+        if not self.is_legal_play(state, play):
+            raise ValueError("La jugada no es legal.")
+        self.__board__.import_position(state.position)
+        self.__board__.apply_play(play, state.uses_white_checkers)
+        return GameState(self.__board__.export_position(), not state.uses_white_checkers)
+
+    def result(self, state: GameState) -> tuple[bool, int] | None:
+        """Obtiene el resultado de la partida.
+
+        Args:
+            state: El estado a consultar.
+        Returns:
+            tuple | None: None si la partida no terminó; si no, (si ganó el jugador de fichas blancas,
+            tipo de victoria: 1 simple, 2 gammon, 3 backgammon).
+        """
+        self.__board__.import_position(state.position)
+        won, white_won = self.__board__.is_match_won()
+        if not won:
+            return None
+        return white_won, self.__board__.get_win_type(white_won)
+
+    def to_board(self, state: GameState) -> Board:
+        """Crea un tablero con la posición de un estado (ej.: para los bots o la interfaz).
+
+        Args:
+            state: El estado.
+        Returns:
+            Board: Un tablero nuevo con la posición del estado.
+        """
+        board = Board()
+        board.import_position(state.position)
+        return board
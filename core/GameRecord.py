@@ -0,0 +1,125 @@
+from core.DiceSource import DiceSource
+from core.GameEngine import GameEngine
+from core.GameState import GameState
+
+
+class GameRecord:
+    """Representa el registro de una partida: la semilla de los dados y la secuencia de jugadas.
+
+    Con la semilla se vuelven a obtener exactamente los mismos dados (ver DiceSource), por lo que
+    la semilla y las jugadas alcanzan para reconstruir toda la partida sin guardar las posiciones.
+    La repetición se hace con el motor de pasos (GameEngine), sin interfaz ni entrada del usuario.
+
+    Attributes:
+        __seed__: La semilla de la fuente de dados de la partida.
+        __plays__: Las jugadas de cada turno, en orden (una jugada vacía si el jugador no pudo mover).
+        __player_names__: Los nombres de los jugadores (fichas blancas, fichas negras).
+        __result__: El resultado (si ganó el jugador de fichas blancas, tipo de victoria) o None si no terminó.
+        __starts_white__: Indica si empezó el jugador de fichas blancas (None = se deduce de la semilla).
+    """
+
+    def __init__(self, seed: int | None, plays: list[tuple] | None = None,
+                 player_names: tuple[str, str] = ("Blanco", "Negro"), result: tuple[bool, int] | None = None,
+                 starts_white: bool | None = None):
+        """Inicializa una instancia del registro.
+
+        Args:
+            seed: La semilla de la fuente de dados de la partida.
+            plays: Las jugadas de cada turno, en orden.
+            player_names: Los nombres de los jugadores (fichas blancas, fichas negras).
+            result: El resultado (si ganó el jugador de fichas blancas, tipo de victoria) o None si no terminó.
+            starts_white: Indica si empezó el jugador de fichas blancas (None = se deduce de la semilla).
+        """
+        self.__seed__ = seed
+        self.__plays__ = [tuple(tuple(move) for move in play) for play in plays] if plays is not None else []
+        self.__player_names__ = tuple(player_names)
+        self.__result__ = result
+        self.__starts_white__ = starts_white
+
+    @property
+    def seed(self) -> int | None:
+        """La semilla de la fuente de dados de la partida (None si no se conoce)."""
+        return self.__seed__
+
+    @property
+    def plays(self) -> tuple[tuple, ...]:
+        """Las jugadas de cada turno, en orden."""
+        return tuple(self.__plays__)
+
+    @property
+    def player_names(self) -> tuple[str, str]:
+        """Los nombres de los jugadores (fichas blancas, fichas negras)."""
+        return self.__player_names__
+
+    @property
+    def result(self) -> tuple[bool, int] | None:
+        """El resultado (si ganó el jugador de fichas blancas, tipo de victoria) o None si no terminó."""
+        return self.__result__
+
+    @property
+    def starts_white(self) -> bool:
+        """Indica si empezó el jugador de fichas blancas (si no se registró, se deduce de la semilla)."""
+        if self.__starts_white__ is None:
+            if self.__seed__ is None:
+                raise ValueError("No se sabe quién empezó la partida: el registro no tiene semilla "
+                                 "ni el jugador inicial.")
+            self.__starts_white__ = GameEngine().start(DiceSource(self.__seed__)).uses_white_checkers
+        return self.__starts_white__
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GameRecord):
+            return NotImplemented
+        if ((self.__seed__, self.__plays__, self.__player_names__, self.__result__)
+                != (other.__seed__, other.__plays__, other.__player_names__, other.__result__)):
+            return False
+        # Con semilla, quien empezó se deduce de ella si no se registró
+        if self.__seed__ is None:
+            return self.__starts_white__ == other.__starts_white__
+        return self.starts_white == other.starts_white
+
+    def __repr__(self) -> str:
+        return (f"GameRecord(seed={self.__seed__}, plays={len(self.__plays__)}, "
+                f"player_names={self.__player_names__}, result={self.__result__})")
+
+    def replay(self, num_plays: int | None = None, engine: GameEngine | None = None) -> GameState:
+        """Repite la partida con el motor de pasos y devuelve el estado alcanzado.
+
+        Los dados se vuelven a tirar con la semilla (la tirada inicial y una tirada por turno,
+        en el mismo orden que BackgammonGame) y cada jugada se valida contra las jugadas legales.
+        Sin semilla no se pueden volver a tirar los dados, por lo que se lanza ValueError.
+
+        Args:
+            num_plays: La cantidad de jugadas a repetir (None = todas).
+            engine: El motor a usar (por defecto, uno nuevo).
+        Returns:
+            GameState: El estado después de la última jugada repetida, sin dados tirados.
+        """
+        if self.__seed__ is None:
+            raise ValueError("No se puede repetir una partida sin la semilla de los dados.")
+        engine = engine if engine is not None else GameEngine()
+        dice_source = DiceSource(self.__seed__)
+        state = engine.start(dice_source)
+        for play_num, play in enumerate(self.__plays__[:num_plays]):
+            state = engine.roll(state, dice_source)
+            try:
+                state = engine.apply(state, play)
+            except ValueError as error:
+                raise ValueError(f"La jugada {play_num} del registro no es legal con los dados {state.dice}.") \
+                    from error
+        return state
+
+    def verify(self, engine: GameEngine | None = None) -> bool:
+        """Verifica que repetir la partida lleva al resultado registrado.
+
+        Args:
+            engine: El motor a usar (por defecto, uno nuevo).
+        Returns:
+            bool: True si todas las jugadas son legales y el resultado coincide.
+        """
+        if self.__seed__ is None:
+            raise ValueError("No se puede verificar una partida sin la semilla de los dados.")
+        engine = engine if engine is not None else GameEngine()
+        try:
+            return engine.result(self.replay(engine=engine)) == self.__result__
+        except ValueError:
+            return False
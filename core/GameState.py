@@ -0,0 +1,69 @@
+from core.Position import Position
+
+
+class GameState:
+    """Representa el estado inmutable de una partida para el motor de pasos (ver GameEngine).
+
+    Agrupa la posición de las fichas, el jugador que tiene el turno y los dados que tiene
+    para jugar. Es hashable y se serializa (pickle) en pocos bytes, por lo que sirve como
+    clave de cachés y para enviarse entre procesos.
+
+    Attributes:
+        __position__: La posición de las fichas.
+        __uses_white_checkers__: Indica si el jugador con el turno usa fichas blancas.
+        __dice__: Los dados a jugar (4 valores si son dobles, vacío si todavía no se tiraron).
+    """
+    __slots__ = ("__position__", "__uses_white_checkers__", "__dice__")
+
+    def __init__(self, position: Position, uses_white_checkers: bool, dice: tuple[int, ...] = ()):
+        """Inicializa una instancia del estado.
+
+        Args:
+            position: La posición de las fichas.
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas.
+            dice: Los dados a jugar (vacío si todavía no se tiraron).
+        """
+        if len(dice) not in (0, 2, 4) or any(not 1 <= dice_number <= 6 for dice_number in dice):
+            raise ValueError("Los dados deben ser 2 valores (o 4 si son dobles) entre 1 y 6.")
+        object.__setattr__(self, "__position__", position)
+        object.__setattr__(self, "__uses_white_checkers__", bool(uses_white_checkers))
+        object.__setattr__(self, "__dice__", tuple(dice))
+
+    def __setattr__(self, name, value):
+        """Impide modificar el estado."""
+        raise AttributeError("El estado es inmutable.")
+
+    def __delattr__(self, name):
+        """Impide modificar el estado."""
+        raise AttributeError("El estado es inmutable.")
+
+    @property
+    def position(self) -> Position:
+        """La posición de las fichas."""
+        return self.__position__
+
+    @property
+    def uses_white_checkers(self) -> bool:
+        """Indica si el jugador con el turno usa fichas blancas."""
+        return self.__uses_white_checkers__
+
+    @property
+    def dice(self) -> tuple[int, ...]:
+        """Los dados a jugar (vacío si todavía no se tiraron)."""
+        return self.__dice__
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return ((self.__position__, self.__uses_white_checkers__, self.__dice__)
+                == (other.__position__, other.__uses_white_checkers__, other.__dice__))
+
+    def __hash__(self) -> int:
+        return hash((self.__position__, self.__uses_white_checkers__, self.__dice__))
+
+    def __reduce__(self):
+        """Serializa el estado solo con sus valores."""
+        return GameState, (self.__position__, self.__uses_white_checkers__, self.__dice__)
+
+    def __repr__(self) -> str:
+        return f"GameState({self.__position__!r}, {self.__uses_white_checkers__}, {self.__dice__})"
@@ -0,0 +1,54 @@
+from math import erf, sqrt
+
+from core.Board import Board
+from core.RaceEvaluator import RaceEvaluator
+
+
+class HeuristicEvaluator:
+    """Evalúa posiciones con contacto con una heurística sobre las máscaras de ocupación del tablero.
+
+    Parte de la ventaja en conteos de Keith (ver RaceEvaluator) y la corrige, en pips,
+    con rasgos estructurales: blots expuestos de cada jugador, largo del prime
+    y puntos tomados en el área de retiro. La ventaja corregida se convierte en probabilidad
+    con la misma aproximación de Kleinman. Las carreras se evalúan directamente con RaceEvaluator.
+
+    Es barato (O(1)) y sirve como política por defecto para rollouts y partidas entre bots.
+
+    Attributes:
+        OPPONENT_BLOT_PIPS: Pips a favor por cada blot expuesto del oponente (que el jugador con el turno puede comer).
+        OWN_BLOT_PIPS: Pips en contra por cada blot expuesto propio.
+        PRIME_PIPS: Pips a favor por cada punto de diferencia en el largo del prime.
+        HOME_POINT_PIPS: Pips a favor por cada punto de diferencia tomado en el área de retiro.
+    """
+    OPPONENT_BLOT_PIPS = 8
+    OWN_BLOT_PIPS = 4
+    PRIME_PIPS = 3
+    HOME_POINT_PIPS = 2
+
+    @classmethod
+    def win_probability(cls, board: Board, uses_white_checkers: bool) -> float:
+        """Estima la probabilidad de ganar del jugador que tiene el turno.
+
+        Args:
+            board: El tablero a evaluar.
+            uses_white_checkers: Indica si el jugador que tiene el turno usa fichas blancas.
+        Returns:
+            float: La probabilidad (0-1) de que el jugador con el turno gane.
+        """
+        if RaceEvaluator.is_race(board):
+            return RaceEvaluator.win_probability(board, uses_white_checkers)
+
+        player_num = 0 if uses_white_checkers else 1
+        player_count = RaceEvaluator.keith_count(board, uses_white_checkers)
+        opponent_count = RaceEvaluator.keith_count(board, not uses_white_checkers)
+        held_masks = board.held_points_mask
+        lead = (opponent_count - player_count + RaceEvaluator.ON_ROLL_BONUS
+                + cls.OPPONENT_BLOT_PIPS * board.count_exposed_blots(not uses_white_checkers)
+                - cls.OWN_BLOT_PIPS * board.count_exposed_blots(uses_white_checkers)
+                + cls.PRIME_PIPS * (board.get_prime_length(uses_white_checkers)
+                                    - board.get_prime_length(not uses_white_checkers))
+                + cls.HOME_POINT_PIPS * ((held_masks[player_num] & Board.HOME_POINTS_MASKS[player_num]).bit_count()
+                                         - (held_masks[1 - player_num]
+                                            & Board.HOME_POINTS_MASKS[1 - player_num]).bit_count()))
+        spread = max(player_count + opponent_count - RaceEvaluator.ON_ROLL_BONUS, 1)
+        return 0.5 * (1.0 + erf(lead / (2.0 * sqrt(spread))))
@@ -0,0 +1,178 @@
+import numpy as np
+
+from core.BatchMoveGenerator import BatchMoveGenerator
+from core.Board import Board
+
+
+class NeuralEvaluator:
+    """Evalúa posiciones con una red neuronal (perceptrón multicapa) al estilo de TD-Gammon.
+
+    La red recibe la codificación de TD-Gammon de la posición, vista desde el jugador con el turno
+    (196 entradas: 4 unidades por punto y jugador, fichas en la barra y fichas retiradas),
+    tiene una capa oculta sigmoide y su primera salida es la probabilidad de ganar del jugador con el turno.
+
+    La inferencia se hace solo con NumPy (CPU) y por lotes: todas las jugadas candidatas
+    de una tirada se evalúan con una sola multiplicación de matrices por capa.
+
+    Attributes:
+        __hidden_weights__: La matriz de pesos de la capa oculta (entradas × neuronas ocultas).
+        __hidden_bias__: El vector de sesgos de la capa oculta.
+        __output_weights__: La matriz de pesos de la capa de salida (neuronas ocultas × salidas).
+        __output_bias__: El vector de sesgos de la capa de salida.
+        NUM_INPUTS: La cantidad de entradas de la red.
+        NUM_CHECKERS: La cantidad de fichas por jugador.
+    """
+    NUM_INPUTS = 196
+    NUM_CHECKERS = 15
+
+    def __init__(self, hidden_weights: np.ndarray, hidden_bias: np.ndarray,
+                 output_weights: np.ndarray, output_bias: np.ndarray):
+        """Inicializa una instancia del evaluador con los pesos de la red.
+
+        Args:
+            hidden_weights: La matriz de pesos de la capa oculta (196 × neuronas ocultas).
+            hidden_bias: El vector de sesgos de la capa oculta.
+            output_weights: La matriz de pesos de la capa de salida (neuronas ocultas × salidas).
+            output_bias: El vector de sesgos de la capa de salida.
+        """
+        num_hidden = hidden_bias.shape[0]
+        if (hidden_weights.shape != (self.NUM_INPUTS, num_hidden) or output_weights.shape[0] != num_hidden
+                or output_bias.shape != output_weights.shape[1:]):
+            raise ValueError("Las formas de los pesos de la red no son compatibles.")
+        self.__hidden_weights__ = np.ascontiguousarray(hidden_weights, dtype=np.float32)
+        self.__hidden_bias__ = np.ascontiguousarray(hidden_bias, dtype=np.float32)
+        self.__output_weights__ = np.ascontiguousarray(output_weights, dtype=np.float32)
+        self.__output_bias__ = np.ascontiguousarray(output_bias, dtype=np.float32)
+
+    @classmethod
+    def load(cls, path: str) -> "NeuralEvaluator":
+        """Carga los pesos de la red desde un archivo .npz (ver save()).
+
+        Args:
+            path: La ruta del archivo de pesos.
+        Returns:
+            NeuralEvaluator: El evaluador con los pesos cargados.
+        """
+        with np.load(path) as weights:
+            return cls(weights["hidden_weights"], weights["hidden_bias"],
+                       weights["output_weights"], weights["output_bias"])
+
+    @classmethod
+    def random(cls, num_hidden: int = 80, num_outputs: int = 1, seed: int = 0) -> "NeuralEvaluator":
+        """Crea un evaluador con pesos aleatorios pequeños (red sin entrenar).
+
+        Args:
+            num_hidden: La cantidad de neuronas ocultas.
+            num_outputs: La cantidad de salidas.
+            seed: La semilla del generador de números aleatorios.
+        Returns:
+            NeuralEvaluator: El evaluador con pesos aleatorios.
+        """
+        rng = np.random.default_rng(seed)
+        return cls(rng.normal(0.0, 0.1, (cls.NUM_INPUTS, num_hidden)), np.zeros(num_hidden),
+                   rng.normal(0.0, 0.1, (num_hidden, num_outputs)), np.zeros(num_outputs))
+
+    def save(self, path: str):
+        """Guarda los pesos de la red en un archivo .npz.
+
+        Args:
+            path: La ruta del archivo de pesos.
+        """
+        np.savez(path, hidden_weights=self.__hidden_weights__, hidden_bias=self.__hidden_bias__,
+                 output_weights=self.__output_weights__, output_bias=self.__output_bias__)
+
+    @classmethod
+    def encode(cls, positions: np.ndarray, uses_white_checkers) -> np.ndarray:
+        """Codifica un lote de posiciones con las entradas de TD-Gammon desde el jugador con el turno.
+
+        Por cada punto (índices normales 1-24) y jugador (primero el del turno) hay 4 unidades:
+        (al menos 1 ficha, al menos 2, al menos 3, (fichas - 3) / 2 si hay más de 3).
+        Luego, por jugador, las fichas en la barra / 2 y las fichas retiradas / 15.
+
+        Args:
+            positions: Un arreglo N×26 de enteros con signo con el formato del arreglo de puntos de Board.
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas
+                    (un booleano para todo el lote o un arreglo de N booleanos).
+        Returns:
+            np.ndarray: Un arreglo N×196 (float32) con las entradas de la red.
+        """
+        own, opponent = BatchMoveGenerator.to_player_perspective(positions, uses_white_checkers)
+        # Fichas de cada jugador en los puntos 1-24 (en los índices normales del jugador con el turno)
+        checkers = np.stack((own[:, 1:25], opponent[:, 1:25]), axis=1).astype(np.float32)
+        point_units = np.stack((checkers >= 1, checkers >= 2, checkers >= 3,
+                                np.maximum(checkers - 3, 0) / 2), axis=-1)
+        bar = np.stack((own[:, 0], opponent[:, 25]), axis=1).astype(np.float32)
+        off = cls.NUM_CHECKERS - own.sum(axis=1), cls.NUM_CHECKERS - opponent.sum(axis=1)
+        return np.concatenate((point_units.reshape(len(own), -1), bar / 2,
+                               np.stack(off, axis=1).astype(np.float32) / cls.NUM_CHECKERS), axis=1)
+
+    def forward(self, inputs: np.ndarray) -> np.ndarray:
+        """Calcula las salidas de la red para un lote de entradas.
+
+        Args:
+            inputs: Un arreglo N×196 con las entradas codificadas (ver encode()).
+        Returns:
+            np.ndarray: Un arreglo N×salidas con las salidas de la red (0-1).
+        """
+        hidden = 1.0 / (1.0 + np.exp(-(inputs @ self.__hidden_weights__ + self.__hidden_bias__)))
+        return 1.0 / (1.0 + np.exp(-(hidden @ self.__output_weights__ + self.__output_bias__)))
+
+    def evaluate_batch(self, positions: np.ndarray, uses_white_checkers) -> np.ndarray:
+        """Calcula la probabilidad de ganar del jugador con el turno para un lote de posiciones.
+
+        Args:
+            positions: Un arreglo N×26 de enteros con signo con el formato del arreglo de puntos de Board.
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas
+                    (un booleano para todo el lote o un arreglo de N booleanos).
+        Returns:
+            np.ndarray: Un arreglo de N probabilidades.
+        """
+        return self.forward(self.encode(positions, uses_white_checkers))[:, 0]
+
+    def evaluate(self, board: Board, uses_white_checkers: bool) -> float:
+        """Calcula la probabilidad de ganar del jugador con el turno.
+
+        Tiene la misma forma que RaceEvaluator.win_probability, por lo que se puede usar
+        como evaluador de ExpectiminimaxBot.
+
+        Args:
+            board: El tablero a evaluar.
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas.
+        Returns:
+            float: La probabilidad (0-1) de que el jugador con el turno gane.
+        """
+        positions = np.frombuffer(board.points.tobytes(), dtype=np.int8)[None, :]
+        return float(self.evaluate_batch(positions, uses_white_checkers)[0])
+
+    def score_plays(self, board: Board, uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple:
+        """Evalúa todas las jugadas legales de una tirada en un solo lote.
+
+        Args:
+            board: El tablero del juego (se restaura al terminar).
+            uses_white_checkers: Indica si el jugador que mueve usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados lanzados.
+        Returns:
+            tuple: (jugadas legales, arreglo con la probabilidad de ganar del jugador que mueve tras cada jugada).
+        """
+        plays = board.generate_legal_plays(uses_white_checkers, dice_numbers)
+        positions = bytearray()
+        for play in plays:
+            board.make_play(play, uses_white_checkers)
+            positions += board.points.tobytes()
+            board.unmake_play(play)
+        positions = np.frombuffer(bytes(positions), dtype=np.int8).reshape(len(plays), Board.BLACK_BAR_POINT + 1)
+        # Después de la jugada el turno es del oponente
+        return plays, 1.0 - self.evaluate_batch(positions, not uses_white_checkers)
+
+    def choose_play(self, board: Board, uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple:
+        """Elige la jugada con mayor probabilidad de ganar según la red (búsqueda de 1 ply).
+
+        Args:
+            board: El tablero del juego (se restaura al terminar).
+            uses_white_checkers: Indica si el jugador que mueve usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados lanzados.
+        Returns:
+            tuple: La jugada elegida.
+        """
+        plays, values = self.score_plays(board, uses_white_checkers, dice_numbers)
+        return plays[int(np.argmax(values))]
@@ -0,0 +1,168 @@
+import struct
+from array import array
+
+from core.Board import Board
+from core.ExpectiminimaxBot import ExpectiminimaxBot
+from core.HeuristicEvaluator import HeuristicEvaluator
+from core.RollCatalog import RollCatalog
+
+
+class OpeningBook:
+    """Libro de aperturas: las mejores jugadas precalculadas de las primeras jugadas de la partida.
+
+    Guarda la mejor jugada para cada una de las 21 tiradas desde la posición inicial y,
+    por cada una de esas jugadas, la mejor respuesta del oponente para cada tirada
+    (y así hasta la cantidad de plies con que se generó). Las respuestas solo cubren
+    las posiciones alcanzadas con las jugadas del libro.
+
+    Las posiciones se guardan desde la perspectiva del jugador con el turno (como si usara
+    fichas blancas), por lo que la misma entrada sirve para ambos colores: las jugadas están
+    en índices normales, que son iguales para los dos jugadores.
+
+    Formato del archivo:
+        Encabezado: MAGIC, versión (uint16), cantidad de entradas (uint32).
+        Entradas: posición (26 bytes con signo), dados (2 bytes, ordenados), cantidad de movimientos (1 byte)
+        y hasta 4 movimientos (índice normal de origen, número de dado) de 1 byte cada valor.
+
+    Attributes:
+        __entries__: Un diccionario (posición en bytes, dados ordenados) -> jugada.
+        MAGIC: Los bytes que identifican el formato del archivo.
+        VERSION: La versión del formato del archivo.
+        HEADER: El formato (struct) del encabezado.
+        RECORD: El formato (struct) de cada entrada.
+        MAX_MOVES: La cantidad máxima de movimientos de una jugada.
+    """
+    MAGIC = b"BGOB"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHI")
+    MAX_MOVES = 4
+    RECORD = struct.Struct(f"<26s3B{2 * MAX_MOVES}B")
+
+    def __init__(self, entries: dict | None = None):
+        """Inicializa una instancia del libro de aperturas.
+
+        Args:
+            entries: Un diccionario (posición en bytes desde el jugador con el turno, dados ordenados) -> jugada.
+        """
+        self.__entries__ = dict(entries) if entries is not None else {}
+
+    def __len__(self) -> int:
+        """La cantidad de entradas del libro."""
+        return len(self.__entries__)
+
+    @staticmethod
+    def get_perspective_points(board: Board, uses_white_checkers: bool) -> bytes:
+        """Obtiene el arreglo de puntos visto desde un jugador, como si usara fichas blancas.
+
+        Args:
+            board: El tablero.
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            bytes: Los 26 valores con signo del arreglo de puntos (fichas propias positivas, barra propia en 0).
+        """
+        if uses_white_checkers:
+            return board.points.tobytes()
+        return array("b", (-board.points[Board.BLACK_BAR_POINT - point]
+                           for point in range(Board.BLACK_BAR_POINT + 1))).tobytes()
+
+    @staticmethod
+    def get_dice_key(dice_numbers: tuple[int, ...]) -> tuple[int, int]:
+        """Obtiene la clave de una tirada: los dos dados ordenados.
+
+        Args:
+            dice_numbers: Los dados (4 valores si son dobles).
+        Returns:
+            tuple: Los dos dados ordenados de menor a mayor.
+        """
+        return min(dice_numbers[0], dice_numbers[1]), max(dice_numbers[0], dice_numbers[1])
+
+    def get_play(self, board: Board, uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple | None:
+        """Busca la jugada del libro para una posición y una tirada.
+
+        Args:
+            board: El tablero del juego.
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas.
+            dice_numbers: Los dados lanzados.
+        Returns:
+            tuple | None: La jugada del libro, o None si la posición no está en el libro.
+        """
+        return self.__entries__.get((self.get_perspective_points(board, uses_white_checkers),
+                                     self.get_dice_key(dice_numbers)))
+
+    @classmethod
+    def load(cls, path: str) -> "OpeningBook":
+        """Carga un libro de aperturas desde un archivo (ver save()).
+
+        Args:
+            path: La ruta del archivo.
+        Returns:
+            OpeningBook: El libro cargado.
+        """
+        with open(path, "rb") as book_file:
+            data = book_file.read()
+        magic, version, num_entries = cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC or version != cls.VERSION \
+                or len(data) != cls.HEADER.size + num_entries * cls.RECORD.size:
+            raise ValueError("El archivo no es un libro de aperturas válido.")
+        entries = {}
+        for position, first_die, second_die, num_moves, *moves in cls.RECORD.iter_unpack(data[cls.HEADER.size:]):
+            entries[(position, (first_die, second_die))] = tuple(zip(moves[0:2 * num_moves:2],
+                                                                     moves[1:2 * num_moves:2]))
+        return cls(entries)
+
+    def save(self, path: str):
+        """Guarda el libro de aperturas en un archivo.
+
+        Args:
+            path: La ruta del archivo.
+        """
+        with open(path, "wb") as book_file:
+            book_file.write(self.HEADER.pack(self.MAGIC, self.VERSION, len(self.__entries__)))
+            for (position, (first_die, second_die)), play in self.__entries__.items():
+                moves = [value for move in play for value in move]
+                moves += [0] * (2 * self.MAX_MOVES - len(moves))
+                book_file.write(self.RECORD.pack(position, first_die, second_die, len(play), *moves))
+
+    @classmethod
+    def build(cls, bot=None, max_plies: int = 2) -> "OpeningBook":
+        """Calcula un libro de aperturas eligiendo las jugadas con un bot.
+
+        Args:
+            bot: El bot que elige las jugadas (por defecto, ExpectiminimaxBot de 2 plies con HeuristicEvaluator).
+            max_plies: La cantidad de jugadas (plies) desde la posición inicial que cubre el libro.
+        Returns:
+            OpeningBook: El libro calculado.
+        """
+        bot = bot if bot is not None else ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=2)
+        entries = {}
+        positions = [Board().points.tobytes()]
+        board = Board()
+        for ply in range(max_plies):
+            next_positions = {}
+            for position in positions:
+                for dice_numbers in RollCatalog.DICE:
+                    board.load_points(array("b", position))
+                    play = bot.choose_play(board, True, dice_numbers)
+                    entries[(position, cls.get_dice_key(dice_numbers))] = play
+                    if ply + 1 < max_plies:
+                        board.apply_play(play, True)
+                        if not board.is_match_won()[0]:
+                            next_positions[cls.get_perspective_points(board, False)] = None
+            positions = list(next_positions)
+        return cls(entries)
+
+    @classmethod
+    def generate(cls, path: str, bot=None, max_plies: int = 2) -> "OpeningBook":
+        """Calcula un libro de aperturas y lo guarda en un archivo.
+
+        Args:
+            path: La ruta del archivo a crear.
+            bot: El bot que elige las jugadas (ver build()).
+            max_plies: La cantidad de jugadas (plies) desde la posición inicial que cubre el libro.
+        Returns:
+            OpeningBook: El libro calculado.
+        """
+        book = cls.build(bot, max_plies)
+        book.save(path)
+        return book
+
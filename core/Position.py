@@ -0,0 +1,76 @@
+from array import array
+from functools import total_ordering
+
+
+@total_ordering
+class Position:
+    """Representa una instantánea inmutable de la posición de las fichas.
+
+    Guarda el arreglo de puntos del tablero (26 enteros con signo, ver Board)
+    como un único objeto bytes, por lo que es hashable, comparable,
+    ocupa poca memoria y se serializa (pickle) en pocas decenas de bytes.
+    Sirve para usar posiciones como claves de diccionarios (cachés)
+    y para enviarlas entre procesos.
+
+    Attributes:
+        __data__: Los 26 valores del arreglo de puntos codificados como bytes (enteros con signo de 8 bits).
+        NUM_POINTS: La cantidad de valores del arreglo de puntos.
+    """
+    __slots__ = ("__data__",)
+    NUM_POINTS = 26
+
+    def __init__(self, points):
+        """Inicializa una instancia de la posición.
+
+        Args:
+            points: Los 26 valores del arreglo de puntos, como bytes
+                    (ej.: Board.points.tobytes()) o como una secuencia de enteros con signo.
+        """
+        if isinstance(points, bytes):
+            data = points
+        else:
+            data = array("b", points).tobytes()
+        if len(data) != self.NUM_POINTS:
+            raise ValueError(f"La posición debe tener {self.NUM_POINTS} puntos.")
+        object.__setattr__(self, "__data__", data)
+
+    def __setattr__(self, name, value):
+        """Impide modificar la posición."""
+        raise AttributeError("La posición es inmutable.")
+
+    def __delattr__(self, name):
+        """Impide modificar la posición."""
+        raise AttributeError("La posición es inmutable.")
+
+    @property
+    def points(self) -> tuple[int, ...]:
+        """Los 26 valores con signo del arreglo de puntos."""
+        return tuple(array("b", self.__data__))
+
+    def to_bytes(self) -> bytes:
+        """Obtiene la representación compacta (26 bytes) de la posición.
+
+        Returns:
+            bytes: Los valores del arreglo de puntos como enteros con signo de 8 bits.
+        """
+        return self.__data__
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.__data__ == other.__data__
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.__data__ < other.__data__
+
+    def __hash__(self) -> int:
+        return hash(self.__data__)
+
+    def __reduce__(self):
+        """Serializa la posición solo con sus bytes."""
+        return Position, (self.__data__,)
+
+    def __repr__(self) -> str:
+        return f"Position({self.points})"
@@ -0,0 +1,88 @@
+from math import erf, sqrt
+
+from core.Board import Board
+
+
+class RaceEvaluator:
+    """Evalúa posiciones de carrera (sin contacto entre las fichas de los jugadores).
+
+    Usa la cantidad de pips incremental del tablero, ajustada con las penalizaciones
+    de desperdicio del conteo de Keith (fichas apiladas en los puntos bajos y huecos
+    en los puntos altos del área de retiro), y estima la probabilidad de ganar
+    con la aproximación normal de Kleinman. Todas las consultas son O(1).
+
+    Attributes:
+        KEITH_STACK_PENALTIES: Tuplas (índice normal, fichas permitidas, penalización por ficha extra)
+                de las fichas apiladas que desperdician pips.
+        KEITH_GAP_NORMALS: Los índices normales del área de retiro que se penalizan con 1 si están vacíos.
+        ON_ROLL_BONUS: La ventaja en pips del jugador que tiene el turno en la fórmula de Kleinman.
+    """
+    KEITH_STACK_PENALTIES = ((24, 1, 2), (23, 1, 1), (22, 3, 1))
+    KEITH_GAP_NORMALS = (21, 20, 19)
+    ON_ROLL_BONUS = 4
+
+    @staticmethod
+    def is_race(board: Board) -> bool:
+        """Verifica si la posición es una carrera (ya no hay contacto posible entre las fichas).
+
+        Args:
+            board: El tablero a evaluar.
+        Returns:
+            bool: True si ninguna ficha de un jugador tiene que pasar por delante de las del oponente.
+        """
+        if not all(board.is_bar_empty):
+            return False
+        white_mask, black_mask = board.occupied_points_mask
+        if white_mask == 0 or black_mask == 0:
+            return True
+        # La ficha blanca más atrasada debe estar por delante (punto absoluto mayor) de la negra más atrasada
+        return (white_mask & -white_mask).bit_length() > black_mask.bit_length()
+
+    @classmethod
+    def keith_count(cls, board: Board, uses_white_checkers: bool) -> int:
+        """Calcula el conteo de Keith (pips más desperdicio) de un jugador, sin el ajuste por tener el turno.
+
+        Args:
+            board: El tablero a evaluar.
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            int: La cantidad de pips ajustada.
+        """
+        sign = 1 if uses_white_checkers else -1
+        normal_to_point = board.NORMAL_TO_POINT[uses_white_checkers]
+        points = board.points
+        count = board.pip_counts[0 if uses_white_checkers else 1]
+        for normal_index, allowed_checkers, penalty in cls.KEITH_STACK_PENALTIES:
+            checkers = points[normal_to_point[normal_index]] * sign
+            if checkers > allowed_checkers:
+                count += (checkers - allowed_checkers) * penalty
+        for normal_index in cls.KEITH_GAP_NORMALS:
+            if points[normal_to_point[normal_index]] * sign <= 0:
+                count += 1
+        return count
+
+    @classmethod
+    def win_probability(cls, board: Board, uses_white_checkers: bool) -> float:
+        """Estima la probabilidad de ganar la carrera del jugador que tiene el turno.
+
+        Aplica la aproximación de Kleinman, P = Φ((D + 4) / √(2(S - 4))),
+        donde D es la ventaja en conteos de Keith y S la suma de ambos conteos.
+
+        Args:
+            board: El tablero a evaluar (debe ser una carrera, ver is_race()).
+            uses_white_checkers: Indica si el jugador que tiene el turno usa fichas blancas.
+        Returns:
+            float: La probabilidad (0-1) de que el jugador con el turno gane.
+        """
+        player_num = 0 if uses_white_checkers else 1
+        if board.pip_counts[player_num] == 0:
+            return 1.0
+        if board.pip_counts[1 - player_num] == 0:
+            return 0.0
+
+        player_count = cls.keith_count(board, uses_white_checkers)
+        opponent_count = cls.keith_count(board, not uses_white_checkers)
+        lead = opponent_count - player_count + cls.ON_ROLL_BONUS
+        spread = max(player_count + opponent_count - cls.ON_ROLL_BONUS, 1)
+        # Φ(z) = (1 + erf(z / √2)) / 2, con z = lead / √(2 * spread)
+        return 0.5 * (1.0 + erf(lead / (2.0 * sqrt(spread))))
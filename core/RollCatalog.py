@@ -0,0 +1,104 @@
+from itertools import combinations
+from types import MappingProxyType
+
+
+class RollCatalog:
+    """Catálogo inmutable y precalculado de las tiradas de dos dados.
+
+    Las 21 tiradas distintas tienen un identificador entero (0-20), en el orden
+    (1-1, 1-2, ..., 1-6, 2-2, ..., 6-6), su probabilidad (1/36 los dobles y 2/36 el resto),
+    los dados que se juegan (4 valores si son dobles), los órdenes en que se pueden jugar todos
+    los dados y, para los dados que quedan por jugar en un turno, las secuencias ordenadas
+    de dados con las que se puede mover una ficha.
+
+    Todo se calcula una sola vez al importar el módulo y es compartido por el tablero,
+    los evaluadores, los bots de búsqueda y los rollouts, por lo que ninguno vuelve
+    a generar las combinaciones en cada llamada.
+
+    Attributes:
+        NUM_ROLLS: La cantidad de tiradas distintas.
+        ROLL_PAIRS: Los dos dados de cada tirada (de menor a mayor), por identificador.
+        DICE: Los dados que se juegan en cada tirada (4 valores si son dobles), por identificador.
+        WEIGHTS: La probabilidad de cada tirada, por identificador.
+        ROLLS: Las 21 tiradas con su probabilidad ((dados jugables), probabilidad), por identificador.
+        ROLL_IDS: Tabla 7×7 con el identificador de la tirada de cada par de dados (-1 si algún dado es 0).
+        ORDERED_ROLLS: Las 36 tiradas ordenadas (primer dado, segundo dado).
+        PLAY_ORDERS: Los órdenes en que se pueden jugar todos los dados de cada tirada, por identificador.
+        DIE_SEQUENCES: Diccionario de solo lectura (dados que quedan por jugar) -> secuencias ordenadas
+                de 1 o más de esos dados, para todos los dados que pueden quedar de una tirada.
+    """
+    NUM_ROLLS = 21
+    ROLL_PAIRS = tuple((first_die, second_die) for first_die in range(1, 7) for second_die in range(first_die, 7))
+    DICE = tuple((first_die,) * 4 if first_die == second_die else (first_die, second_die)
+                 for first_die, second_die in ROLL_PAIRS)
+    WEIGHTS = tuple((1 if first_die == second_die else 2) / 36 for first_die, second_die in ROLL_PAIRS)
+    ROLLS = tuple(zip(DICE, WEIGHTS))
+    # El identificador de (a, b) con a <= b es la cantidad de tiradas con primer dado menor a a, más b - a
+    ROLL_IDS = tuple(tuple((min(first_die, second_die) - 1) * (14 - min(first_die, second_die)) // 2
+                           + abs(first_die - second_die) if first_die and second_die else -1
+                           for second_die in range(7))
+                     for first_die in range(7))
+    ORDERED_ROLLS = tuple((first_die, second_die) for first_die in range(1, 7) for second_die in range(1, 7))
+    PLAY_ORDERS = tuple((dice,) if len(dice) == 4 else (dice, dice[::-1]) for dice in DICE)
+
+    @classmethod
+    def roll_id(cls, first_die: int, second_die: int) -> int:
+        """Obtiene el identificador de una tirada.
+
+        Args:
+            first_die: El primer dado (1-6).
+            second_die: El segundo dado (1-6).
+        Returns:
+            int: El identificador de la tirada (0-20), sin importar el orden de los dados.
+        """
+        return cls.ROLL_IDS[first_die][second_die]
+
+    @staticmethod
+    def build_die_sequences(dice_numbers: tuple[int, ...]) -> tuple:
+        """Calcula las secuencias ordenadas de 1 o más dados con las que se puede mover una ficha.
+
+        Incluye cada subconjunto de dados una sola vez y, si sus dados son distintos,
+        también en el orden inverso.
+
+        Args:
+            dice_numbers: Los dados que quedan por jugar (los 0 se ignoran).
+        Returns:
+            tuple: Las secuencias de dados, de menos a más dados.
+        """
+        dice_numbers = tuple(num for num in dice_numbers if num > 0)
+        dice_sequences = []
+        seen = set()
+        for length in range(1, len(dice_numbers) + 1):
+            for combo in combinations(dice_numbers, length):
+                if combo not in seen:
+                    dice_sequences.append(combo)
+                    seen.add(combo)
+                if 2 <= len(combo) == len(set(combo)):
+                    dice_sequences.append(combo[::-1])
+                    seen.add(combo[::-1])
+        return tuple(dice_sequences)
+
+    @classmethod
+    def die_sequences(cls, dice_numbers: tuple[int, ...]) -> tuple:
+        """Obtiene las secuencias ordenadas de dados con las que se puede mover una ficha (ver DIE_SEQUENCES).
+
+        Args:
+            dice_numbers: Los dados que quedan por jugar (los 0 se ignoran).
+        Returns:
+            tuple: Las secuencias de dados, de menos a más dados.
+        """
+        dice_sequences = cls.DIE_SEQUENCES.get(dice_numbers)
+        if dice_sequences is None:
+            # Dados con ceros (ya usados) o que no salen de una tirada
+            dice_sequences = cls.DIE_SEQUENCES.get(tuple(num for num in dice_numbers if num > 0))
+            if dice_sequences is None:
+                dice_sequences = cls.build_die_sequences(dice_numbers)
+        return dice_sequences
+
+
+RollCatalog.DIE_SEQUENCES = MappingProxyType({
+    remaining: RollCatalog.build_die_sequences(remaining)
+    for dice in RollCatalog.DICE
+    for length in range(1, len(dice) + 1)
+    for remaining in {dice[:length], dice[::-1][:length], dice[len(dice) - length:]}
+})
@@ -0,0 +1,269 @@
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+from os import cpu_count
+from time import perf_counter
+
+import numpy as np
+
+from core.Board import Board
+from core.DiceSource import DiceSource
+from core.ExpectiminimaxBot import ExpectiminimaxBot
+from core.HeuristicEvaluator import HeuristicEvaluator
+from core.Position import Position
+from core.RollCatalog import RollCatalog
+
+
+class RolloutEngine:
+    """Juega una posición hasta el final muchas veces (rollout de Monte Carlo) en varios procesos.
+
+    Las partidas se reparten en tareas de tamaño fijo entre los procesos de un ProcessPoolExecutor.
+    Cada tarea recibe solo la posición compacta (Position), el jugador con el turno, el bot
+    y su propio flujo de números aleatorios (hijo de un SeedSequence), por lo que los resultados
+    son reproducibles con la misma semilla sin importar la cantidad de procesos.
+
+    El bot puede ser cualquier objeto serializable (pickle) con un método
+    choose_play(tablero, usa fichas blancas, dados) -> jugada (ej.: ExpectiminimaxBot o NeuralEvaluator).
+
+    Con reducción de varianza, las partidas se juegan de a pares y se combinan tres técnicas:
+    la primera tirada de cada par recorre las 36 tiradas (estratificación), la segunda partida
+    del par usa los dados opuestos (7 - dado) de la primera (dados espejados) y a la victoria
+    se le resta la suerte de cada tirada según un evaluador (variable de control de media 0).
+
+    Attributes:
+        __bot__: El bot que juega ambos lados de las partidas.
+        __num_workers__: La cantidad de procesos (1 = en el proceso actual, sin ProcessPoolExecutor).
+        __games_per_task__: La cantidad de partidas de cada tarea (par, para no separar las partidas espejadas).
+        __luck_evaluator__: El evaluador (tablero, usa fichas blancas) -> probabilidad de ganar del jugador
+                con el turno con el que se mide la suerte de cada tirada.
+        OUTCOMES: Los resultados posibles de una partida, desde el jugador con el turno inicial,
+                en el orden de los conteos (victoria/derrota simple, gammon y backgammon).
+        OUTCOME_POINTS: Los puntos de cada resultado.
+        Z_95: El cuantil de la distribución normal para intervalos de confianza del 95%.
+        FIRST_ROLLS: Las 36 tiradas ordenadas que recorre la estratificación de la primera tirada (del catálogo).
+    """
+    OUTCOMES = ("win_single", "win_gammon", "win_backgammon", "lose_single", "lose_gammon", "lose_backgammon")
+    OUTCOME_POINTS = (1, 2, 3, -1, -2, -3)
+    Z_95 = 1.96
+    FIRST_ROLLS = RollCatalog.ORDERED_ROLLS
+
+    def __init__(self, bot=None, num_workers: int | None = None, games_per_task: int = 50,
+                 luck_evaluator=HeuristicEvaluator.win_probability):
+        """Inicializa una instancia del motor de rollouts.
+
+        Args:
+            bot: El bot que juega ambos lados
+                 (por defecto, ExpectiminimaxBot de 1 ply con HeuristicEvaluator).
+            num_workers: La cantidad de procesos (por defecto, la cantidad de núcleos).
+            games_per_task: La cantidad de partidas de cada tarea (se redondea a par).
+            luck_evaluator: El evaluador con el que se mide la suerte en la reducción de varianza.
+        """
+        self.__bot__ = bot if bot is not None else ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=1)
+        self.__num_workers__ = num_workers if num_workers is not None else (cpu_count() or 1)
+        self.__games_per_task__ = games_per_task + games_per_task % 2
+        self.__luck_evaluator__ = luck_evaluator
+
+    @staticmethod
+    def roll_luck(board: Board, uses_white_checkers: bool, dice: tuple[int, int], luck_evaluator) -> float:
+        """Calcula la suerte de una tirada: el valor de la mejor jugada con esa tirada
+        menos el valor esperado de la mejor jugada sobre las 21 tiradas.
+
+        Args:
+            board: El tablero antes de la tirada (se restaura al terminar).
+            uses_white_checkers: Indica si el jugador que tira usa fichas blancas.
+            dice: Los dos dados obtenidos.
+            luck_evaluator: El evaluador (tablero, usa fichas blancas) -> probabilidad de ganar del jugador con el turno.
+        Returns:
+            float: La suerte, en probabilidad de ganar del jugador que tira (su valor esperado es 0).
+        """
+        expected_value = 0.0
+        rolled_value = 0.0
+        rolled_id = RollCatalog.roll_id(*dice)
+        for roll_id, (dice_numbers, weight) in enumerate(RollCatalog.ROLLS):
+            best_value = 0.0
+            for play in board.generate_legal_plays(uses_white_checkers, dice_numbers):
+                board.make_play(play, uses_white_checkers)
+                value = 1.0 if board.is_match_won()[0] else 1.0 - luck_evaluator(board, not uses_white_checkers)
+                board.unmake_play(play)
+                best_value = max(best_value, value)
+            expected_value += weight * best_value
+            if roll_id == rolled_id:
+                rolled_value = best_value
+        return rolled_value - expected_value
+
+    @staticmethod
+    def play_games(position: Position, uses_white_checkers: bool, bot, num_games: int,
+                   seed_sequence: np.random.SeedSequence, first_game_num: int = 0,
+                   luck_evaluator=None) -> tuple[list, list]:
+        """Juega varias partidas desde una posición hasta el final (se ejecuta en los procesos).
+
+        Args:
+            position: La posición inicial.
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas.
+            bot: El bot que juega ambos lados.
+            num_games: La cantidad de partidas a jugar (par si se reduce la varianza).
+            seed_sequence: La semilla del flujo de números aleatorios de la tarea.
+            first_game_num: El número de la primera partida de la tarea dentro del rollout.
+            luck_evaluator: El evaluador de la suerte, o None para jugar sin reducción de varianza.
+        Returns:
+            tuple: (la cantidad de partidas de cada resultado (en el orden de OUTCOMES),
+            una lista con (victoria del jugador con el turno inicial (0 o 1), suerte acumulada) por partida,
+            vacía si no se reduce la varianza).
+        """
+        dice_source = DiceSource(seed_sequence)
+        counts = [0] * len(RolloutEngine.OUTCOMES)
+        samples = []
+        board = Board()
+        board.import_position(position)
+        if board.is_match_won()[0]:
+            raise ValueError("No se puede hacer el rollout de una partida terminada.")
+        previous_rolls = []
+        for game_num in range(first_game_num, first_game_num + num_games):
+            board.import_position(position)
+            # La segunda partida de cada par espeja los dados de la primera mientras duren
+            mirrored_rolls = previous_rolls if luck_evaluator is not None and game_num % 2 == 1 else []
+            rolls = []
+            luck = 0.0
+            player_uses_white = uses_white_checkers
+            while True:
+                if len(rolls) < len(mirrored_rolls):
+                    first_die, second_die = (7 - die for die in mirrored_rolls[len(rolls)])
+                elif luck_evaluator is not None and not rolls:
+                    first_die, second_die = RolloutEngine.FIRST_ROLLS[(game_num // 2) % 36]
+                else:
+                    first_die, second_die = dice_source.next_pair()
+                rolls.append((first_die, second_die))
+                if luck_evaluator is not None:
+                    roll_luck = RolloutEngine.roll_luck(board, player_uses_white, (first_die, second_die),
+                                                        luck_evaluator)
+                    luck += roll_luck if player_uses_white == uses_white_checkers else -roll_luck
+                dice = (first_die,) * 4 if first_die == second_die else (first_die, second_die)
+                board.apply_play(bot.choose_play(board, player_uses_white, dice), player_uses_white)
+                if board.is_match_won()[0]:
+                    break
+                player_uses_white = not player_uses_white
+            previous_rolls = rolls
+            win_type = board.get_win_type(player_uses_white)
+            won = player_uses_white == uses_white_checkers
+            counts[win_type - 1 if won else win_type + 2] += 1
+            if luck_evaluator is not None:
+                samples.append((int(won), luck))
+        return counts, samples
+
+    def rollout(self, board: Board, uses_white_checkers: bool, num_games: int, seed: int = 0,
+                variance_reduction: bool = False) -> dict:
+        """Hace el rollout de una posición.
+
+        Args:
+            board: El tablero con la posición a analizar (no se modifica).
+            uses_white_checkers: Indica si el jugador con el turno usa fichas blancas.
+            num_games: La cantidad de partidas a jugar (se redondea a par con reducción de varianza).
+            seed: La semilla de la que se derivan los flujos de números aleatorios de las tareas.
+            variance_reduction: Indica si se usan la estratificación, los dados espejados y la corrección por suerte.
+        Returns:
+            dict: Los resultados desde el jugador con el turno (ver summarize()), más "seconds" y "games_per_second".
+            Con reducción de varianza, "win" es la estimación corregida por suerte (las probabilidades
+            de gammon y backgammon y la equity no se corrigen) y "variance_reduction" tiene el informe
+            de summarize_variance_reduction().
+        """
+        if num_games < 1:
+            raise ValueError("El rollout debe tener al menos una partida.")
+        if board.is_match_won()[0]:
+            raise ValueError("No se puede hacer el rollout de una partida terminada.")
+        if variance_reduction:
+            num_games += num_games % 2
+        position = board.export_position()
+        num_tasks = -(-num_games // self.__games_per_task__)
+        first_game_nums = [task * self.__games_per_task__ for task in range(num_tasks)]
+        task_games = [min(self.__games_per_task__, num_games - first_game_num) for first_game_num in first_game_nums]
+        seed_sequences = np.random.SeedSequence(seed).spawn(num_tasks)
+        luck_evaluator = self.__luck_evaluator__ if variance_reduction else None
+
+        start = perf_counter()
+        if self.__num_workers__ <= 1:
+            task_results = [self.play_games(position, uses_white_checkers, self.__bot__, games, seed_sequence,
+                                            first_game_num, luck_evaluator)
+                            for games, seed_sequence, first_game_num
+                            in zip(task_games, seed_sequences, first_game_nums)]
+        else:
+            with ProcessPoolExecutor(max_workers=self.__num_workers__) as executor:
+                task_results = list(executor.map(self.play_games, [position] * num_tasks,
+                                                 [uses_white_checkers] * num_tasks, [self.__bot__] * num_tasks,
+                                                 task_games, seed_sequences, first_game_nums,
+                                                 [luck_evaluator] * num_tasks))
+        counts = [0] * len(self.OUTCOMES)
+        samples = []
+        for task_counts, task_samples in task_results:
+            counts = [total + count for total, count in zip(counts, task_counts)]
+            samples += task_samples
+        seconds = perf_counter() - start
+
+        results = self.summarize(counts)
+        if variance_reduction:
+            report = self.summarize_variance_reduction(samples)
+            margin = self.Z_95 * report["standard_error"]
+            results["win"] = (report["win"], report["win"] - margin, report["win"] + margin)
+            results["variance_reduction"] = report
+        results["seconds"] = seconds
+        results["games_per_second"] = num_games / seconds if seconds > 0 else 0.0
+        return results
+
+    @classmethod
+    def summarize(cls, counts: list) -> dict:
+        """Calcula las probabilidades y sus intervalos de confianza del 95% a partir de los conteos.
+
+        Args:
+            counts: La cantidad de partidas de cada resultado (en el orden de OUTCOMES).
+        Returns:
+            dict: "games", y para "win", "win_gammon", "win_backgammon", "lose_gammon", "lose_backgammon"
+            (gammon y backgammon incluyen los resultados mayores) y "equity" (puntos por partida)
+            una tupla (valor, límite inferior, límite superior).
+        """
+        games = sum(counts)
+        if games < 1:
+            raise ValueError("No hay partidas para resumir.")
+        win_single, win_gammon, win_backgammon, lose_single, lose_gammon, lose_backgammon = counts
+
+        def proportion(count: int) -> tuple[float, float, float]:
+            probability = count / games
+            margin = cls.Z_95 * sqrt(probability * (1.0 - probability) / games)
+            return probability, max(probability - margin, 0.0), min(probability + margin, 1.0)
+
+        equity = sum(points * count for points, count in zip(cls.OUTCOME_POINTS, counts)) / games
+        variance = sum(points * points * count for points, count in zip(cls.OUTCOME_POINTS, counts)) / games
+        equity_margin = cls.Z_95 * sqrt(max(variance - equity * equity, 0.0) / games)
+        return {
+            "games": games,
+            "win": proportion(win_single + win_gammon + win_backgammon),
+            "win_gammon": proportion(win_gammon + win_backgammon),
+            "win_backgammon": proportion(win_backgammon),
+            "lose_gammon": proportion(lose_gammon + lose_backgammon),
+            "lose_backgammon": proportion(lose_backgammon),
+            "equity": (equity, equity - equity_margin, equity + equity_margin),
+        }
+
+    @staticmethod
+    def summarize_variance_reduction(samples: list) -> dict:
+        """Calcula la probabilidad de ganar corregida por suerte y la reducción de varianza efectiva.
+
+        Las partidas espejadas no son independientes, por lo que la varianza corregida
+        se estima con el promedio de cada par y se expresa por partida (el doble de la varianza
+        de los promedios) para compararla con la varianza de la victoria sin corregir.
+
+        Args:
+            samples: Las (victoria, suerte acumulada) de cada partida, de a pares.
+        Returns:
+            dict: "win" (probabilidad de ganar corregida), "standard_error" (su error estándar),
+            "plain_standard_error" (el error estándar sin reducción de varianza) y "variance_reduction"
+            (el cociente de las varianzas: cuántas partidas sin reducción equivalen a una con reducción).
+        """
+        wins = np.array([won for won, _ in samples], dtype=np.float64)
+        corrected = wins - np.array([luck for _, luck in samples], dtype=np.float64)
+        pair_means = corrected.reshape(-1, 2).mean(axis=1)
+        plain_variance = float(wins.var(ddof=1)) if len(wins) > 1 else 0.0
+        corrected_variance = 2.0 * float(pair_means.var(ddof=1)) if len(pair_means) > 1 else 0.0
+        return {
+            "win": float(corrected.mean()),
+            "standard_error": sqrt(corrected_variance / len(wins)),
+            "plain_standard_error": sqrt(plain_variance / len(wins)),
+            "variance_reduction": plain_variance / corrected_variance if corrected_variance > 0 else float("inf"),
+        }
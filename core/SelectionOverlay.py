@@ -0,0 +1,148 @@
+from core.Board import Board
+
+
+class SelectionOverlay:
+    """Representa la capa de selección de la interfaz sobre el tablero.
+
+    Guarda la ficha seleccionada y los posibles movimientos resaltados,
+    separados del estado de juego del tablero (Board), para que la interfaz
+    (CLI o Pygame) los dibuje sobre los triángulos.
+
+    Los símbolos de selección son:
+    (0 = Ninguno; 1 = Resaltador de ficha seleccionada; 2 = Posible movimiento).
+
+    Attributes:
+        __selected_checker__: El índice normal (1-24) de la ficha seleccionada actualmente, o None si ninguna.
+        __uses_white_checkers__: Indica si la selección actual es del jugador con fichas blancas
+                (None si no hay selección).
+        __marks__: Un diccionario que mapea los puntos absolutos marcados a su símbolo de selección.
+        __off_tray_posible_move__: Una lista que indica si el jugador puede mover una ficha al área de retiro.
+                [fichas blancas, fichas negras]
+    """
+
+    def __init__(self):
+        """Inicializa una instancia de la capa de selección sin ninguna selección."""
+        self.__selected_checker__ = None
+        self.__uses_white_checkers__ = None
+        self.__marks__ = {}
+        self.__off_tray_posible_move__ = [False, False]
+
+    @property
+    def selected_checker(self) -> int | None:
+        """Índice normal de la ficha seleccionada actualmente."""
+        return self.__selected_checker__
+
+    @property
+    def off_tray_posible_move(self) -> list:
+        """Indica si el jugador puede mover una ficha al área de retiro.
+
+        [fichas blancas, fichas negras]
+        """
+        return self.__off_tray_posible_move__
+
+    def get_mark_from_point(self, point: int) -> int:
+        """Obtiene el símbolo de selección de un punto absoluto.
+
+        Args:
+            point: El punto absoluto (1-24).
+        Returns:
+            int: El símbolo de selección (0, 1 o 2).
+        """
+        return self.__marks__.get(point, 0)
+
+    def get_mark_from_normal(self, normal_index: int, uses_white_checkers: bool) -> int:
+        """Obtiene el símbolo de selección de un índice normal.
+
+        Args:
+            normal_index: El índice normal (1-24).
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            int: El símbolo de selección (0, 1 o 2).
+        """
+        return self.get_mark_from_point(Board.NORMAL_TO_POINT[uses_white_checkers][normal_index])
+
+    def mark_triangles(self, triangles: list, points) -> list:
+        """Aplica los símbolos de selección sobre una lista de triángulos generada por el tablero.
+
+        Args:
+            triangles: La lista de triángulos (se modifica en el lugar).
+            points: Los puntos absolutos correspondientes a cada triángulo, en el mismo orden.
+        Returns:
+            list: La misma lista de triángulos, con los símbolos de selección aplicados.
+        """
+        for triangle, point in zip(triangles, points):
+            triangle[1] = self.__marks__.get(point, 0)
+        return triangles
+
+    def select_checker(self, board: Board, normal_index: int, uses_white_checkers: bool,
+                       dice_numbers: tuple[int, ...]) -> dict:
+        """Selecciona una ficha en un triángulo específico si es movible
+        y marca los movimientos posibles.
+
+        Args:
+            board: El tablero del juego.
+            normal_index: El índice normal (1-24) del triángulo.
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados lanzados.
+        Returns:
+            dict: Los movimientos posibles (índice normal de destino -> combinación de dados),
+            o un diccionario vacío si la ficha no fue seleccionada.
+        """
+        # Deselecciona cualquier ficha previamente seleccionada
+        self.clear()
+
+        # Verifica si la ficha puede ser movida
+        if board.verify_movable_checker(normal_index, uses_white_checkers):
+            poss_dice_combs = board.get_possible_dice_combinations(normal_index, uses_white_checkers, dice_numbers)
+            if poss_dice_combs:
+                # Marca la ficha como seleccionada
+                # (1 = Resaltador de ficha seleccionada)
+                self.__selected_checker__ = normal_index
+                self.__uses_white_checkers__ = uses_white_checkers
+                normal_to_point = Board.NORMAL_TO_POINT[uses_white_checkers]
+                self.__marks__[normal_to_point[normal_index]] = 1
+
+                poss_moves = board.map_dice_combinations_to_normal_indexes(normal_index, poss_dice_combs)
+                for move_normal in poss_moves:
+                    if move_normal >= 25:
+                        self.__off_tray_posible_move__[0 if uses_white_checkers else 1] = True
+                        continue
+                    # Marca el triángulo como un posible movimiento
+                    # (2 = Posible movimiento)
+                    self.__marks__[normal_to_point[move_normal]] = 2
+                return poss_moves
+        return {}
+
+    def deselect_checker(self, uses_white_checkers: bool) -> bool:
+        """Deselecciona la ficha seleccionada del jugador
+        y limpia todas las marcas de posibles movimientos.
+
+        Args:
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        Returns:
+            bool: True si se deseleccionó una ficha del jugador, False en caso contrario.
+        """
+        if self.__selected_checker__ is None or self.__uses_white_checkers__ != uses_white_checkers:
+            return False
+        self.clear()
+        return True
+
+    def clean_selection(self, normal_indexes: tuple[int, ...], uses_white_checkers: bool):
+        """Limpia los símbolos de selección de los triángulos especificados.
+
+        Args:
+            normal_indexes: Los índices normales (1-24) de los triángulos a limpiar.
+            uses_white_checkers: Indica si el jugador usa fichas blancas.
+        """
+        normal_to_point = Board.NORMAL_TO_POINT[uses_white_checkers]
+        for normal_index in normal_indexes:
+            if self.__marks__.pop(normal_to_point[normal_index], 0) == 1:
+                self.__selected_checker__ = None
+                self.__uses_white_checkers__ = None
+
+    def clear(self):
+        """Quita la selección y todas las marcas (solo recorre los puntos marcados)."""
+        self.__selected_checker__ = None
+        self.__uses_white_checkers__ = None
+        self.__marks__.clear()
+        self.__off_tray_posible_move__ = [False, False]
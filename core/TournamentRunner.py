@@ -0,0 +1,178 @@
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from os import cpu_count
+from time import perf_counter
+
+from core.BackgammonGame import BackgammonGame
+from core.DiceSource import DiceSource
+
+
+class TournamentRunner:
+    """Juega torneos entre dos bots sin interfaz (sin entrada ni salida por terminal).
+
+    Cada partida usa un BackgammonGame con su tablero, sus dados y su lógica de turnos
+    (tirada inicial, tirada de dados y cambio de turno). Las partidas se reparten en tareas
+    entre los procesos de un ProcessPoolExecutor y el resultado de cada partida se escribe
+    en un archivo (una línea JSON por partida) en cuanto termina, por lo que una interrupción
+    no pierde las partidas terminadas. Por defecto cada tarea es una partida; con tareas más grandes
+    se reduce el costo de repartirlas, pero en los procesos los resultados de una tarea se escriben juntos.
+
+    Los bots alternan colores: en las partidas pares el primer bot usa fichas blancas.
+    Cada partida tira los dados con su propia semilla (ver DiceSource.game_seed()), derivada de la semilla
+    del torneo y de su número, por lo que los resultados son reproducibles sin importar la cantidad de procesos
+    y cualquier partida se puede volver a jugar por separado a partir de la semilla guardada en los resultados.
+
+    Attributes:
+        __bots__: Los dos bots del torneo (objetos con un método choose_play(tablero, usa fichas blancas, dados)).
+        __bot_names__: Los nombres de los bots en el informe.
+        __num_workers__: La cantidad de procesos (1 = en el proceso actual, sin ProcessPoolExecutor).
+        __games_per_task__: La cantidad de partidas de cada tarea.
+        __max_plies__: La cantidad máxima de jugadas (plies) por partida; las partidas más largas quedan sin terminar.
+    """
+
+    def __init__(self, bots: tuple, bot_names: tuple[str, str] = ("bot_0", "bot_1"), num_workers: int | None = None,
+                 games_per_task: int = 1, max_plies: int = 2000):
+        """Inicializa una instancia del torneo.
+
+        Args:
+            bots: Los dos bots del torneo.
+            bot_names: Los nombres de los bots en el informe.
+            num_workers: La cantidad de procesos (por defecto, la cantidad de núcleos).
+            games_per_task: La cantidad de partidas de cada tarea (en los procesos, sus resultados
+                            se escriben al terminar la tarea).
+            max_plies: La cantidad máxima de jugadas (plies) por partida.
+        """
+        if games_per_task < 1:
+            raise ValueError("Cada tarea debe tener al menos una partida.")
+        if len(bots) != 2 or len(bot_names) != 2 or bot_names[0] == bot_names[1]:
+            raise ValueError("El torneo necesita dos bots con nombres distintos.")
+        self.__bots__ = tuple(bots)
+        self.__bot_names__ = tuple(bot_names)
+        self.__num_workers__ = num_workers if num_workers is not None else (cpu_count() or 1)
+        self.__games_per_task__ = games_per_task
+        self.__max_plies__ = max_plies
+
+    @staticmethod
+    def play_game(bots: tuple, game_num: int, seed: int, max_plies: int) -> dict:
+        """Juega una partida completa entre dos bots.
+
+        Args:
+            bots: Los dos bots (el primero usa fichas blancas en las partidas pares).
+            game_num: El número de la partida dentro del torneo.
+            seed: La semilla del torneo.
+            max_plies: La cantidad máxima de jugadas (plies) de la partida.
+        Returns:
+            dict: "game" (número de partida), "seed" (semilla de los dados, para repetir la partida
+            con BackgammonGame(seed=...)), "white" (índice del bot con fichas blancas),
+            "winner" (índice del bot ganador, None si la partida no terminó),
+            "win_type" (1 simple, 2 gammon, 3 backgammon, 0 si no terminó) y "plies" (jugadas realizadas).
+        """
+        white_bot = game_num % 2
+        game_seed = DiceSource.game_seed(seed, game_num)
+        game = BackgammonGame(seed=game_seed)
+        game.start_dice_roll()
+        plies = 0
+        while plies < max_plies:
+            uses_white_checkers = game.player_playing.uses_white_checkers
+            game.play_bot_turn(bots[white_bot if uses_white_checkers else 1 - white_bot])
+            plies += 1
+            if game.board.is_match_won()[0]:
+                return {"game": game_num, "seed": game_seed, "white": white_bot,
+                        "winner": white_bot if uses_white_checkers else 1 - white_bot,
+                        "win_type": game.board.get_win_type(uses_white_checkers), "plies": plies}
+            game.change_turn()
+        return {"game": game_num, "seed": game_seed, "white": white_bot, "winner": None, "win_type": 0,
+                "plies": plies}
+
+    @staticmethod
+    def play_games(bots: tuple, first_game_num: int, num_games: int, seed: int, max_plies: int) -> list[dict]:
+        """Juega varias partidas consecutivas (se ejecuta en los procesos).
+
+        Args:
+            bots: Los dos bots.
+            first_game_num: El número de la primera partida.
+            num_games: La cantidad de partidas a jugar.
+            seed: La semilla del torneo.
+            max_plies: La cantidad máxima de jugadas (plies) por partida.
+        Returns:
+            list: Los resultados de cada partida (ver play_game()).
+        """
+        return [TournamentRunner.play_game(bots, game_num, seed, max_plies)
+                for game_num in range(first_game_num, first_game_num + num_games)]
+
+    def run(self, num_games: int, output_path: str | None = None, seed: int = 0) -> dict:
+        """Juega el torneo.
+
+        Args:
+            num_games: La cantidad de partidas a jugar.
+            output_path: El archivo donde se escribe el resultado de cada partida en cuanto termina
+                    (una línea JSON por partida, en el orden en que terminan; None = no se escriben).
+            seed: La semilla del torneo.
+        Returns:
+            dict: El informe del torneo (ver summarize()), más "seconds" y "games_per_second".
+        """
+        first_game_nums = range(0, num_games, self.__games_per_task__)
+        tasks = [(first_game_num, min(self.__games_per_task__, num_games - first_game_num))
+                 for first_game_num in first_game_nums]
+        results = []
+        output = open(output_path, "w", encoding="utf-8") if output_path is not None else None
+
+        def record(task_results: list[dict]):
+            results.extend(task_results)
+            if output is not None:
+                for game_result in task_results:
+                    output.write(json.dumps(game_result) + "\n")
+                output.flush()
+
+        start = perf_counter()
+        try:
+            if self.__num_workers__ <= 1:
+                for game_num in range(num_games):
+                    record([self.play_game(self.__bots__, game_num, seed, self.__max_plies__)])
+            else:
+                with ProcessPoolExecutor(max_workers=self.__num_workers__) as executor:
+                    futures = [executor.submit(self.play_games, self.__bots__, first_game_num, games, seed,
+                                               self.__max_plies__)
+                               for first_game_num, games in tasks]
+                    for future in as_completed(futures):
+                        record(future.result())
+        finally:
+            if output is not None:
+                output.close()
+        seconds = perf_counter() - start
+
+        summary = self.summarize(results, self.__bot_names__)
+        summary["seconds"] = seconds
+        summary["games_per_second"] = num_games / seconds if seconds > 0 else 0.0
+        return summary
+
+    @staticmethod
+    def summarize(results: list[dict], bot_names: tuple[str, str]) -> dict:
+        """Calcula el informe de un torneo a partir de los resultados de las partidas.
+
+        Args:
+            results: Los resultados de cada partida (ver play_game()).
+            bot_names: Los nombres de los bots.
+        Returns:
+            dict: "games", "unfinished" (partidas que alcanzaron el máximo de jugadas), "average_plies"
+            y, por nombre de bot, "wins", "win_rate", "gammon_rate" y "backgammon_rate"
+            (sobre el total de partidas; los gammons incluyen los backgammons).
+        """
+        games = len(results)
+        summary = {
+            "games": games,
+            "unfinished": sum(1 for game_result in results if game_result["winner"] is None),
+            "average_plies": sum(game_result["plies"] for game_result in results) / games if games else 0.0,
+        }
+        for bot_num, bot_name in enumerate(bot_names):
+            won = [game_result for game_result in results if game_result["winner"] == bot_num]
+            gammons = sum(1 for game_result in won if game_result["win_type"] >= 2)
+            backgammons = sum(1 for game_result in won if game_result["win_type"] == 3)
+            summary[bot_name] = {
+                "wins": len(won),
+                "win_rate": len(won) / games if games else 0.0,
+                "gammon_rate": gammons / games if games else 0.0,
+                "backgammon_rate": backgammons / games if games else 0.0,
+            }
+        return summary
+
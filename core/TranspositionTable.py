@@ -0,0 +1,116 @@
+import threading
+from collections import OrderedDict
+
+
+class TranspositionTable:
+    """Representa una tabla de transposición acotada.
+
+    Guarda resultados ya calculados (ej.: jugadas legales o evaluaciones)
+    asociados a una clave de posición, para no tener que recalcularlos.
+    Cuando se alcanza la cantidad máxima de entradas, se desaloja
+    la entrada usada hace más tiempo (LRU).
+
+    La tabla se puede compartir entre hilos (ej.: el motor de análisis y la interfaz):
+    cada búsqueda también reordena las entradas, por lo que las operaciones se hacen con un lock.
+
+    Attributes:
+        __max_entries__: La cantidad máxima de entradas de la tabla.
+        __entries__: Un diccionario ordenado (del uso más antiguo al más reciente) con las entradas.
+        __hits__: La cantidad de búsquedas que encontraron un resultado.
+        __misses__: La cantidad de búsquedas que no encontraron un resultado.
+        __lock__: El lock que protege las entradas y los contadores (no se serializa).
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        """Inicializa una instancia de la tabla de transposición.
+
+        Args:
+            max_entries: La cantidad máxima de entradas de la tabla.
+        """
+        if max_entries < 1:
+            raise ValueError("La tabla de transposición debe tener al menos una entrada.")
+        self.__max_entries__ = max_entries
+        self.__entries__ = OrderedDict()
+        self.__hits__ = 0
+        self.__misses__ = 0
+        self.__lock__ = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Serializa la tabla (pickle) sin el lock."""
+        state = self.__dict__.copy()
+        del state["__lock__"]
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restaura la tabla serializada con un lock nuevo."""
+        self.__dict__.update(state)
+        self.__lock__ = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        """La cantidad máxima de entradas de la tabla."""
+        return self.__max_entries__
+
+    @property
+    def hits(self) -> int:
+        """La cantidad de búsquedas que encontraron un resultado."""
+        return self.__hits__
+
+    @property
+    def misses(self) -> int:
+        """La cantidad de búsquedas que no encontraron un resultado."""
+        return self.__misses__
+
+    def __len__(self) -> int:
+        """La cantidad de entradas guardadas en la tabla."""
+        return len(self.__entries__)
+
+    @staticmethod
+    def make_key(zobrist_hash: int, uses_white_checkers: bool, dice_numbers: tuple[int, ...]) -> tuple:
+        """Genera la clave de una posición y una tirada de dados.
+
+        Args:
+            zobrist_hash: El hash Zobrist de la posición.
+            uses_white_checkers: Indica si el jugador que mueve usa fichas blancas.
+            dice_numbers: Una tupla de números representando los dados (los 0 se ignoran).
+        Returns:
+            tuple: La clave (hash, jugador, dados ordenados).
+        """
+        return zobrist_hash, uses_white_checkers, tuple(sorted(num for num in dice_numbers if num > 0))
+
+    def get(self, key) -> object | None:
+        """Busca el resultado guardado para una clave.
+
+        Args:
+            key: La clave a buscar.
+        Returns:
+            El resultado guardado, o None si la clave no está en la tabla.
+        """
+        with self.__lock__:
+            entry = self.__entries__.get(key)
+            if entry is None:
+                self.__misses__ += 1
+                return None
+            self.__hits__ += 1
+            self.__entries__.move_to_end(key)
+            return entry
+
+    def store(self, key, value):
+        """Guarda un resultado para una clave, desalojando la entrada menos usada si la tabla está llena.
+
+        Args:
+            key: La clave del resultado.
+            value: El resultado a guardar (debe ser inmutable).
+        """
+        with self.__lock__:
+            self.__entries__[key] = value
+            self.__entries__.move_to_end(key)
+            if len(self.__entries__) > self.__max_entries__:
+                self.__entries__.popitem(last=False)
+
+    def clear(self):
+        """Vacía la tabla y reinicia los contadores."""
+        with self.__lock__:
+            self.__entries__.clear()
+            self.__hits__ = 0
+            self.__misses__ = 0
@@ -0,0 +1,16 @@
+"""Genera la base de datos de retiro de un solo lado (BearOffDatabase).
+
+Uso (desde la raíz del repositorio):
+    python -m scripts.generate_bearoff_database <archivo> [cantidad máxima de fichas]
+"""
+import sys
+
+from core.BearOffDatabase import BearOffDatabase
+
+
+def main(path: str, max_checkers: int = 15):
+    BearOffDatabase.generate(path, max_checkers)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 15)
@@ -0,0 +1,16 @@
+"""Genera el libro de aperturas (OpeningBook) con el bot por defecto.
+
+Uso (desde la raíz del repositorio):
+    python -m scripts.generate_opening_book <archivo> [cantidad de plies]
+"""
+import sys
+
+from core.OpeningBook import OpeningBook
+
+
+def main(path: str, max_plies: int = 2):
+    OpeningBook.generate(path, max_plies=max_plies)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 2)
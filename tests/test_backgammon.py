@@ -1,5 +1,6 @@
 import unittest
 from core.BackgammonGame import BackgammonGame
+from core.Board import Board
 
 
 class TestBackgammonGame(unittest.TestCase):
@@ -80,6 +81,107 @@ class TestBackgammonGame(unittest.TestCase):
         self.assertEqual(result, "ABC123")
         self.assertEqual(self.game.__white_player__.name, "ABC123")
 
+    def test_play_bot_turn(self):
+        """Verifica que el turno de un bot tira los dados y aplica la jugada elegida en el tablero."""
+        from core.ExpectiminimaxBot import ExpectiminimaxBot
+        self.game.start_dice_roll()
+        pip_counts = tuple(self.game.board.pip_counts)
+        player_num = 0 if self.game.player_playing.uses_white_checkers else 1
+        play = self.game.play_bot_turn(ExpectiminimaxBot(max_depth=1))
+        self.assertIn(len(self.game.dices_values), (2, 4))
+        self.assertEqual(pip_counts[player_num] - self.game.board.pip_counts[player_num],
+                         sum(dice_number for _, dice_number in play))
+
+    def test_roll_dices_reuses_dice_objects(self):
+        """Verifica que cada tirada reutiliza los mismos dados y toma los valores de la fuente inyectada."""
+        from core.DiceSource import DiceSource
+        game = BackgammonGame(DiceSource(4))
+        expected_source = DiceSource(4)
+        dice_ids = set()
+        for _ in range(20):
+            dices = game.roll_dices(True)
+            self.assertEqual((dices[0].dice_number, dices[1].dice_number), expected_source.next_pair())
+            dice_ids |= set(map(id, dices))
+        self.assertEqual(len(dice_ids), 2)
+
+    def test_seed(self):
+        """Verifica que cada partida tiene una semilla para poder repetirla."""
+        self.assertIsInstance(self.game.seed, int)
+        self.assertNotEqual(self.game.seed, BackgammonGame().seed)
+        self.assertEqual(BackgammonGame(seed=7).seed, 7)
+        self.assertEqual(BackgammonGame(seed=7).roll_dices(True)[0].dice_number,
+                         BackgammonGame(seed=7).roll_dices(True)[0].dice_number)
+
+    def test_game_without_numpy(self):
+        """Verifica que se puede jugar sin NumPy, con los dados del módulo random y sin semilla."""
+        import os
+        import subprocess
+        import sys
+        code = ("import sys; sys.modules['numpy'] = None\n"
+                "from core.BackgammonGame import BackgammonGame\n"
+                "game = BackgammonGame()\n"
+                "game.start_dice_roll()\n"
+                "game.roll_dices()\n"
+                "assert game.seed is None and len(game.dices_values) in (2, 4)\n")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=root)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_game_record_turns(self):
+        """Verifica que el registro guarda una jugada por turno, incluidos los turnos sin movimientos."""
+        from core.ExpectiminimaxBot import ExpectiminimaxBot
+        game = BackgammonGame(seed=3)
+        game.start_dice_roll()
+        first_play = game.play_bot_turn(ExpectiminimaxBot(max_depth=1))
+        self.assertEqual(game.game_record.plays, (first_play,))
+        game.change_turn()
+        game.change_turn()
+        self.assertEqual(game.game_record.plays, (first_play, ()))
+        self.assertIsNone(game.game_record.result)
+
+    def test_human_move_hits_on_intermediate_point(self):
+        """Verifica que un movimiento con dos dados come la ficha solitaria del punto intermedio
+        y se registra de a un dado."""
+        from unittest.mock import patch
+        from core.InputType import InputType
+        points = [0] * 26
+        points[1] = 1
+        points[2] = -1
+        points[4] = -2
+        self.game.board.load_points(points)
+        self.game.__player_playing__ = self.game.__white_player__
+        self.game.__dices_values__ = [1, 3]
+        with patch.object(self.game, "get_user_input",
+                          side_effect=[(InputType.NORMAL_INDEX, 1), (InputType.NORMAL_INDEX, 5)]):
+            self.game.selected_checker_move(self.game.checker_selection())
+        self.assertEqual(self.game.board.points[5], 1)
+        self.assertEqual(self.game.board.points[Board.BLACK_BAR_POINT], -1)
+        self.assertEqual(self.game.game_record.plays, (((1, 1), (2, 3)),))
+
+    def test_human_game_replay(self):
+        """Verifica que una partida jugada con la selección de fichas del usuario se puede repetir."""
+        from random import Random
+        from unittest.mock import patch
+        from core.InputType import InputType
+        rng = Random(8)
+        game = BackgammonGame(seed=21)
+        game.start_dice_roll()
+        for _ in range(40):
+            game.roll_dices()
+            uses_white_checkers = game.player_playing.uses_white_checkers
+            play = rng.choice(game.board.generate_legal_plays(uses_white_checkers, game.dices_values))
+            for normal_origin, dice_number in play:
+                with patch.object(game, "get_user_input",
+                                  side_effect=[(InputType.NORMAL_INDEX, normal_origin),
+                                               (InputType.NORMAL_INDEX, normal_origin + dice_number)]):
+                    game.selected_checker_move(game.checker_selection())
+            if game.board.is_match_won()[0]:
+                break
+            game.change_turn()
+        record = game.game_record
+        self.assertTrue(record.verify())
+        self.assertEqual(record.replay().position, game.board.export_position())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from random import Random
+
+import numpy as np
+
+from core.BatchMoveGenerator import BatchMoveGenerator
+from core.Board import Board
+
+
+class TestBatchMoveGenerator(unittest.TestCase):
+    """Conjunto de pruebas para la clase BatchMoveGenerator."""
+
+    @staticmethod
+    def random_positions(num_games: int, seed: int) -> list:
+        """Genera posiciones (arreglo de puntos, usa fichas blancas) jugando partidas aleatorias."""
+        rng = Random(seed)
+        positions = []
+        for _ in range(num_games):
+            board = Board()
+            uses_white_checkers = rng.random() < 0.5
+            for _ in range(200):
+                positions.append((tuple(board.points), uses_white_checkers))
+                dice = (rng.randint(1, 6), rng.randint(1, 6))
+                if dice[0] == dice[1]:
+                    dice = dice * 2
+                board.apply_play(rng.choice(board.generate_legal_plays(uses_white_checkers, dice)),
+                                 uses_white_checkers)
+                if any(board.is_match_won()):
+                    break
+                uses_white_checkers = not uses_white_checkers
+        return positions
+
+    def test_compute_legal_moves_matches_board(self):
+        """Verifica que los movimientos del lote coinciden con Board.get_legal_single_moves()."""
+        positions = self.random_positions(6, seed=11)
+        rng = Random(3)
+        dice = np.array([(rng.randint(1, 6), rng.randint(1, 6)) for _ in positions])
+        points = np.array([points for points, _ in positions], dtype=np.int8)
+        uses_white = np.array([uses_white_checkers for _, uses_white_checkers in positions])
+
+        legal_moves = BatchMoveGenerator.compute_legal_moves(points, dice, uses_white)
+        self.assertEqual(legal_moves.shape, (len(positions), 2, 25))
+
+        board = Board()
+        for index, (position_points, uses_white_checkers) in enumerate(positions):
+            board.load_points(position_points)
+            for dice_slot in range(2):
+                self.assertEqual(BatchMoveGenerator.get_legal_origins(legal_moves, index, dice_slot),
+                                 board.get_legal_single_moves(uses_white_checkers, int(dice[index, dice_slot])),
+                                 f"posición {index}, dado {dice_slot}")
+
+    def test_compute_legal_moves_bar_entry(self):
+        """Verifica que con fichas en la barra solo se puede ingresar desde la barra."""
+        points = list(Board.NEW_GAME_POINTS)
+        points[1] = 1
+        points[0] = 1
+        legal_moves = BatchMoveGenerator.compute_legal_moves(np.array([points]), np.array([[6, 3]]), True)
+        # El índice normal 6 de las blancas está tomado por las negras
+        self.assertEqual(BatchMoveGenerator.get_legal_origins(legal_moves, 0, 0), ())
+        self.assertEqual(BatchMoveGenerator.get_legal_origins(legal_moves, 0, 1), (0,))
+
+    def test_compute_legal_moves_used_die(self):
+        """Verifica que un dado ya usado (0) no genera movimientos."""
+        legal_moves = BatchMoveGenerator.compute_legal_moves(np.array([Board.NEW_GAME_POINTS]),
+                                                             np.array([[0, 1]]), False)
+        self.assertFalse(legal_moves[0, 0].any())
+        self.assertTrue(legal_moves[0, 1].any())
+
+    def test_compute_legal_moves_invalid_shape(self):
+        """Verifica que se rechazan arreglos de dados con una forma incorrecta."""
+        with self.assertRaises(ValueError):
+            BatchMoveGenerator.compute_legal_moves(np.array([Board.NEW_GAME_POINTS]), np.array([1, 2]), True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from math import comb
+
+from core.BearOffDatabase import BearOffDatabase
+from core.Board import Board
+
+
+class TestBearOffDatabase(unittest.TestCase):
+    """Conjunto de pruebas para la clase BearOffDatabase."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Genera una base de datos pequeña (hasta 4 fichas) compartida por todas las pruebas."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "bearoff.db")
+        BearOffDatabase.generate(cls.path, max_checkers=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Borra la base de datos generada."""
+        cls.directory.cleanup()
+
+    def setUp(self):
+        """Abre la base de datos para cada prueba."""
+        self.database = BearOffDatabase(self.path)
+
+    def tearDown(self):
+        """Cierra la base de datos."""
+        self.database.close()
+
+    def test_position_index_is_a_bijection(self):
+        """Verifica que cada distribución tiene un índice distinto dentro del rango del archivo."""
+        positions = BearOffDatabase.enumerate_positions(4)
+        indexes = {BearOffDatabase.position_index(position, 4) for position in positions}
+        self.assertEqual(len(positions), comb(10, 6))
+        self.assertEqual(indexes, set(range(comb(10, 6))))
+        self.assertEqual(len(self.database), comb(10, 6))
+
+    def test_position_index_too_many_checkers(self):
+        """Verifica que no se puede buscar una distribución con más fichas que la base de datos."""
+        with self.assertRaises(ValueError):
+            BearOffDatabase.position_index((5, 0, 0, 0, 0, 0), 4)
+
+    def test_known_values(self):
+        """Verifica valores conocidos de la cantidad de tiradas."""
+        self.assertEqual(self.database.expected_rolls((0, 0, 0, 0, 0, 0)), 0.0)
+        self.assertEqual(self.database.expected_rolls((2, 0, 0, 0, 0, 0)), 1.0)
+        # Una ficha a 6 pips se retira en una tirada con 27 de las 36 tiradas
+        distribution = self.database.rolls_distribution((0, 0, 0, 0, 0, 1))
+        self.assertAlmostEqual(distribution[1], 27 / 36, places=4)
+
+    def test_distributions_are_consistent(self):
+        """Verifica que las distribuciones suman 1 y coinciden con la cantidad esperada de tiradas."""
+        for position in BearOffDatabase.enumerate_positions(4):
+            distribution = self.database.rolls_distribution(position)
+            self.assertAlmostEqual(sum(distribution), 1.0, places=3)
+            self.assertAlmostEqual(sum(rolls * probability for rolls, probability in enumerate(distribution)),
+                                   self.database.expected_rolls(position), places=2)
+
+    def test_invalid_file(self):
+        """Verifica que se rechazan archivos que no son bases de datos de retiro de fichas."""
+        invalid_path = os.path.join(self.directory.name, "invalid.db")
+        with open(invalid_path, "wb") as file:
+            file.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            BearOffDatabase(invalid_path)
+
+    def test_board_queries(self):
+        """Verifica las consultas a partir de un tablero en el que ambos jugadores están retirando fichas."""
+        points = [0] * 26
+        points[24] = 1  # Blancas: una ficha a 1 pip
+        points[22] = 2  # Blancas: dos fichas a 3 pips
+        points[6] = -4  # Negras: cuatro fichas a 6 pips
+        board = Board()
+        board.load_points(points)
+        self.assertEqual(BearOffDatabase.get_home_counts(board, True), (1, 0, 2, 0, 0, 0))
+        self.assertEqual(BearOffDatabase.get_home_counts(board, False), (0, 0, 0, 0, 0, 4))
+        self.assertGreater(self.database.win_probability(board, True), 0.9)
+
+        best_play = self.database.best_play(board, True, (2, 1))
+        self.assertIn(best_play, board.generate_legal_plays(True, (2, 1)))
+        board.apply_play(best_play, True)
+        # La mejor jugada retira la ficha a 1 pip y deja una ficha a 1 pip y otra a 3 pips
+        self.assertEqual(BearOffDatabase.get_home_counts(board, True), (1, 0, 1, 0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from random import Random
 
 from core.Board import Board
 
@@ -30,7 +31,6 @@ class TestBoard(unittest.TestCase):
         # Se crea un tablero personalizado.
         custom_triangle = [9, 0, "○"]
         self.board.replace_triangle(1, True, custom_triangle)
-        self.board.select_checker(1, True)
         self.board.__board_bar__ = [2, 3]
         self.board.__is_bar_empty__ = [False, False]
 
@@ -42,7 +42,6 @@ class TestBoard(unittest.TestCase):
                              self.default_top_board)
         self.assertListEqual(self.board.__bot_board_triangles__,
                              self.default_bot_board)
-        self.assertIsNone(self.board.selected_checker)
         self.assertListEqual(self.board.__board_bar__,
                              self.default_board_bar)
         self.assertListEqual(self.board.__is_bar_empty__,
@@ -74,8 +73,8 @@ class TestBoard(unittest.TestCase):
 
     def test_replace_triangle(self):
         """Verifica que un solo triángulo se reemplaza correctamente."""
-        new_triangle_top = [1, 2, "●"]
-        new_triangle_bot = [2, 2, "○"]
+        new_triangle_top = [1, 0, "●"]
+        new_triangle_bot = [2, 0, "○"]
 
         # Reemplaza un triángulo en el tablero superior (perspectiva de blancas)
         self.board.replace_triangle(1, True, new_triangle_top)
@@ -89,8 +88,8 @@ class TestBoard(unittest.TestCase):
 
     def test_replace_multiple_triangles(self):
         """Verifica que múltiples triángulos se reemplazan correctamente en una llamada."""
-        new_triangle1 = [1, 1, "○"]
-        new_triangle2 = [2, 2, "●"]
+        new_triangle1 = [1, 0, "○"]
+        new_triangle2 = [2, 0, "●"]
         new_triangle3 = [3, 0, "●"]
 
         replacements = [
@@ -321,54 +320,6 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(self.board.__board_bar__[1], 0)
         self.assertTrue(self.board.__is_bar_empty__[1])
 
-    def test_select_checker_valid_white_top(self):
-        """Verifica select_checker() para seleccionar una ficha blanca válida en la parte superior."""
-        # El índice 1 para blancas corresponde al triángulo superior índice 11
-        result = self.board.select_checker(1, True)
-        self.assertTrue(result)
-        self.assertEqual(self.board.selected_checker, 1)
-        self.assertEqual(self.board.__top_board_triangles__[11][1], 1)
-
-    def test_select_checker_valid_white_bot(self):
-        """Verifica select_checker() para seleccionar una ficha blanca válida en la parte inferior."""
-        # El índice 19 para blancas corresponde al triángulo inferior índice 6
-        result = self.board.select_checker(19, True)
-        self.assertTrue(result)
-        self.assertEqual(self.board.selected_checker, 19)
-        self.assertEqual(self.board.__bot_board_triangles__[6][1], 1)
-
-    def test_select_checker_valid_black_top(self):
-        """Verifica select_checker() para seleccionar una ficha negra válida en la parte superior."""
-        # El índice 19 para negras corresponde al triángulo superior índice 6
-        result = self.board.select_checker(19, False)
-        self.assertTrue(result)
-        self.assertEqual(self.board.selected_checker, 19)
-        self.assertEqual(self.board.__top_board_triangles__[6][1], 1)
-
-    def test_select_checker_valid_black_bot(self):
-        """Verifica select_checker() para seleccionar una ficha negra válida en la parte inferior."""
-        # El índice 1 para negras corresponde al triángulo inferior índice 11
-        result = self.board.select_checker(1, False)
-        self.assertTrue(result)
-        self.assertEqual(self.board.selected_checker, 1)
-        self.assertEqual(self.board.__bot_board_triangles__[11][1], 1)
-
-    def test_select_checker_empty_triangle(self):
-        """Verifica select_checker() al intentar seleccionar en un triángulo vacío."""
-        # El triángulo 2 está vacío por defecto
-        result = self.board.select_checker(2, True)
-        self.assertFalse(result)
-        # Verifica que no se haya establecido selección
-        self.assertNotEqual(self.board.selected_checker, 2)
-
-    def test_select_checker_opponent_checker(self):
-        """Verifica select_checker() al intentar seleccionar una ficha del oponente."""
-        # El triángulo 5 tiene fichas negras (○) por defecto
-        result = self.board.select_checker(5, True)  # Blancas intentando seleccionar negras
-        self.assertFalse(result)
-        # Verifica que no se haya establecido selección
-        self.assertNotEqual(self.board.selected_checker, 5)
-
     def test_verify_player_can_take_out_white_default_board(self):
         """Verifica que el jugador blanco no puede retirar fichas en el tablero por defecto."""
         self.board.verify_player_can_take_out(True)
@@ -508,202 +459,10 @@ class TestBoard(unittest.TestCase):
     def test_get_triangle_from_normal_modified_triangle(self):
         """Verifica get_triangle_from_normal() después de modificar un triángulo."""
         # Modifica un triángulo y verifica que se obtenga correctamente
-        new_triangle = [3, 1, "●"]
+        new_triangle = [3, 0, "●"]
         self.board.replace_triangle(1, True, new_triangle)
         self.assertEqual(self.board.get_triangle_from_normal(1, True), new_triangle)
 
-    def test_deselect_checker_no_selection(self):
-        """Verifica deselect_checker() cuando no hay ficha seleccionada."""
-        # Sin selección previa
-        self.assertIsNone(self.board.selected_checker)
-        # El método debería devolver False si no hay selección
-        result = self.board.deselect_checker(True)
-        self.assertFalse(result)
-
-    def test_deselect_checker_with_selection_white(self):
-        """Verifica deselect_checker() para fichas blancas con selección previa."""
-        # Selecciona una ficha blanca
-        self.board.select_checker(1, True)
-        self.assertEqual(self.board.selected_checker, 1)
-        # Verifica que esté marcada como seleccionada
-        triangle = self.board.get_triangle_from_normal(1, True)
-        self.assertEqual(triangle[1], 1)
-        # Deselecciona
-        result = self.board.deselect_checker(True)
-        self.assertTrue(result)
-        # Verifica que ya no esté seleccionada
-        triangle = self.board.get_triangle_from_normal(1, True)
-        self.assertEqual(triangle[1], 0)
-        self.assertIsNone(self.board.selected_checker)
-
-    def test_deselect_checker_with_selection_black(self):
-        """Verifica deselect_checker() para fichas negras con selección previa."""
-        # Selecciona una ficha negra
-        self.board.select_checker(1, False)
-        self.assertEqual(self.board.selected_checker, 1)
-        # Verifica que esté marcada como seleccionada
-        triangle = self.board.get_triangle_from_normal(1, False)
-        self.assertEqual(triangle[1], 1)
-        # Deselecciona
-        result = self.board.deselect_checker(False)
-        self.assertTrue(result)
-        # Verifica que ya no esté seleccionada
-        triangle = self.board.get_triangle_from_normal(1, False)
-        self.assertEqual(triangle[1], 0)
-        self.assertIsNone(self.board.selected_checker)
-
-    def test_deselect_checker_wrong_player(self):
-        """Verifica deselect_checker() cuando el jugador no coincide con la selección."""
-        # Selecciona con blancas
-        self.board.select_checker(1, True)
-        # Intenta deseleccionar con negras
-        result = self.board.deselect_checker(False)
-        self.assertFalse(result)
-        # Verifica que siga seleccionada
-        self.assertEqual(self.board.selected_checker, 1)
-        triangle = self.board.get_triangle_from_normal(1, True)
-        self.assertEqual(triangle[1], 1)
-
-    def test_clean_selection_single_triangle_white(self):
-        """Verifica clean_selection() para deseleccionar un solo triángulo con fichas blancas."""
-        # Selecciona un triángulo blanco
-        self.board.select_checker(1, True)
-        triangle = self.board.get_triangle_from_normal(1, True)
-        self.assertEqual(triangle[1], 1)
-
-        # Deselecciona el triángulo
-        self.board.clean_selection((1,), True)
-        triangle = self.board.get_triangle_from_normal(1, True)
-        self.assertEqual(triangle[1], 0)
-
-    def test_clean_selection_single_triangle_black(self):
-        """Verifica clean_selection() para deseleccionar un solo triángulo con fichas negras."""
-        # Selecciona un triángulo negro
-        self.board.select_checker(1, False)
-        triangle = self.board.get_triangle_from_normal(1, False)
-        self.assertEqual(triangle[1], 1)
-
-        # Deselecciona el triángulo
-        self.board.clean_selection((1,), False)
-        triangle = self.board.get_triangle_from_normal(1, False)
-        self.assertEqual(triangle[1], 0)
-
-    def test_clean_selection_multiple_triangles_white(self):
-        """Verifica clean_selection() para deseleccionar múltiples triángulos con fichas blancas."""
-        # Selecciona varios triángulos blancos
-        self.board.select_checker(1, True)
-        self.board.select_checker(19, True)
-        self.assertEqual(self.board.get_triangle_from_normal(1, True)[1], 1)
-        self.assertEqual(self.board.get_triangle_from_normal(19, True)[1], 1)
-
-        # Deselecciona los triángulos
-        self.board.clean_selection((1, 19), True)
-        self.assertEqual(self.board.get_triangle_from_normal(1, True)[1], 0)
-        self.assertEqual(self.board.get_triangle_from_normal(19, True)[1], 0)
-
-    def test_clean_selection_multiple_triangles_black(self):
-        """Verifica clean_selection() para deseleccionar múltiples triángulos con fichas negras."""
-        # Selecciona varios triángulos negros
-        self.board.select_checker(1, False)
-        self.board.select_checker(19, False)
-        self.assertEqual(self.board.get_triangle_from_normal(1, False)[1], 1)
-        self.assertEqual(self.board.get_triangle_from_normal(19, False)[1], 1)
-
-        # Deselecciona los triángulos
-        self.board.clean_selection((1, 19), False)
-        self.assertEqual(self.board.get_triangle_from_normal(1, False)[1], 0)
-        self.assertEqual(self.board.get_triangle_from_normal(19, False)[1], 0)
-
-    def test_clean_selection_empty_tuple_white(self):
-        """Verifica clean_selection() con una tupla vacía para fichas blancas."""
-        # No hay cambios esperados
-        original_top = [triangle[:] for triangle in self.board.__top_board_triangles__]
-        self.board.clean_selection((), True)
-        self.assertEqual(self.board.__top_board_triangles__, original_top)
-
-    def test_clean_selection_empty_tuple_black(self):
-        """Verifica clean_selection() con una tupla vacía para fichas negras."""
-        # No hay cambios esperados
-        original_bot = [triangle[:] for triangle in self.board.__bot_board_triangles__]
-        self.board.clean_selection((), False)
-        self.assertEqual(self.board.__bot_board_triangles__, original_bot)
-
-    def test_clean_selection_already_deselected_white(self):
-        """Verifica clean_selection() en triángulos ya deseleccionados con fichas blancas."""
-        # Los triángulos por defecto no están seleccionados
-        triangle = self.board.get_triangle_from_normal(2, True)
-        self.assertEqual(triangle[1], 0)
-
-        # Deseleccionar no debería cambiar nada
-        self.board.clean_selection((2,), True)
-        triangle = self.board.get_triangle_from_normal(2, True)
-        self.assertEqual(triangle[1], 0)
-
-    def test_clean_selection_already_deselected_black(self):
-        """Verifica clean_selection() en triángulos ya deseleccionados con fichas negras."""
-        # Los triángulos por defecto no están seleccionados
-        triangle = self.board.get_triangle_from_normal(2, False)
-        self.assertEqual(triangle[1], 0)
-
-        # Deseleccionar no debería cambiar nada
-        self.board.clean_selection((2,), False)
-        triangle = self.board.get_triangle_from_normal(2, False)
-        self.assertEqual(triangle[1], 0)
-
-    def test_clean_selection_mixed_selected_deselected_white(self):
-        """Verifica clean_selection() con mezcla de triángulos seleccionados y deseleccionados para blancas."""
-        # Selecciona uno, deja otro deseleccionado
-        self.board.select_checker(1, True)
-        self.assertEqual(self.board.get_triangle_from_normal(1, True)[1], 1)
-        self.assertEqual(self.board.get_triangle_from_normal(2, True)[1], 0)
-
-        # Deselecciona ambos
-        self.board.clean_selection((1, 2), True)
-        self.assertEqual(self.board.get_triangle_from_normal(1, True)[1], 0)
-        self.assertEqual(self.board.get_triangle_from_normal(2, True)[1], 0)
-
-    def test_clean_selection_mixed_selected_deselected_black(self):
-        """Verifica clean_selection() con mezcla de triángulos seleccionados y deseleccionados para negras."""
-        # Selecciona uno, deja otro deseleccionado
-        self.board.select_checker(1, False)
-        self.assertEqual(self.board.get_triangle_from_normal(1, False)[1], 1)
-        self.assertEqual(self.board.get_triangle_from_normal(2, False)[1], 0)
-
-        # Deselecciona ambos
-        self.board.clean_selection((1, 2), False)
-        self.assertEqual(self.board.get_triangle_from_normal(1, False)[1], 0)
-        self.assertEqual(self.board.get_triangle_from_normal(2, False)[1], 0)
-
-    def test_clean_selection_does_not_affect_other_triangles_white(self):
-        """Verifica que clean_selection() no afecte otros triángulos para fichas blancas."""
-        # Selecciona dos triángulos
-        self.board.select_checker(1, True)
-        self.board.select_checker(19, True)
-        self.assertEqual(self.board.get_triangle_from_normal(1, True)[1], 1)
-        self.assertEqual(self.board.get_triangle_from_normal(19, True)[1], 1)
-        self.assertEqual(self.board.get_triangle_from_normal(2, True)[1], 0)
-
-        # Deselecciona solo uno
-        self.board.clean_selection((1,), True)
-        self.assertEqual(self.board.get_triangle_from_normal(1, True)[1], 0)
-        self.assertEqual(self.board.get_triangle_from_normal(19, True)[1], 1)  # Aún seleccionado
-        self.assertEqual(self.board.get_triangle_from_normal(2, True)[1], 0)
-
-    def test_clean_selection_does_not_affect_other_triangles_black(self):
-        """Verifica que clean_selection() no afecte otros triángulos para fichas negras."""
-        # Selecciona dos triángulos
-        self.board.select_checker(1, False)
-        self.board.select_checker(19, False)
-        self.assertEqual(self.board.get_triangle_from_normal(1, False)[1], 1)
-        self.assertEqual(self.board.get_triangle_from_normal(19, False)[1], 1)
-        self.assertEqual(self.board.get_triangle_from_normal(2, False)[1], 0)
-
-        # Deselecciona solo uno
-        self.board.clean_selection((1,), False)
-        self.assertEqual(self.board.get_triangle_from_normal(1, False)[1], 0)
-        self.assertEqual(self.board.get_triangle_from_normal(19, False)[1], 1)  # Aún seleccionado
-        self.assertEqual(self.board.get_triangle_from_normal(2, False)[1], 0)
-
     def test_take_out_checker_white(self):
         """Verifica take_out_checker() para retirar una ficha blanca."""
         initial_off = self.board.__checkers_off__[0]
@@ -793,6 +552,369 @@ class TestBoard(unittest.TestCase):
         self.assertTrue(won, "Debería haber un ganador.")
         self.assertTrue(white_won, "Debería ganar el blanco primero en orden de verificación.")
 
+    def test_points_default_board(self):
+        """Verifica que el arreglo de puntos representa el tablero inicial."""
+        self.assertEqual(tuple(self.board.points), Board.NEW_GAME_POINTS)
+        self.assertEqual(len(self.board.points), 26)
+        self.assertEqual(sum(v for v in self.board.points if v > 0), 15)
+        self.assertEqual(sum(-v for v in self.board.points if v < 0), 15)
+
+    def test_points_view_after_capture(self):
+        """Verifica que los triángulos y la barra se generan desde el arreglo de puntos tras una captura."""
+        self.board.replace_triangle(2, True, [1, 0, "○"])
+        self.board.move_checker(1, 2, True)
+        self.assertEqual(self.board.points[2], 1)
+        self.assertEqual(self.board.points[Board.BLACK_BAR_POINT], -1)
+        self.assertEqual(self.board.board_bar, [0, 1])
+        self.assertEqual(self.board.top_board_triangles[10], [1, 0, "●"])
+
+    def test_copy_is_independent(self):
+        """Verifica que copy() duplica el estado sin compartir el arreglo de puntos."""
+        board_copy = self.board.copy()
+        board_copy.move_checker(1, 2, True)
+        board_copy.take_out_checker(19, True)
+        self.assertEqual(tuple(self.board.points), Board.NEW_GAME_POINTS)
+        self.assertEqual(self.board.checkers_off, [0, 0])
+        self.assertEqual(board_copy.points[2], 1)
+        self.assertEqual(board_copy.checkers_off, [1, 0])
+
+    def test_generate_legal_plays_opening_roll(self):
+        """Verifica generate_legal_plays() con una tirada de apertura (3-1)."""
+        plays = self.board.generate_legal_plays(True, (3, 1))
+        self.assertEqual(len(plays), 16)
+        # Ninguna jugada lleva a la misma posición final que otra
+        final_positions = set()
+        for play in plays:
+            board_copy = self.board.copy()
+            board_copy.apply_play(play, True)
+            final_positions.add(tuple(board_copy.points))
+        self.assertEqual(len(final_positions), len(plays))
+
+    def test_generate_legal_plays_bar_first(self):
+        """Verifica que generate_legal_plays() obliga a ingresar desde la barra antes de mover."""
+        self.board.replace_triangle(1, True, [1, 0, "●"])
+        self.board.add_checker_to_bar(False)
+        plays = self.board.generate_legal_plays(True, (6, 5))
+        self.assertTrue(plays)
+        for play in plays:
+            self.assertEqual(play[0], (0, 5))
+            self.assertEqual(len(play), 2)
+
+    def test_generate_legal_plays_must_use_larger_dice(self):
+        """Verifica que, si solo se puede usar un dado, se debe usar el mayor."""
+        points = [0] * 26
+        points[10] = 1
+        points[24] = 14
+        points[21] = -2
+        points[1] = -13
+        self.board.load_points(points)
+        self.assertEqual(self.board.generate_legal_plays(True, (5, 6)), (((10, 6),),))
+
+    def test_generate_legal_plays_no_moves(self):
+        """Verifica que generate_legal_plays() devuelve una jugada vacía si no se puede mover."""
+        self.board.replace_triangle(1, True, [1, 0, "●"])
+        self.board.add_checker_to_bar(False)
+        for normal_index in range(1, 7):
+            self.board.replace_triangle(normal_index, True, [2, 0, "○"])
+        self.assertEqual(self.board.generate_legal_plays(True, (6, 5)), ((),))
+
+    def test_generate_legal_plays_bear_off_with_larger_dice(self):
+        """Verifica el retiro de la ficha más atrasada con un dado mayor al necesario."""
+        points = [0] * 26
+        points[22] = 2
+        points[1] = -15
+        self.board.load_points(points)
+        self.assertEqual(self.board.generate_legal_plays(True, (6, 5)), (((22, 6), (22, 5)),))
+
+    def test_zobrist_hash_incremental_matches_full(self):
+        """Verifica que el hash Zobrist incremental coincide con el recalculado tras cada cambio."""
+        self.assertEqual(self.board.zobrist_hash, self.board.compute_zobrist_hash())
+        self.board.replace_triangle(2, True, [1, 0, "○"])
+        self.board.move_checker(1, 2, True)
+        self.assertEqual(self.board.zobrist_hash, self.board.compute_zobrist_hash())
+        self.board.move_checker(0, 3, False)
+        self.assertEqual(self.board.zobrist_hash, self.board.compute_zobrist_hash())
+        self.board.take_out_checker(19, True)
+        self.assertEqual(self.board.zobrist_hash, self.board.compute_zobrist_hash())
+
+    def test_zobrist_hash_same_position_same_hash(self):
+        """Verifica que la misma posición alcanzada por distintos caminos tiene el mismo hash."""
+        other_board = Board()
+        self.board.move_checker(12, 15, True)
+        self.board.move_checker(17, 18, True)
+        other_board.move_checker(17, 18, True)
+        other_board.move_checker(12, 15, True)
+        self.assertEqual(self.board.zobrist_hash, other_board.zobrist_hash)
+        self.assertNotEqual(self.board.zobrist_hash, Board().zobrist_hash)
+
+    def test_home_counters_follow_moves(self):
+        """Verifica que los contadores del área de retiro se actualizan en cada movimiento."""
+        self.assertEqual(self.board.home_checkers, [5, 5])
+        self.assertEqual(self.board.outside_home_checkers, [10, 10])
+        self.board.move_checker(17, 20, True)
+        self.assertEqual(self.board.home_checkers[0], 6)
+        self.assertEqual(self.board.outside_home_checkers[0], 9)
+        self.assertEqual(self.board.get_most_advanced_checker(True), 19)
+
+    def test_home_counters_bear_off_endgame(self):
+        """Verifica las consultas de retiro en O(1) durante el final de la partida."""
+        points = [0] * 26
+        points[21] = 2
+        points[24] = 1
+        points[1] = -15
+        self.board.load_points(points)
+        self.assertTrue(self.board.verify_player_can_take_out(True))
+        self.assertEqual(self.board.get_most_advanced_checker(True), 21)
+        self.board.take_out_checker(21, True)
+        self.board.take_out_checker(21, True)
+        self.assertEqual(self.board.get_most_advanced_checker(True), 24)
+        self.board.take_out_checker(24, True)
+        self.assertEqual(self.board.get_most_advanced_checker(True), -1)
+        self.assertEqual(self.board.home_checkers[0], 0)
+
+    def test_home_counters_match_full_scan_in_random_game(self):
+        """Verifica que los contadores incrementales coinciden con un recorrido completo durante una partida."""
+        rng = Random(5)
+        uses_white_checkers = True
+        for _ in range(60):
+            dice = (rng.randint(1, 6), rng.randint(1, 6))
+            if dice[0] == dice[1]:
+                dice = dice * 2
+            plays = self.board.generate_legal_plays(uses_white_checkers, dice)
+            self.board.apply_play(rng.choice(plays), uses_white_checkers)
+            for player_num, sign in ((0, 1), (1, -1)):
+                home_points = range(19, 25) if sign > 0 else range(1, 7)
+                home = sum(v * sign for p, v in enumerate(self.board.points) if p in home_points and v * sign > 0)
+                outside = sum(v * sign for p, v in enumerate(self.board.points)
+                              if p not in home_points and v * sign > 0)
+                self.assertEqual(self.board.home_checkers[player_num], home)
+                self.assertEqual(self.board.outside_home_checkers[player_num], outside)
+            self.assertEqual(self.board.zobrist_hash, self.board.compute_zobrist_hash())
+            if self.board.is_match_won()[0]:
+                break
+            uses_white_checkers = not uses_white_checkers
+
+    def board_state(self) -> tuple:
+        """Obtiene una instantánea de todo el estado de reglas del tablero (para comparar)."""
+        return (tuple(self.board.points), self.board.zobrist_hash, tuple(self.board.checkers_off),
+                tuple(self.board.__num_checkers_board_player__), tuple(self.board.is_bar_empty),
+                tuple(self.board.home_checkers), tuple(self.board.outside_home_checkers),
+                tuple(self.board.occupied_points_mask), tuple(self.board.held_points_mask),
+                tuple(self.board.blot_points_mask))
+
+    def test_make_unmake_move_with_capture_and_bar_entry(self):
+        """Verifica que unmake_move() restaura exactamente el estado tras una captura y un ingreso desde la barra."""
+        self.board.replace_triangle(2, True, [1, 0, "○"])
+        initial_state = self.board_state()
+        self.assertTrue(self.board.make_move(1, 1, True))
+        after_capture_state = self.board_state()
+        self.assertFalse(self.board.make_move(0, 3, False))
+        self.board.unmake_move()
+        self.assertEqual(self.board_state(), after_capture_state)
+        self.board.unmake_move()
+        self.assertEqual(self.board_state(), initial_state)
+
+    def test_make_unmake_play_with_bear_off(self):
+        """Verifica que unmake_play() restaura exactamente el estado tras retirar fichas."""
+        points = [0] * 26
+        points[20] = 2
+        points[23] = 1
+        points[3] = -15
+        self.board.load_points(points)
+        initial_state = self.board_state()
+        play = ((20, 6), (20, 5))
+        self.board.make_play(play, True)
+        self.assertEqual(self.board.checkers_off[0], 14)
+        self.board.unmake_play(play)
+        self.assertEqual(self.board_state(), initial_state)
+
+    def test_occupancy_masks_default_board(self):
+        """Verifica las máscaras de ocupación en el tablero por defecto."""
+        # Blancas en los puntos 1, 12, 17 y 19; negras en los puntos 6, 8, 13 y 24
+        white_mask = (1 << 0) | (1 << 11) | (1 << 16) | (1 << 18)
+        black_mask = (1 << 5) | (1 << 7) | (1 << 12) | (1 << 23)
+        self.assertEqual(self.board.occupied_points_mask, [white_mask, black_mask])
+        self.assertEqual(self.board.held_points_mask, [white_mask, black_mask])
+        self.assertEqual(self.board.blot_points_mask, [0, 0])
+
+    def test_occupancy_masks_match_full_scan_in_random_game(self):
+        """Verifica que las máscaras incrementales y los movimientos por máscara coinciden con un recorrido completo."""
+        rng = Random(9)
+        uses_white_checkers = True
+        for _ in range(60):
+            for player_num, sign in ((0, 1), (1, -1)):
+                own = [self.board.points[point] * sign for point in range(1, 25)]
+                self.assertEqual(self.board.occupied_points_mask[player_num],
+                                 sum(1 << i for i, checkers in enumerate(own) if checkers > 0))
+                self.assertEqual(self.board.held_points_mask[player_num],
+                                 sum(1 << i for i, checkers in enumerate(own) if checkers >= 2))
+                self.assertEqual(self.board.blot_points_mask[player_num],
+                                 sum(1 << i for i, checkers in enumerate(own) if checkers == 1))
+            if self.board.is_bar_empty[0 if uses_white_checkers else 1]:
+                for dice_number in range(1, 7):
+                    sign = 1 if uses_white_checkers else -1
+                    own = [self.board.points[self.board.map_normal_to_point(normal, uses_white_checkers)] * sign
+                           for normal in range(25)]
+                    expected = tuple(normal for normal in range(1, 25 - dice_number)
+                                     if own[normal] > 0 and own[normal + dice_number] >= -1)
+                    mask = self.board.get_movable_checkers_mask(uses_white_checkers, dice_number)
+                    self.assertEqual(self.board.get_normal_indexes_from_mask(mask, uses_white_checkers), expected)
+            dice = (rng.randint(1, 6), rng.randint(1, 6))
+            if dice[0] == dice[1]:
+                dice = dice * 2
+            plays = self.board.generate_legal_plays(uses_white_checkers, dice)
+            self.board.apply_play(rng.choice(plays), uses_white_checkers)
+            if self.board.is_match_won()[0]:
+                break
+            uses_white_checkers = not uses_white_checkers
+
+    def test_get_prime_length(self):
+        """Verifica get_prime_length() con puntos tomados consecutivos."""
+        self.assertEqual(self.board.get_prime_length(True), 1)
+        points = [0] * 26
+        # Blancas: prime de 4 (puntos 3-6) y puntos sueltos; negras: un blot y un punto tomado
+        for point in (3, 4, 5, 6, 9):
+            points[point] = 2
+        points[10] = 1
+        points[20] = -1
+        points[22] = -3
+        self.board.load_points(points)
+        self.assertEqual(self.board.get_prime_length(True), 4)
+        self.assertEqual(self.board.get_prime_length(False), 1)
+
+    def test_count_exposed_blots(self):
+        """Verifica count_exposed_blots() con tiros directos y fichas en la barra."""
+        self.assertEqual(self.board.count_exposed_blots(True), 0)
+        points = [0] * 26
+        points[10] = 1  # Blot blanco a 5 puntos de la ficha negra del punto 15
+        points[2] = 1  # Blot blanco fuera del alcance directo
+        points[15] = -1  # Blot negro a 5 puntos de la ficha blanca del punto 10
+        points[23] = -2
+        self.board.load_points(points)
+        self.assertEqual(self.board.count_exposed_blots(True), 1)
+        self.assertEqual(self.board.count_exposed_blots(False), 1)
+        # Una ficha negra en la barra amenaza los blots blancos del área de retiro
+        points[24] = 1
+        self.board.load_points(points)
+        self.assertEqual(self.board.count_exposed_blots(True), 1)
+        points[25] = -1
+        self.board.load_points(points)
+        self.assertEqual(self.board.count_exposed_blots(True), 2)
+
+    def test_pip_counts_default_board(self):
+        """Verifica la cantidad de pips del tablero por defecto (167 por jugador)."""
+        self.assertEqual(self.board.pip_counts, [167, 167])
+
+    def test_pip_counts_follow_moves_and_bar(self):
+        """Verifica que la cantidad de pips se actualiza al mover, comer y retirar fichas."""
+        self.board.move_checker(1, 4, True)
+        self.assertEqual(self.board.pip_counts, [164, 167])
+        # Las blancas comen la ficha negra del índice normal 20 de las negras (punto absoluto 5)
+        self.board.replace_triangle(5, True, [1, 0, "○"])
+        black_pips = self.board.pip_counts[1]
+        self.board.move_checker(4, 5, True)
+        self.assertEqual(self.board.pip_counts, [163, black_pips - 5 + 25])
+        self.board.move_checker(0, 3, False)
+        self.assertEqual(self.board.pip_counts[1], black_pips - 5 + 22)
+
+    def test_pip_counts_match_full_scan_in_random_game(self):
+        """Verifica que la cantidad de pips incremental coincide con un recorrido completo durante una partida."""
+        rng = Random(12)
+        uses_white_checkers = True
+        for _ in range(80):
+            points = self.board.points
+            white_pips = sum(points[point] * (25 - point) for point in range(25) if points[point] > 0)
+            black_pips = sum(-points[point] * point for point in range(1, 26) if points[point] < 0)
+            self.assertEqual(self.board.pip_counts, [white_pips, black_pips])
+            dice = (rng.randint(1, 6), rng.randint(1, 6))
+            if dice[0] == dice[1]:
+                dice = dice * 2
+            self.board.apply_play(rng.choice(self.board.generate_legal_plays(uses_white_checkers, dice)),
+                                  uses_white_checkers)
+            if any(self.board.is_match_won()):
+                break
+            uses_white_checkers = not uses_white_checkers
+
+    def test_get_win_type(self):
+        """Verifica get_win_type() para victorias simples, gammons y backgammons."""
+        points = [0] * 26
+        points[5] = -14
+        self.board.load_points(points)
+        self.assertEqual(self.board.get_win_type(True), 1)
+        points[5] = -15
+        self.board.load_points(points)
+        self.assertEqual(self.board.get_win_type(True), 2)
+        points[5] = -14
+        points[20] = -1
+        self.board.load_points(points)
+        self.assertEqual(self.board.get_win_type(True), 3)
+        points[20] = 0
+        points[25] = -1
+        self.board.load_points(points)
+        self.assertEqual(self.board.get_win_type(True), 3)
+
+    def test_position_id_default_board(self):
+        """Verifica que el Position ID de la posición inicial es el de GNU Backgammon, para ambos jugadores."""
+        self.assertEqual(self.board.export_position_id(True), "4HPwATDgc/ABMA")
+        self.assertEqual(self.board.export_position_id(False), "4HPwATDgc/ABMA")
+        board = Board()
+        board.load_points([0] * 26)
+        board.import_position_id("4HPwATDgc/ABMA")
+        self.assertEqual(tuple(board.points), Board.NEW_GAME_POINTS)
+
+    def test_position_id_round_trip_in_random_game(self):
+        """Verifica que exportar e importar el Position ID recupera la posición durante una partida."""
+        rng = Random(17)
+        uses_white_checkers = True
+        board = Board()
+        for _ in range(120):
+            for on_roll_white in (True, False):
+                position_id = self.board.export_position_id(on_roll_white)
+                self.assertEqual(len(position_id), 14)
+                board.import_position_id(position_id, on_roll_white)
+                self.assertEqual(board.export_position(), self.board.export_position())
+                self.assertEqual(board.checkers_off, self.board.checkers_off)
+                self.assertEqual(board.zobrist_hash, self.board.zobrist_hash)
+            if self.board.is_match_won()[0]:
+                break
+            dice = (rng.randint(1, 6), rng.randint(1, 6))
+            if dice[0] == dice[1]:
+                dice = dice * 2
+            plays = self.board.generate_legal_plays(uses_white_checkers, dice)
+            self.board.apply_play(rng.choice(plays), uses_white_checkers)
+            uses_white_checkers = not uses_white_checkers
+
+    def test_position_id_is_from_player_on_roll(self):
+        """Verifica que el Position ID se escribe desde el jugador con el turno (primero sus fichas)."""
+        self.board.move_checker(1, 4, True)
+        self.board.move_checker(1, 3, True)
+        mirrored = Board()
+        mirrored.load_points([-self.board.points[Board.BLACK_BAR_POINT - point] for point in range(26)])
+        self.assertEqual(self.board.export_position_id(True), mirrored.export_position_id(False))
+        self.assertNotEqual(self.board.export_position_id(True), self.board.export_position_id(False))
+
+    def test_position_id_invalid(self):
+        """Verifica que falla al importar un Position ID inválido sin modificar el tablero."""
+        for position_id in ("4HPwATDgc/ABM", "4HPwATDgc/AB*A", "//////////////", 12):
+            with self.assertRaises(ValueError):
+                self.board.import_position_id(position_id)
+        self.assertEqual(tuple(self.board.points), Board.NEW_GAME_POINTS)
+
+    def test_hit_and_unmake_restore_masks_and_counters(self):
+        """Verifica que comer una ficha y deshacerlo actualiza las máscaras, los contadores y los pips de ambos colores."""
+        # Una ficha negra sola en el índice normal 5 de las blancas (punto absoluto 5)
+        self.board.replace_triangle(5, True, [1, 0, "○"])
+        state = (self.board.zobrist_hash, list(self.board.occupied_points_mask), list(self.board.held_points_mask),
+                 list(self.board.blot_points_mask), list(self.board.outside_home_checkers), list(self.board.pip_counts))
+        self.assertTrue(self.board.make_move(1, 4, True))
+        point_bit = Board.POINT_BITS[5]
+        self.assertTrue(self.board.blot_points_mask[0] & point_bit)
+        self.assertFalse(self.board.occupied_points_mask[1] & point_bit)
+        self.assertEqual(self.board.points[25], -1)
+        self.assertEqual(self.board.pip_counts, [state[-1][0] - 4, state[-1][1] - 5 + 25])
+        self.board.unmake_move()
+        self.assertEqual((self.board.zobrist_hash, self.board.occupied_points_mask, self.board.held_points_mask,
+                          self.board.blot_points_mask, self.board.outside_home_checkers, self.board.pip_counts), state)
 
 if __name__ == '__main__':
     unittest.main()
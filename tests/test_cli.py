@@ -1,6 +1,7 @@
 import unittest
 from cli.CLI import CLI
 from core.Board import Board
+from core.SelectionOverlay import SelectionOverlay
 
 
 class TestCLI(unittest.TestCase):
@@ -9,7 +10,8 @@ class TestCLI(unittest.TestCase):
     def setUp(self):
         """Configura el entorno de prueba antes de cada test."""
         self.board = Board()
-        self.cli = CLI(self.board)
+        self.selection = SelectionOverlay()
+        self.cli = CLI(self.board, self.selection)
 
     def test_translate_user_input_select_allowed_inpt_single_char(self):
         """Prueba la función translate_user_input_select con entradas válidas."""
@@ -326,7 +328,7 @@ class TestCLI(unittest.TestCase):
         """Prueba que generate_bottom_board_str maneje correctamente el caso de cuando se
         puede mover hacia fuera del tablero para jugador blanco"""
         triangles = [[0, 0, " "]] * 12
-        self.board.__off_tray_posible_move__ = [True, False]
+        self.selection.__off_tray_posible_move__ = [True, False]
         result = self.cli.generate_bottom_board_str(triangles, True)
         expected = (
             "│  ▲  ▲  ▲  ▲  ▲  ▲  │  ▲  ▲  ▲  ▲  ▲  ▲  │\n"
@@ -342,7 +344,7 @@ class TestCLI(unittest.TestCase):
         """Prueba que generate_bottom_board_str maneje correctamente el caso de cuando se
         puede mover hacia fuera del tablero para jugador negro"""
         triangles = [[0, 0, " "]] * 12
-        self.board.__off_tray_posible_move__ = [False, True]
+        self.selection.__off_tray_posible_move__ = [False, True]
         result = self.cli.generate_bottom_board_str(triangles, False)
         expected = (
             "│  ▲  ▲  ▲  ▲  ▲  ▲  │  ▲  ▲  ▲  ▲  ▲  ▲  │\n"
@@ -62,6 +62,15 @@ class TestDice(unittest.TestCase):
         with self.assertRaises(AttributeError):
             self.dice.dice_str = Dice.DICES_STR[1]
 
+    def test_roll_dice_with_dice_source(self):
+        """Verifica que el dado toma sus valores de la fuente de dados inyectada."""
+        from core.DiceSource import DiceSource
+        dice = Dice(dice_source=DiceSource(9))
+        expected_source = DiceSource(9)
+        for _ in range(10):
+            dice.roll_dice()
+            self.assertEqual(dice.dice_number, expected_source.next_die())
+            self.assertEqual(dice.dice_str, Dice.DICES_STR[dice.dice_number])
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from core.DiceSource import DiceSource
+
+
+class TestDiceSource(unittest.TestCase):
+    """Conjunto de pruebas para la clase DiceSource."""
+
+    def test_values_in_range(self):
+        """Verifica que los dados están entre 1 y 6 y que salen todos los valores."""
+        dice_source = DiceSource(0, block_size=64)
+        values = [dice_source.next_die() for _ in range(1000)]
+        self.assertEqual(set(values), set(range(1, 7)))
+
+    def test_reproducible(self):
+        """Verifica que la misma semilla produce la misma secuencia, sin importar el tamaño del bloque."""
+        first = DiceSource(42, block_size=7)
+        second = DiceSource(42, block_size=7)
+        self.assertEqual([first.next_pair() for _ in range(20)], [second.next_pair() for _ in range(20)])
+
+    def test_next_pair_across_blocks(self):
+        """Verifica que una tirada puede tomar dados de dos bloques consecutivos."""
+        paired = DiceSource(5, block_size=3)
+        single = DiceSource(5, block_size=3)
+        for _ in range(10):
+            self.assertEqual(paired.next_pair(), (single.next_die(), single.next_die()))
+
+    def test_matches_numpy_generator(self):
+        """Verifica que los dados son los del generador de NumPy tirados en bloque."""
+        expected = np.random.default_rng(3).integers(1, 7, size=10, dtype=np.int8).tolist()
+        dice_source = DiceSource(np.random.default_rng(3), block_size=10)
+        self.assertEqual([dice_source.next_die() for _ in range(10)], expected)
+
+    def test_independent_streams(self):
+        """Verifica que las fuentes de distintas partidas y las derivadas con spawn() son distintas."""
+        games = [DiceSource.for_game(1, game_num) for game_num in range(3)]
+        sequences = [tuple(dice_source.next_die() for _ in range(50)) for dice_source in games]
+        self.assertEqual(len(set(sequences)), 3)
+        same_game = DiceSource.for_game(1, 2)
+        self.assertEqual(sequences[2], tuple(same_game.next_die() for _ in range(50)))
+        spawned = DiceSource(1).spawn(2)
+        self.assertNotEqual([spawned[0].next_die() for _ in range(50)], [spawned[1].next_die() for _ in range(50)])
+
+    def test_invalid_block_size(self):
+        """Verifica que se rechaza un bloque vacío."""
+        with self.assertRaises(ValueError):
+            DiceSource(0, block_size=0)
+
+    def test_game_seed(self):
+        """Verifica que la semilla de una partida es un entero que reproduce su fuente de dados."""
+        seed = DiceSource.game_seed(1, 2)
+        self.assertIsInstance(seed, int)
+        self.assertNotEqual(seed, DiceSource.game_seed(1, 3))
+        from_seed = DiceSource(seed)
+        for_game = DiceSource.for_game(1, 2)
+        self.assertEqual([from_seed.next_die() for _ in range(20)], [for_game.next_die() for _ in range(20)])
+        self.assertNotEqual(DiceSource.new_seed(), DiceSource.new_seed())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from core.Board import Board
+from core.ExpectiminimaxBot import ExpectiminimaxBot
+from core.RaceEvaluator import RaceEvaluator
+
+
+class TestExpectiminimaxBot(unittest.TestCase):
+    """Conjunto de pruebas para la clase ExpectiminimaxBot."""
+
+    def setUp(self):
+        """Prepara un final de partida pequeño (pocas jugadas posibles por tirada)."""
+        points = [0] * 26
+        points[20] = 2
+        points[22] = 2
+        points[17] = 1
+        points[4] = -2
+        points[2] = -2
+        points[9] = -1
+        self.board = Board()
+        self.board.load_points(points)
+
+    @staticmethod
+    def expectimax_play_value(board: Board, uses_white_checkers: bool, play: tuple, depth: int) -> float:
+        """Calcula el valor exacto de una jugada con expectiminimax sin poda (referencia para las pruebas)."""
+        board.make_play(play, uses_white_checkers)
+        if board.checkers_off[0 if uses_white_checkers else 1] == 15:
+            value = 1.0
+        elif depth == 1:
+            value = 1.0 - RaceEvaluator.win_probability(board, not uses_white_checkers)
+        else:
+            value = 0.0
+            for dice_numbers, weight in ExpectiminimaxBot.ROLLS:
+                opponent_value = max(TestExpectiminimaxBot.expectimax_play_value(board, not uses_white_checkers,
+                                                                                 opponent_play, depth - 1)
+                                     for opponent_play in board.generate_legal_plays(not uses_white_checkers,
+                                                                                     dice_numbers))
+                value += weight * (1.0 - opponent_value)
+        board.unmake_play(play)
+        return value
+
+    def test_init_invalid_depth(self):
+        """Verifica que no se puede crear un jugador sin profundidad de búsqueda."""
+        with self.assertRaises(ValueError):
+            ExpectiminimaxBot(max_depth=0)
+
+    def test_choose_play_matches_full_expectimax(self):
+        """Verifica que la poda no cambia el valor de la jugada elegida (2 plies)."""
+        dice = (5, 2)
+        bot = ExpectiminimaxBot(max_depth=2)
+        play = bot.choose_play(self.board, True, dice)
+        plays = self.board.generate_legal_plays(True, dice)
+        self.assertIn(play, plays)
+        values = {candidate: self.expectimax_play_value(self.board.copy(), True, candidate, 2)
+                  for candidate in plays}
+        self.assertAlmostEqual(values[play], max(values.values()))
+
+    def test_choose_play_does_not_modify_board(self):
+        """Verifica que la búsqueda no modifica el tablero recibido."""
+        points = self.board.points[:]
+        ExpectiminimaxBot(max_depth=2).choose_play(self.board, False, (6, 1))
+        self.assertEqual(self.board.points, points)
+
+    def test_search_stats(self):
+        """Verifica las estadísticas de la búsqueda."""
+        bot = ExpectiminimaxBot(max_depth=2)
+        bot.choose_play(self.board, True, (4, 3))
+        stats = bot.last_search_stats
+        self.assertEqual(stats["depth"], 2)
+        self.assertGreater(stats["nodes"], 0)
+        self.assertGreater(stats["nodes_per_second"], 0)
+        self.assertGreaterEqual(stats["pruning_ratio"], 0.0)
+        self.assertLessEqual(stats["pruning_ratio"], 1.0)
+
+    def test_node_budget(self):
+        """Verifica que la búsqueda respeta el presupuesto de nodos y devuelve una jugada legal."""
+        bot = ExpectiminimaxBot(max_depth=3, max_nodes=30)
+        play = bot.choose_play(self.board, True, (4, 3))
+        self.assertIn(play, self.board.generate_legal_plays(True, (4, 3)))
+        self.assertLess(bot.last_search_stats["depth"], 3)
+        self.assertLessEqual(bot.last_search_stats["nodes"], 31)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import tempfile
+import unittest
+
+from core.BackgammonGame import BackgammonGame
+from core.DiceSource import DiceSource
+from core.ExpectiminimaxBot import ExpectiminimaxBot
+from core.GameArchive import GameArchive
+from core.GameEngine import GameEngine
+from core.GameRecord import GameRecord
+from core.HeuristicEvaluator import HeuristicEvaluator
+
+
+class TestGameArchive(unittest.TestCase):
+    """Conjunto de pruebas para la clase GameArchive."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Juega partidas completas entre bots con semillas fijas."""
+        bot = ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=1)
+        cls.records = []
+        for seed in (1234, 2 ** 127 + 5):
+            game = BackgammonGame(seed=seed)
+            game.start_dice_roll()
+            while True:
+                game.play_bot_turn(bot)
+                if game.board.is_match_won()[0]:
+                    break
+                game.change_turn()
+            cls.records.append(game.game_record)
+
+    def setUp(self):
+        """Crea un directorio temporal para los archivos."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "partidas.bga")
+
+    def tearDown(self):
+        """Borra el directorio temporal."""
+        self.directory.cleanup()
+
+    def test_write_and_read(self):
+        """Verifica que las partidas leídas son iguales a las guardadas, en el mismo orden."""
+        with GameArchive(self.path) as archive:
+            for record in self.records:
+                archive.write(record)
+        self.assertEqual(list(GameArchive.read(self.path)), self.records)
+
+    def test_moves_are_compact(self):
+        """Verifica que cada movimiento ocupa 2 bytes detrás del encabezado de la partida."""
+        record = self.records[0]
+        _, hits = GameArchive.replay(record)
+        names_size = sum(len(name.encode("utf-8")) for name in record.player_names)
+        num_moves = sum(len(play) for play in record.plays)
+        self.assertEqual(len(GameArchive.encode(record, hits)),
+                         GameArchive.GAME_HEADER.size + names_size + len(record.plays) + 2 * num_moves)
+
+    def test_replay_round_trip(self):
+        """Verifica que repetir las partidas leídas con move_checker/take_out_checker da las mismas capturas
+        y la misma posición final que el motor de pasos."""
+        with GameArchive(self.path) as archive:
+            for record in self.records:
+                archive.write(record)
+        for record, hits in GameArchive.read(self.path, with_hits=True):
+            board, replay_hits = GameArchive.replay(record)
+            self.assertEqual(replay_hits, hits)
+            self.assertEqual(board.export_position(), record.replay().position)
+            self.assertEqual((True, record.result[0]), board.is_match_won())
+            self.assertEqual(board.get_win_type(record.result[0]), record.result[1])
+        self.assertTrue(any(hit for _, hits in GameArchive.read(self.path, with_hits=True)
+                            for play_hits in hits for hit in play_hits))
+
+    def test_append(self):
+        """Verifica que al volver a abrir el archivo las partidas se agregan al final."""
+        with GameArchive(self.path) as archive:
+            archive.write(self.records[0])
+        with GameArchive(self.path) as archive:
+            archive.write(self.records[1])
+        self.assertEqual(list(GameArchive.read(self.path)), self.records)
+
+    def test_read_is_lazy(self):
+        """Verifica que la lectura entrega las partidas de a una."""
+        with GameArchive(self.path) as archive:
+            for record in self.records:
+                archive.write(record)
+        games = GameArchive.read(self.path)
+        self.assertEqual(next(games), self.records[0])
+        self.assertEqual(next(games), self.records[1])
+        with self.assertRaises(StopIteration):
+            next(games)
+
+    def test_record_without_seed(self):
+        """Verifica que se guarda una partida sin semilla y sin terminar, con quien empezó."""
+        record = GameRecord(None, [((1, 3), (1, 1)), ((24, 6),)], ("Ana", "Beto"), None, starts_white=False)
+        with GameArchive(self.path) as archive:
+            archive.write(record)
+        read_record, hits = next(GameArchive.read(self.path, with_hits=True))
+        self.assertEqual(read_record, record)
+        self.assertIsNone(read_record.seed)
+        self.assertIsNone(read_record.result)
+        self.assertFalse(read_record.starts_white)
+        self.assertEqual(hits, ((False, False), (False,)))
+
+    def test_starts_white_from_seed(self):
+        """Verifica que quien empieza se deduce de la semilla si no se registró."""
+        record = self.records[0]
+        expected = GameEngine().start(DiceSource(1234))
+        self.assertEqual(GameRecord(1234).starts_white, expected.uses_white_checkers)
+        self.assertEqual(record.starts_white, expected.uses_white_checkers)
+
+    def test_unknown_starter(self):
+        """Verifica que falla si no se sabe quién empezó y que el jugador inicial distingue los registros."""
+        record = GameRecord(None, [((1, 3), (1, 1))])
+        with self.assertRaises(ValueError):
+            record.starts_white
+        with GameArchive(self.path) as archive, self.assertRaises(ValueError):
+            archive.write(record)
+        self.assertNotEqual(GameRecord(None, [((1, 3), (1, 1))], starts_white=True),
+                            GameRecord(None, [((1, 3), (1, 1))], starts_white=False))
+        starts_white = GameRecord(1234).starts_white
+        self.assertEqual(GameRecord(1234), GameRecord(1234, starts_white=starts_white))
+        self.assertNotEqual(GameRecord(1234), GameRecord(1234, starts_white=not starts_white))
+
+    def test_invalid_file(self):
+        """Verifica que falla al abrir o leer un archivo con otro formato o truncado."""
+        with open(self.path, "wb") as archive_file:
+            archive_file.write(b"no es un archivo de partidas")
+        with self.assertRaises(ValueError):
+            GameArchive(self.path)
+        with self.assertRaises(ValueError):
+            list(GameArchive.read(self.path))
+        with GameArchive(self.path + "2") as archive:
+            archive.write(self.records[0])
+        with open(self.path + "2", "rb") as archive_file:
+            data = archive_file.read()
+        with open(self.path, "wb") as archive_file:
+            archive_file.write(data[:-1])
+        with self.assertRaises(ValueError):
+            list(GameArchive.read(self.path))
+
+    def test_invalid_seed(self):
+        """Verifica que falla si la semilla no entra en 128 bits."""
+        with self.assertRaises(ValueError):
+            GameArchive.encode(GameRecord(2 ** 128, starts_white=True), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import random
+import unittest
+
+import numpy as np
+
+from core.Board import Board
+from core.GameEngine import GameEngine
+from core.GameState import GameState
+
+
+class TestGameEngine(unittest.TestCase):
+    """Conjunto de pruebas para la clase GameEngine."""
+
+    def setUp(self):
+        """Inicializa un motor para cada prueba."""
+        self.engine = GameEngine()
+
+    def test_roll(self):
+        """Verifica que la tirada agrega los dados (4 si son dobles) sin modificar el estado original."""
+        state = self.engine.initial_state()
+        rng = random.Random(1)
+        for _ in range(50):
+            rolled = self.engine.roll(state, rng)
+            self.assertEqual(state.dice, ())
+            self.assertIn(len(rolled.dice), (2, 4))
+            if len(rolled.dice) == 4:
+                self.assertEqual(len(set(rolled.dice)), 1)
+        with self.assertRaises(ValueError):
+            self.engine.roll(rolled, rng)
+
+    def test_roll_with_numpy_generator(self):
+        """Verifica que también se pueden tirar los dados con un numpy.random.Generator."""
+        rolled = self.engine.roll(self.engine.initial_state(), np.random.default_rng(0))
+        self.assertTrue(all(1 <= dice_number <= 6 for dice_number in rolled.dice))
+
+    def test_legal_plays_match_board(self):
+        """Verifica que las jugadas legales son las de Board.generate_legal_plays()."""
+        state = GameState(Board().export_position(), False, (6, 1))
+        self.assertEqual(self.engine.legal_plays(state), Board().generate_legal_plays(False, (6, 1)))
+        with self.assertRaises(ValueError):
+            self.engine.legal_plays(self.engine.initial_state())
+
+    def test_apply(self):
+        """Verifica que la jugada pasa el turno, descarta los dados y no modifica el estado original."""
+        state = GameState(Board().export_position(), True, (3, 1))
+        play = self.engine.legal_plays(state)[0]
+        next_state = self.engine.apply(state, play)
+        self.assertFalse(next_state.uses_white_checkers)
+        self.assertEqual(next_state.dice, ())
+        self.assertEqual(state.position, Board().export_position())
+        board = Board()
+        board.apply_play(play, True)
+        self.assertEqual(next_state.position, board.export_position())
+
+    def test_apply_illegal_play(self):
+        """Verifica que se rechazan las jugadas ilegales."""
+        state = GameState(Board().export_position(), True, (3, 1))
+        with self.assertRaises(ValueError):
+            self.engine.apply(state, ((1, 6),))
+
+    def test_apply_play_in_other_order(self):
+        """Verifica que se acepta una jugada legal con sus movimientos en otro orden y se rechaza
+        si usa un dado que no salió o no usa todos los dados."""
+        state = GameState(Board().export_position(), True, (1, 3))
+        for play, canonical_play in ((((19, 1), (17, 3)), ((17, 3), (19, 1))),
+                                     (((17, 1), (17, 3)), ((17, 3), (17, 1)))):
+            self.assertNotIn(play, self.engine.legal_plays(state))
+            self.assertTrue(self.engine.is_legal_play(state, play))
+            self.assertEqual(self.engine.apply(state, play), self.engine.apply(state, canonical_play))
+        self.assertFalse(self.engine.is_legal_play(state, ((17, 4),)))
+        self.assertFalse(self.engine.is_legal_play(state, ((17, 3),)))
+        self.assertFalse(self.engine.is_legal_play(state, ((17, 1), (18, 1))))
+
+    def test_result(self):
+        """Verifica el resultado en una partida sin terminar y en una victoria con gammon."""
+        self.assertIsNone(self.engine.result(self.engine.initial_state()))
+        points = [0] * 26
+        points[13] = -15
+        board = Board()
+        board.load_points(points)
+        self.assertEqual(self.engine.result(GameState(board.export_position(), False)), (True, 2))
+
+    def test_full_game(self):
+        """Verifica que una partida completa con jugadas al azar termina con un resultado."""
+        rng = random.Random(3)
+        state = self.engine.start(rng)
+        turns = 0
+        while self.engine.result(state) is None:
+            state = self.engine.roll(state, rng)
+            state = self.engine.apply(state, rng.choice(self.engine.legal_plays(state)))
+            turns += 1
+        winner_uses_white, win_type = self.engine.result(state)
+        self.assertIn(win_type, (1, 2, 3))
+        self.assertNotEqual(winner_uses_white, state.uses_white_checkers)
+        self.assertGreater(turns, 10)
+
+    def test_to_board(self):
+        """Verifica que se crea un tablero nuevo con la posición del estado."""
+        state = self.engine.initial_state()
+        board = self.engine.to_board(state)
+        self.assertEqual(board.export_position(), state.position)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from core.BackgammonGame import BackgammonGame
+from core.ExpectiminimaxBot import ExpectiminimaxBot
+from core.GameEngine import GameEngine
+from core.GameRecord import GameRecord
+from core.HeuristicEvaluator import HeuristicEvaluator
+
+
+class TestGameRecord(unittest.TestCase):
+    """Conjunto de pruebas para la clase GameRecord."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Juega una partida completa entre bots con una semilla fija."""
+        bot = ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=1)
+        cls.game = BackgammonGame(seed=1234)
+        cls.game.start_dice_roll()
+        cls.positions = []
+        while True:
+            cls.game.play_bot_turn(bot)
+            cls.positions.append(cls.game.board.export_position())
+            if cls.game.board.is_match_won()[0]:
+                break
+            cls.game.change_turn()
+        cls.record = cls.game.game_record
+
+    def test_record(self):
+        """Verifica que el registro tiene la semilla, una jugada por turno y el resultado."""
+        self.assertEqual(self.record.seed, 1234)
+        self.assertEqual(len(self.record.plays), len(self.positions))
+        self.assertEqual(self.record.player_names, ("Blanco", "Negro"))
+        winner_uses_white, win_type = self.record.result
+        self.assertEqual(winner_uses_white, self.game.player_playing.uses_white_checkers)
+        self.assertIn(win_type, (1, 2, 3))
+
+    def test_replay_reproduces_every_position(self):
+        """Verifica que la repetición con el motor de pasos reproduce cada posición de la partida."""
+        engine = GameEngine()
+        for num_plays in (1, len(self.positions) // 2, len(self.positions)):
+            state = self.record.replay(num_plays, engine)
+            self.assertEqual(state.position, self.positions[num_plays - 1])
+        self.assertEqual(engine.result(self.record.replay()), self.record.result)
+        self.assertTrue(self.record.verify())
+
+    def test_replay_with_other_seed_fails(self):
+        """Verifica que las jugadas no se pueden repetir con dados de otra semilla."""
+        tampered = GameRecord(4321, self.record.plays, result=self.record.result)
+        with self.assertRaises(ValueError):
+            tampered.replay()
+        self.assertFalse(tampered.verify())
+
+    def test_replay_without_seed_fails(self):
+        """Verifica que no se puede repetir ni verificar una partida sin semilla."""
+        record = GameRecord(None, self.record.plays, result=self.record.result, starts_white=True)
+        with self.assertRaises(ValueError):
+            record.replay()
+        with self.assertRaises(ValueError):
+            record.verify()
+
+    def test_equality(self):
+        """Verifica la igualdad por valor de los registros."""
+        self.assertEqual(self.record, GameRecord(1234, list(self.record.plays), ("Blanco", "Negro"),
+                                                 self.record.result))
+        self.assertNotEqual(self.record, GameRecord(1234, self.record.plays[:-1], ("Blanco", "Negro"),
+                                                    self.record.result))
+
+    def test_same_seed_same_game(self):
+        """Verifica que la misma semilla con el mismo bot produce la misma partida."""
+        bot = ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=1)
+        game = BackgammonGame(seed=1234)
+        game.start_dice_roll()
+        for _ in range(10):
+            game.play_bot_turn(bot)
+            game.change_turn()
+        self.assertEqual(game.game_record.plays, self.record.plays[:10])
+
+
+if __name__ == '__main__':
+    unittest.main()
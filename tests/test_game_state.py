@@ -0,0 +1,46 @@
+import pickle
+import unittest
+
+from core.Board import Board
+from core.GameState import GameState
+
+
+class TestGameState(unittest.TestCase):
+    """Conjunto de pruebas para la clase GameState."""
+
+    def setUp(self):
+        """Prepara la posición inicial."""
+        self.position = Board().export_position()
+
+    def test_properties(self):
+        """Verifica que se exponen la posición, el jugador con el turno y los dados."""
+        state = GameState(self.position, False, (3, 5))
+        self.assertEqual(state.position, self.position)
+        self.assertFalse(state.uses_white_checkers)
+        self.assertEqual(state.dice, (3, 5))
+
+    def test_immutable(self):
+        """Verifica que el estado no se puede modificar."""
+        state = GameState(self.position, True)
+        with self.assertRaises(AttributeError):
+            state.__dice__ = (1, 2)
+        with self.assertRaises(AttributeError):
+            del state.__position__
+
+    def test_invalid_dice(self):
+        """Verifica que se rechazan cantidades o valores de dados inválidos."""
+        for dice in ((1,), (1, 2, 3), (0, 4), (7, 1)):
+            with self.assertRaises(ValueError):
+                GameState(self.position, True, dice)
+
+    def test_equality_hash_and_pickle(self):
+        """Verifica la igualdad por valor, el hash y la serialización."""
+        state = GameState(self.position, True, (2, 2, 2, 2))
+        self.assertEqual(state, GameState(Board().export_position(), True, (2, 2, 2, 2)))
+        self.assertNotEqual(state, GameState(self.position, False, (2, 2, 2, 2)))
+        self.assertEqual(len({state, GameState(self.position, True, (2, 2, 2, 2))}), 1)
+        self.assertEqual(pickle.loads(pickle.dumps(state)), state)
+
+
+if __name__ == '__main__':
+    unittest.main()
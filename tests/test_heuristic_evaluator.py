@@ -0,0 +1,41 @@
+import unittest
+
+from core.Board import Board
+from core.HeuristicEvaluator import HeuristicEvaluator
+from core.RaceEvaluator import RaceEvaluator
+
+
+class TestHeuristicEvaluator(unittest.TestCase):
+    """Conjunto de pruebas para la clase HeuristicEvaluator."""
+
+    def setUp(self):
+        """Prepara un tablero por defecto para cada prueba."""
+        self.board = Board()
+
+    def test_new_game_board_favours_player_on_roll(self):
+        """Verifica que en el tablero inicial la probabilidad favorece al jugador con el turno."""
+        white_on_roll = HeuristicEvaluator.win_probability(self.board, True)
+        self.assertGreater(white_on_roll, 0.5)
+        self.assertAlmostEqual(white_on_roll, HeuristicEvaluator.win_probability(self.board, False))
+
+    def test_exposed_blot_lowers_probability(self):
+        """Verifica que dejar un blot expuesto reduce la probabilidad del jugador que lo deja."""
+        safe_board = self.board.copy()
+        safe_board.apply_play(((17, 4), (19, 2)), True)
+        blot_board = self.board.copy()
+        blot_board.apply_play(((1, 6), (12, 2)), True)
+        self.assertLess(HeuristicEvaluator.win_probability(safe_board, False),
+                        HeuristicEvaluator.win_probability(blot_board, False))
+
+    def test_race_uses_race_evaluator(self):
+        """Verifica que las carreras se evalúan con RaceEvaluator."""
+        points = [0] * 26
+        points[19] = 15
+        points[6] = -15
+        self.board.load_points(points)
+        self.assertEqual(HeuristicEvaluator.win_probability(self.board, True),
+                         RaceEvaluator.win_probability(self.board, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
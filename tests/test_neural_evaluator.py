@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from core.Board import Board
+from core.NeuralEvaluator import NeuralEvaluator
+
+
+class TestNeuralEvaluator(unittest.TestCase):
+    """Conjunto de pruebas para la clase NeuralEvaluator."""
+
+    def setUp(self):
+        """Prepara un tablero por defecto y un evaluador con pesos aleatorios."""
+        self.board = Board()
+        self.evaluator = NeuralEvaluator.random(num_hidden=16, seed=1)
+
+    def test_encode_new_game_board(self):
+        """Verifica la codificación de TD-Gammon del tablero por defecto."""
+        inputs = NeuralEvaluator.encode(np.array([Board.NEW_GAME_POINTS]), True)
+        self.assertEqual(inputs.shape, (1, 196))
+        units = inputs[0, :192].reshape(2, 24, 4)
+        # 2 fichas propias en el índice normal 1 y 5 fichas del oponente en el índice normal 6
+        np.testing.assert_array_equal(units[0, 0], [1, 1, 0, 0])
+        np.testing.assert_array_equal(units[1, 5], [1, 1, 1, 1])
+        np.testing.assert_array_equal(inputs[0, 192:], [0, 0, 0, 0])
+
+    def test_encode_is_symmetric(self):
+        """Verifica que la codificación es la misma para ambos colores en el tablero por defecto."""
+        inputs = NeuralEvaluator.encode(np.array([Board.NEW_GAME_POINTS] * 2), np.array([True, False]))
+        np.testing.assert_array_equal(inputs[0], inputs[1])
+
+    def test_encode_bar_and_off(self):
+        """Verifica las entradas de fichas en la barra y retiradas."""
+        points = [0] * 26
+        points[0] = 2
+        points[24] = 3
+        points[1] = -15
+        inputs = NeuralEvaluator.encode(np.array([points]), True)
+        np.testing.assert_allclose(inputs[0, 192:], [1.0, 0.0, 10 / 15, 0.0])
+
+    def test_init_invalid_shapes(self):
+        """Verifica que se rechazan pesos con formas incompatibles."""
+        with self.assertRaises(ValueError):
+            NeuralEvaluator(np.zeros((10, 4)), np.zeros(4), np.zeros((4, 1)), np.zeros(1))
+
+    def test_evaluate_batch_matches_single(self):
+        """Verifica que la evaluación por lotes coincide con la evaluación de a una posición."""
+        plays, values = self.evaluator.score_plays(self.board, True, (6, 5))
+        for play, value in zip(plays, values):
+            board = self.board.copy()
+            board.apply_play(play, True)
+            self.assertAlmostEqual(float(value), 1.0 - self.evaluator.evaluate(board, False), places=5)
+        self.assertEqual(self.evaluator.choose_play(self.board, True, (6, 5)), plays[int(np.argmax(values))])
+        self.assertEqual(self.board.points.tolist(), list(Board.NEW_GAME_POINTS))
+
+    def test_save_and_load(self):
+        """Verifica que los pesos guardados se cargan con los mismos resultados."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "weights.npz")
+            self.evaluator.save(path)
+            loaded = NeuralEvaluator.load(path)
+        self.assertEqual(loaded.evaluate(self.board, True), self.evaluator.evaluate(self.board, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
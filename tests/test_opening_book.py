@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+from core.Board import Board
+from core.ExpectiminimaxBot import ExpectiminimaxBot
+from core.HeuristicEvaluator import HeuristicEvaluator
+from core.OpeningBook import OpeningBook
+
+
+class TestOpeningBook(unittest.TestCase):
+    """Conjunto de pruebas para la clase OpeningBook."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Calcula un libro de 2 plies con un bot de 1 ply (rápido)."""
+        cls.bot = ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=1)
+        cls.book = OpeningBook.build(cls.bot, max_plies=2)
+
+    def test_build_covers_opening_and_replies(self):
+        """Verifica que el libro tiene las 21 tiradas iniciales y las respuestas a cada jugada del libro."""
+        self.assertEqual(len(OpeningBook.build(self.bot, max_plies=1)), 21)
+        self.assertGreater(len(self.book), 21)
+        self.assertLessEqual(len(self.book), 21 + 21 * 21)
+
+    def test_get_play_matches_bot(self):
+        """Verifica que la jugada del libro es la que elige el bot, para ambos colores."""
+        board = Board()
+        for dice_numbers in ((3, 1), (6, 5), (2, 2, 2, 2)):
+            expected = self.bot.choose_play(board, True, dice_numbers)
+            self.assertEqual(self.book.get_play(board, True, dice_numbers), expected)
+            self.assertEqual(self.book.get_play(board, False, dice_numbers), expected)
+        self.assertEqual(self.book.get_play(board, True, (1, 3)), self.book.get_play(board, True, (3, 1)))
+
+    def test_reply(self):
+        """Verifica que se encuentra la respuesta del oponente a una jugada del libro."""
+        board = Board()
+        board.apply_play(self.book.get_play(board, True, (6, 4)), True)
+        reply = self.book.get_play(board, False, (5, 2))
+        self.assertIsNotNone(reply)
+        self.assertIn(reply, board.generate_legal_plays(False, (5, 2)))
+
+    def test_unknown_position(self):
+        """Verifica que una posición fuera del libro devuelve None."""
+        points = [0] * 26
+        points[24] = 1
+        points[1] = -1
+        board = Board()
+        board.load_points(points)
+        self.assertIsNone(self.book.get_play(board, True, (3, 1)))
+
+    def test_perspective_points(self):
+        """Verifica que la posición inicial vista desde las negras es igual a la vista desde las blancas."""
+        board = Board()
+        self.assertEqual(OpeningBook.get_perspective_points(board, False),
+                         OpeningBook.get_perspective_points(board, True))
+
+    def test_save_and_load(self):
+        """Verifica que el libro se guarda y se carga sin cambios."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "book.bin")
+            self.book.save(path)
+            self.assertEqual(os.path.getsize(path),
+                             OpeningBook.HEADER.size + len(self.book) * OpeningBook.RECORD.size)
+            loaded = OpeningBook.load(path)
+        board = Board()
+        self.assertEqual(len(loaded), len(self.book))
+        for dice_numbers in ((3, 1), (5, 5, 5, 5)):
+            self.assertEqual(loaded.get_play(board, True, dice_numbers), self.book.get_play(board, True, dice_numbers))
+
+    def test_load_invalid_file(self):
+        """Verifica que se rechaza un archivo que no es un libro de aperturas."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "book.bin")
+            with open(path, "wb") as book_file:
+                book_file.write(b"XXXX" + bytes(6))
+            with self.assertRaises(ValueError):
+                OpeningBook.load(path)
+
+    def test_bot_consults_book(self):
+        """Verifica que el bot juega la jugada del libro sin buscar."""
+        book = OpeningBook({(Board().points.tobytes(), (1, 3)): ((1, 3), (1, 1))})
+        bot = ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=2, opening_book=book)
+        self.assertEqual(bot.choose_play(Board(), True, (3, 1)), ((1, 3), (1, 1)))
+        self.assertTrue(bot.last_search_stats["book"])
+        self.assertEqual(bot.last_search_stats["nodes"], 0)
+        bot.choose_play(Board(), True, (6, 5))
+        self.assertFalse(bot.last_search_stats["book"])
+        self.assertGreater(bot.last_search_stats["nodes"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
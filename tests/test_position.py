@@ -0,0 +1,65 @@
+import pickle
+import unittest
+
+from core.Board import Board
+from core.Position import Position
+
+
+class TestPosition(unittest.TestCase):
+    """Conjunto de pruebas para la clase Position."""
+
+    def test_init_from_sequence_and_bytes(self):
+        """Verifica que la posición se puede crear desde una secuencia o desde bytes."""
+        position = Position(Board.NEW_GAME_POINTS)
+        self.assertEqual(position.points, Board.NEW_GAME_POINTS)
+        self.assertEqual(Position(position.to_bytes()), position)
+        self.assertEqual(len(position.to_bytes()), 26)
+
+    def test_init_invalid_length(self):
+        """Verifica que no se puede crear una posición con una cantidad incorrecta de puntos."""
+        with self.assertRaises(ValueError):
+            Position((0,) * 25)
+
+    def test_is_immutable(self):
+        """Verifica que la posición no se puede modificar."""
+        position = Position(Board.NEW_GAME_POINTS)
+        with self.assertRaises(AttributeError):
+            position.__data__ = bytes(26)
+        with self.assertRaises(AttributeError):
+            position.other = 1
+
+    def test_hashable_and_comparable(self):
+        """Verifica que posiciones iguales tienen el mismo hash y que se pueden ordenar."""
+        position = Position(Board.NEW_GAME_POINTS)
+        same_position = Position(list(Board.NEW_GAME_POINTS))
+        other_position = Position((0,) * 26)
+        self.assertEqual(hash(position), hash(same_position))
+        self.assertEqual(len({position, same_position, other_position}), 2)
+        self.assertLess(other_position, position)
+        self.assertEqual(sorted([position, other_position]), [other_position, position])
+
+    def test_pickle_is_small(self):
+        """Verifica que la posición se serializa en pocas decenas de bytes."""
+        position = Position(Board.NEW_GAME_POINTS)
+        data = pickle.dumps(position, protocol=pickle.HIGHEST_PROTOCOL)
+        self.assertLess(len(data), 100)
+        self.assertEqual(pickle.loads(data), position)
+
+    def test_board_export_import(self):
+        """Verifica que el tablero exporta e importa la posición con todo su estado derivado."""
+        board = Board()
+        board.apply_play(((1, 6), (12, 5)), True)
+        position = board.export_position()
+        self.assertEqual(position.points, tuple(board.points))
+
+        other_board = Board()
+        other_board.import_position(position)
+        self.assertEqual(other_board.points, board.points)
+        self.assertEqual(other_board.zobrist_hash, board.zobrist_hash)
+        self.assertEqual(other_board.held_points_mask, board.held_points_mask)
+        self.assertEqual(other_board.checkers_off, board.checkers_off)
+        self.assertEqual(other_board.export_position(), position)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from core.Board import Board
+from core.RaceEvaluator import RaceEvaluator
+
+
+class TestRaceEvaluator(unittest.TestCase):
+    """Conjunto de pruebas para la clase RaceEvaluator."""
+
+    def setUp(self):
+        """Prepara un tablero vacío para cada prueba."""
+        self.board = Board()
+        self.points = [0] * 26
+
+    def test_is_race(self):
+        """Verifica is_race() con y sin contacto entre las fichas."""
+        self.assertFalse(RaceEvaluator.is_race(self.board))
+        self.points[19] = 15
+        self.points[6] = -15
+        self.board.load_points(self.points)
+        self.assertTrue(RaceEvaluator.is_race(self.board))
+        # Una ficha negra detrás de las blancas vuelve a generar contacto
+        self.points[6] = -14
+        self.points[22] = -1
+        self.board.load_points(self.points)
+        self.assertFalse(RaceEvaluator.is_race(self.board))
+
+    def test_keith_count_wastage(self):
+        """Verifica las penalizaciones del conteo de Keith."""
+        # Blancas: 3 fichas en el punto 1 (índice normal 24), 2 en el punto 2 y 10 en el punto 6
+        self.points[24] = 3
+        self.points[23] = 2
+        self.points[19] = 10
+        self.points[6] = -15
+        self.board.load_points(self.points)
+        pips = 3 * 1 + 2 * 2 + 10 * 6
+        self.assertEqual(self.board.pip_counts[0], pips)
+        # +4 por el punto 1, +1 por el punto 2 y +2 por los puntos 4 y 5 vacíos
+        self.assertEqual(RaceEvaluator.keith_count(self.board, True), pips + 4 + 1 + 2)
+
+    def test_win_probability_symmetric_and_bounded(self):
+        """Verifica que la probabilidad favorece al jugador con el turno en una carrera pareja."""
+        self.points[19] = 15
+        self.points[6] = -15
+        self.board.load_points(self.points)
+        white_on_roll = RaceEvaluator.win_probability(self.board, True)
+        black_on_roll = RaceEvaluator.win_probability(self.board, False)
+        self.assertGreater(white_on_roll, 0.5)
+        self.assertLess(white_on_roll, 1.0)
+        self.assertAlmostEqual(white_on_roll, black_on_roll)
+
+    def test_win_probability_large_lead(self):
+        """Verifica que una ventaja grande en pips da una probabilidad cercana a 1."""
+        self.points[22] = 2
+        self.points[6] = -15
+        self.board.load_points(self.points)
+        self.assertGreater(RaceEvaluator.win_probability(self.board, True), 0.99)
+        self.assertLess(RaceEvaluator.win_probability(self.board, False), 0.01)
+
+    def test_win_probability_game_over(self):
+        """Verifica la probabilidad cuando un jugador ya retiró todas sus fichas."""
+        self.points[6] = -3
+        self.board.load_points(self.points)
+        self.assertEqual(RaceEvaluator.win_probability(self.board, True), 1.0)
+        self.assertEqual(RaceEvaluator.win_probability(self.board, False), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
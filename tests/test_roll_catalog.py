@@ -0,0 +1,70 @@
+import unittest
+from itertools import combinations
+
+from core.Board import Board
+from core.RollCatalog import RollCatalog
+
+
+class TestRollCatalog(unittest.TestCase):
+    """Conjunto de pruebas para la clase RollCatalog."""
+
+    def test_rolls_and_weights(self):
+        """Verifica las 21 tiradas, sus probabilidades y los dados jugables de los dobles."""
+        self.assertEqual(len(RollCatalog.ROLLS), RollCatalog.NUM_ROLLS)
+        self.assertAlmostEqual(sum(RollCatalog.WEIGHTS), 1.0)
+        self.assertEqual(RollCatalog.ROLLS[0], ((1, 1, 1, 1), 1 / 36))
+        self.assertEqual(RollCatalog.ROLLS[1], ((1, 2), 2 / 36))
+        self.assertEqual(RollCatalog.ROLL_PAIRS[-1], (6, 6))
+        self.assertEqual(sum(1 for dice in RollCatalog.DICE if len(dice) == 4), 6)
+
+    def test_roll_ids(self):
+        """Verifica que cada tirada ordenada tiene el identificador de su tirada, sin importar el orden."""
+        counts = [0] * RollCatalog.NUM_ROLLS
+        for first_die, second_die in RollCatalog.ORDERED_ROLLS:
+            roll_id = RollCatalog.roll_id(first_die, second_die)
+            self.assertEqual(roll_id, RollCatalog.roll_id(second_die, first_die))
+            self.assertEqual(RollCatalog.ROLL_PAIRS[roll_id], tuple(sorted((first_die, second_die))))
+            counts[roll_id] += 1
+        self.assertEqual([count / 36 for count in counts], list(RollCatalog.WEIGHTS))
+        self.assertEqual(RollCatalog.roll_id(0, 3), -1)
+
+    def test_play_orders(self):
+        """Verifica los órdenes en que se juegan todos los dados de cada tirada."""
+        self.assertEqual(RollCatalog.PLAY_ORDERS[RollCatalog.roll_id(2, 5)], ((2, 5), (5, 2)))
+        self.assertEqual(RollCatalog.PLAY_ORDERS[RollCatalog.roll_id(4, 4)], ((4, 4, 4, 4),))
+
+    def test_die_sequences_match_original_generation(self):
+        """Verifica que las secuencias precalculadas son las de la generación original con deduplicación por lista."""
+        def original(dice_numbers):
+            dice_numbers = tuple([num for num in dice_numbers if num > 0])
+            dice_combinations = []
+            for i in range(1, len(dice_numbers) + 1):
+                for combo in combinations(dice_numbers, i):
+                    if combo not in dice_combinations:
+                        dice_combinations.append(combo)
+                    if 2 <= len(combo) == len(set(combo)):
+                        dice_combinations.append(combo[::-1])
+            return tuple(dice_combinations)
+
+        for dice_numbers in RollCatalog.DIE_SEQUENCES:
+            self.assertEqual(RollCatalog.DIE_SEQUENCES[dice_numbers], original(dice_numbers))
+        for dice_numbers in ((0, 5), (3, 0, 3, 3), (6, 0), (1, 2, 3)):
+            self.assertEqual(Board.generate_all_dice_combinations(dice_numbers), original(dice_numbers))
+
+    def test_die_sequences_cover_remaining_dice(self):
+        """Verifica que el catálogo cubre todos los dados que pueden quedar por jugar en un turno."""
+        self.assertEqual(RollCatalog.DIE_SEQUENCES[(3, 5)], ((3,), (5,), (3, 5), (5, 3)))
+        self.assertEqual(RollCatalog.DIE_SEQUENCES[(2, 2, 2)], ((2,), (2, 2), (2, 2, 2)))
+        self.assertIn((5, 3), RollCatalog.DIE_SEQUENCES)
+        self.assertIn((6,), RollCatalog.DIE_SEQUENCES)
+        # 6 dados sueltos, 30 pares ordenados de dados distintos y 3 restos (2, 3 y 4 dados) de cada doble
+        self.assertEqual(len(RollCatalog.DIE_SEQUENCES), 6 + 30 + 6 * 3)
+
+    def test_immutable(self):
+        """Verifica que el catálogo de secuencias no se puede modificar."""
+        with self.assertRaises(TypeError):
+            RollCatalog.DIE_SEQUENCES[(1, 2)] = ()
+
+
+if __name__ == '__main__':
+    unittest.main()
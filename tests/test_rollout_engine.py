@@ -0,0 +1,120 @@
+import unittest
+from math import sqrt
+
+import numpy as np
+
+from core.Board import Board
+from core.ExpectiminimaxBot import ExpectiminimaxBot
+from core.HeuristicEvaluator import HeuristicEvaluator
+from core.RolloutEngine import RolloutEngine
+
+
+class TestRolloutEngine(unittest.TestCase):
+    """Conjunto de pruebas para la clase RolloutEngine."""
+
+    def setUp(self):
+        """Prepara un final de carrera corto para que las partidas terminen rápido."""
+        points = [0] * 26
+        points[22] = 2
+        points[20] = 1
+        points[3] = -2
+        points[5] = -1
+        self.board = Board()
+        self.board.load_points(points)
+
+    def test_summarize(self):
+        """Verifica las probabilidades, los intervalos de confianza y la equity a partir de los conteos."""
+        results = RolloutEngine.summarize([50, 20, 5, 15, 8, 2])
+        self.assertEqual(results["games"], 100)
+        self.assertAlmostEqual(results["win"][0], 0.75)
+        self.assertAlmostEqual(results["win_gammon"][0], 0.25)
+        self.assertAlmostEqual(results["lose_backgammon"][0], 0.02)
+        probability, low, high = results["win"]
+        self.assertLess(low, probability)
+        self.assertGreater(high, probability)
+        self.assertAlmostEqual(results["equity"][0], (50 + 40 + 15 - 15 - 16 - 6) / 100)
+
+    def test_no_games(self):
+        """Verifica que falla un rollout sin partidas en lugar de dividir por cero."""
+        with self.assertRaises(ValueError):
+            RolloutEngine(num_workers=1).rollout(self.board, True, 0)
+        with self.assertRaises(ValueError):
+            RolloutEngine.summarize([0] * len(RolloutEngine.OUTCOMES))
+
+    def test_finished_position(self):
+        """Verifica que falla el rollout de una partida terminada en lugar de seguir jugando."""
+        points = [0] * 26
+        points[3] = -2
+        self.board.load_points(points)
+        with self.assertRaises(ValueError):
+            RolloutEngine(num_workers=1).rollout(self.board, True, 10)
+        with self.assertRaises(ValueError):
+            RolloutEngine.play_games(self.board.export_position(), False, ExpectiminimaxBot(max_depth=1), 2,
+                                     np.random.SeedSequence(0))
+
+    def test_rollout_is_reproducible_and_independent_of_workers(self):
+        """Verifica que con la misma semilla se obtienen los mismos resultados en uno o varios procesos."""
+        single_process = RolloutEngine(num_workers=1, games_per_task=10).rollout(self.board, True, 40, seed=7)
+        process_pool = RolloutEngine(num_workers=2, games_per_task=10).rollout(self.board, True, 40, seed=7)
+        for key in ("games", "win", "win_gammon", "equity"):
+            self.assertEqual(single_process[key], process_pool[key])
+        self.assertEqual(single_process["games"], 40)
+
+    def test_play_games(self):
+        """Verifica que play_games() juega todas las partidas desde la posición compacta."""
+        counts, samples = RolloutEngine.play_games(self.board.export_position(), True,
+                                                   ExpectiminimaxBot(max_depth=1), 20, np.random.SeedSequence(3))
+        self.assertEqual(sum(counts), 20)
+        self.assertGreater(counts[0], 10)
+        self.assertEqual(samples, [])
+
+    def test_roll_luck_averages_zero(self):
+        """Verifica que la suerte promedio sobre las 36 tiradas es 0 y que el tablero no se modifica."""
+        points = list(self.board.points)
+        total_luck = sum(RolloutEngine.roll_luck(self.board, True, dice, HeuristicEvaluator.win_probability)
+                         for dice in RolloutEngine.FIRST_ROLLS)
+        self.assertAlmostEqual(total_luck / 36, 0.0)
+        self.assertEqual(list(self.board.points), points)
+
+    def test_mirrored_games_and_luck_samples(self):
+        """Verifica que con reducción de varianza se devuelve una muestra (victoria, suerte) por partida."""
+        counts, samples = RolloutEngine.play_games(self.board.export_position(), True,
+                                                   ExpectiminimaxBot(max_depth=1), 6, np.random.SeedSequence(3),
+                                                   luck_evaluator=HeuristicEvaluator.win_probability)
+        self.assertEqual(len(samples), 6)
+        self.assertEqual(sum(won for won, _ in samples), sum(counts[:3]))
+
+    def test_variance_reduction(self):
+        """Verifica que la reducción de varianza es reproducible, informa su efecto y reduce el error estándar."""
+        single_process = RolloutEngine(num_workers=1, games_per_task=10).rollout(self.board, True, 40, seed=7,
+                                                                                 variance_reduction=True)
+        process_pool = RolloutEngine(num_workers=2, games_per_task=10).rollout(self.board, True, 40, seed=7,
+                                                                               variance_reduction=True)
+        self.assertEqual(single_process["win"], process_pool["win"])
+        report = single_process["variance_reduction"]
+        self.assertEqual(report, process_pool["variance_reduction"])
+        self.assertAlmostEqual(report["win"], single_process["win"][0])
+        self.assertGreater(report["variance_reduction"], 1.0)
+        self.assertLess(report["standard_error"], report["plain_standard_error"])
+
+    def test_summarize_variance_reduction(self):
+        """Verifica la estimación corregida y el cociente de varianzas a partir de las muestras."""
+        report = RolloutEngine.summarize_variance_reduction([(1, 0.5), (0, -0.5), (1, 0.4), (0, -0.4)])
+        self.assertAlmostEqual(report["win"], 0.5)
+        self.assertAlmostEqual(report["plain_standard_error"], sqrt(1 / 3 / 4))
+        self.assertEqual(report["variance_reduction"], float("inf"))
+
+    def test_gammon_position(self):
+        """Verifica que se cuentan los gammons cuando el oponente no retiró fichas."""
+        points = [0] * 26
+        points[24] = 1
+        points[13] = -15
+        self.board.load_points(points)
+        results = RolloutEngine(num_workers=1).rollout(self.board, True, 10)
+        self.assertEqual(results["win"][0], 1.0)
+        self.assertEqual(results["win_gammon"][0], 1.0)
+        self.assertEqual(results["win_backgammon"][0], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
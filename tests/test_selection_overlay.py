@@ -0,0 +1,117 @@
+import unittest
+
+from core.Board import Board
+from core.SelectionOverlay import SelectionOverlay
+
+
+class TestSelectionOverlay(unittest.TestCase):
+    """Conjunto de pruebas para la clase SelectionOverlay."""
+
+    def setUp(self):
+        """Prepara un tablero por defecto y una capa de selección vacía para cada prueba."""
+        self.board = Board()
+        self.selection = SelectionOverlay()
+
+    def test_select_checker_valid_white(self):
+        """Verifica select_checker() para seleccionar una ficha blanca válida."""
+        result = self.selection.select_checker(self.board, 1, True, (1, 2))
+        self.assertTrue(result)
+        self.assertEqual(self.selection.selected_checker, 1)
+        self.assertEqual(self.selection.get_mark_from_normal(1, True), 1)
+        # Los destinos posibles quedan marcados como posibles movimientos
+        for move_normal in result:
+            self.assertEqual(self.selection.get_mark_from_normal(move_normal, True), 2)
+
+    def test_select_checker_valid_black(self):
+        """Verifica select_checker() para seleccionar una ficha negra válida."""
+        result = self.selection.select_checker(self.board, 19, False, (1, 2))
+        self.assertTrue(result)
+        self.assertEqual(self.selection.selected_checker, 19)
+        # El índice 19 para negras corresponde al punto absoluto 6
+        self.assertEqual(self.selection.get_mark_from_point(6), 1)
+
+    def test_select_checker_does_not_modify_board(self):
+        """Verifica que select_checker() no modifica el estado del tablero."""
+        initial_points = self.board.points
+        initial_hash = self.board.zobrist_hash
+        self.selection.select_checker(self.board, 1, True, (1, 2))
+        self.assertEqual(self.board.points, initial_points)
+        self.assertEqual(self.board.zobrist_hash, initial_hash)
+        self.assertEqual(self.board.get_triangle_from_normal(1, True)[1], 0)
+
+    def test_select_checker_empty_triangle(self):
+        """Verifica select_checker() al intentar seleccionar en un triángulo vacío."""
+        result = self.selection.select_checker(self.board, 2, True, (1, 2))
+        self.assertFalse(result)
+        self.assertIsNone(self.selection.selected_checker)
+
+    def test_select_checker_opponent_checker(self):
+        """Verifica select_checker() al intentar seleccionar una ficha del oponente."""
+        # El triángulo 5 tiene fichas negras por defecto
+        result = self.selection.select_checker(self.board, 5, True, (1, 2))
+        self.assertFalse(result)
+        self.assertIsNone(self.selection.selected_checker)
+
+    def test_select_checker_off_tray_posible_move(self):
+        """Verifica que select_checker() marca el área de retiro cuando se puede retirar la ficha."""
+        points = [0] * 26
+        points[24] = 15
+        points[1] = -15
+        self.board.load_points(points)
+        self.board.verify_player_can_take_out(True)
+        result = self.selection.select_checker(self.board, 24, True, (1, 2))
+        self.assertIn(25, result)
+        self.assertEqual(self.selection.off_tray_posible_move, [True, False])
+
+    def test_mark_triangles(self):
+        """Verifica que mark_triangles() aplica los símbolos sobre los triángulos del tablero."""
+        self.selection.select_checker(self.board, 1, True, (1, 2))
+        top_triangles = self.selection.mark_triangles(self.board.top_board_triangles, range(12, 0, -1))
+        # El índice normal 1 para blancas es el índice 11 en la lista top
+        self.assertEqual(top_triangles[11], [2, 1, "●"])
+        self.assertEqual(top_triangles[10][1], 2)
+
+    def test_deselect_checker_no_selection(self):
+        """Verifica deselect_checker() cuando no hay ficha seleccionada."""
+        self.assertFalse(self.selection.deselect_checker(True))
+
+    def test_deselect_checker_with_selection(self):
+        """Verifica deselect_checker() con una selección previa del jugador."""
+        self.selection.select_checker(self.board, 1, False, (1, 2))
+        self.assertTrue(self.selection.deselect_checker(False))
+        self.assertIsNone(self.selection.selected_checker)
+        self.assertEqual(self.selection.get_mark_from_normal(1, False), 0)
+
+    def test_deselect_checker_wrong_player(self):
+        """Verifica deselect_checker() cuando el jugador no coincide con la selección."""
+        self.selection.select_checker(self.board, 1, True, (1, 2))
+        self.assertFalse(self.selection.deselect_checker(False))
+        self.assertEqual(self.selection.selected_checker, 1)
+        self.assertEqual(self.selection.get_mark_from_normal(1, True), 1)
+
+    def test_clean_selection_selected_and_posible_move(self):
+        """Verifica clean_selection() para limpiar la ficha seleccionada y un posible movimiento."""
+        self.selection.select_checker(self.board, 1, True, (1, 2))
+        self.selection.clean_selection((1, 2), True)
+        self.assertEqual(self.selection.get_mark_from_normal(1, True), 0)
+        self.assertEqual(self.selection.get_mark_from_normal(2, True), 0)
+        self.assertIsNone(self.selection.selected_checker)
+        # El otro posible movimiento sigue marcado
+        self.assertEqual(self.selection.get_mark_from_normal(3, True), 2)
+
+    def test_clean_selection_empty_tuple(self):
+        """Verifica clean_selection() con una tupla vacía."""
+        self.selection.select_checker(self.board, 1, True, (1, 2))
+        self.selection.clean_selection((), True)
+        self.assertEqual(self.selection.selected_checker, 1)
+        self.assertEqual(self.selection.get_mark_from_normal(1, True), 1)
+
+    def test_clean_selection_already_deselected(self):
+        """Verifica clean_selection() en triángulos sin marcas."""
+        self.selection.clean_selection((2,), False)
+        self.assertEqual(self.selection.get_mark_from_normal(2, False), 0)
+        self.assertIsNone(self.selection.selected_checker)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import json
+import os
+import tempfile
+import unittest
+
+from core.BackgammonGame import BackgammonGame
+from core.ExpectiminimaxBot import ExpectiminimaxBot
+from core.HeuristicEvaluator import HeuristicEvaluator
+from core.TournamentRunner import TournamentRunner
+
+
+class TestTournamentRunner(unittest.TestCase):
+    """Conjunto de pruebas para la clase TournamentRunner."""
+
+    def setUp(self):
+        """Prepara dos bots de 1 ply con el evaluador heurístico."""
+        self.bots = (ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=1),
+                     ExpectiminimaxBot(HeuristicEvaluator.win_probability, max_depth=1))
+
+    def test_play_game(self):
+        """Verifica que una partida termina con un ganador y un tipo de victoria válidos."""
+        result = TournamentRunner.play_game(self.bots, 3, 0, 2000)
+        self.assertEqual(result["game"], 3)
+        self.assertEqual(result["white"], 1)
+        self.assertIn(result["winner"], (0, 1))
+        self.assertIn(result["win_type"], (1, 2, 3))
+        self.assertGreater(result["plies"], 0)
+
+    def test_max_plies(self):
+        """Verifica que las partidas que alcanzan el máximo de jugadas quedan sin terminar."""
+        result = TournamentRunner.play_game(self.bots, 0, 0, 5)
+        self.assertEqual((result["winner"], result["win_type"], result["plies"]), (None, 0, 5))
+
+    def test_summarize(self):
+        """Verifica las tasas de victorias, gammons y backgammons y el largo promedio."""
+        results = [{"game": 0, "white": 0, "winner": 0, "win_type": 1, "plies": 40},
+                   {"game": 1, "white": 1, "winner": 0, "win_type": 3, "plies": 60},
+                   {"game": 2, "white": 0, "winner": 1, "win_type": 2, "plies": 50},
+                   {"game": 3, "white": 1, "winner": None, "win_type": 0, "plies": 50}]
+        summary = TournamentRunner.summarize(results, ("a", "b"))
+        self.assertEqual(summary["games"], 4)
+        self.assertEqual(summary["unfinished"], 1)
+        self.assertAlmostEqual(summary["average_plies"], 50.0)
+        self.assertEqual(summary["a"], {"wins": 2, "win_rate": 0.5, "gammon_rate": 0.25, "backgammon_rate": 0.25})
+        self.assertEqual(summary["b"], {"wins": 1, "win_rate": 0.25, "gammon_rate": 0.25, "backgammon_rate": 0.0})
+
+    def test_run_streams_results_and_is_reproducible(self):
+        """Verifica que se escribe una línea por partida y que el resultado no depende de los procesos."""
+        with tempfile.TemporaryDirectory() as directory:
+            single_path = os.path.join(directory, "single.jsonl")
+            pool_path = os.path.join(directory, "pool.jsonl")
+            single_process = TournamentRunner(self.bots, ("a", "b"), num_workers=1,
+                                              games_per_task=3).run(8, single_path, seed=5)
+            process_pool = TournamentRunner(self.bots, ("a", "b"), num_workers=2,
+                                            games_per_task=3).run(8, pool_path, seed=5)
+            with open(single_path, encoding="utf-8") as single_file, open(pool_path, encoding="utf-8") as pool_file:
+                single_results = sorted((json.loads(line) for line in single_file), key=lambda result: result["game"])
+                pool_results = sorted((json.loads(line) for line in pool_file), key=lambda result: result["game"])
+        self.assertEqual([result["game"] for result in single_results], list(range(8)))
+        self.assertEqual(single_results, pool_results)
+        for key in ("games", "average_plies", "a", "b"):
+            self.assertEqual(single_process[key], process_pool[key])
+        self.assertEqual(single_process["a"]["wins"] + single_process["b"]["wins"], 8)
+        self.assertGreater(single_process["games_per_second"], 0)
+
+    def test_results_written_as_games_finish(self):
+        """Verifica que el resultado de cada partida se escribe en cuanto termina, sin esperar a la tarea."""
+
+        class FailingRunner(TournamentRunner):
+            @staticmethod
+            def play_game(bots, game_num, seed, max_plies):
+                if game_num == 2:
+                    raise RuntimeError("partida interrumpida")
+                return TournamentRunner.play_game(bots, game_num, seed, max_plies)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.jsonl")
+            with self.assertRaises(RuntimeError):
+                FailingRunner(self.bots, ("a", "b"), num_workers=1, games_per_task=5).run(5, path)
+            with open(path, encoding="utf-8") as results_file:
+                self.assertEqual([json.loads(line)["game"] for line in results_file], [0, 1])
+        with self.assertRaises(ValueError):
+            TournamentRunner(self.bots, ("a", "b"), games_per_task=0)
+
+    def test_invalid_bots(self):
+        """Verifica que se requieren dos bots con nombres distintos."""
+        with self.assertRaises(ValueError):
+            TournamentRunner(self.bots[:1])
+        with self.assertRaises(ValueError):
+            TournamentRunner(self.bots, ("a", "a"))
+
+    def test_replay_game_from_seed(self):
+        """Verifica que una partida del torneo se puede volver a jugar a partir de su semilla."""
+        result = TournamentRunner.play_game(self.bots, 4, 9, 2000)
+        game = BackgammonGame(seed=result["seed"])
+        game.start_dice_roll()
+        plies = 0
+        while True:
+            game.play_bot_turn(self.bots[0])
+            plies += 1
+            if game.board.is_match_won()[0]:
+                break
+            game.change_turn()
+        self.assertEqual(plies, result["plies"])
+        self.assertEqual(game.board.get_win_type(game.player_playing.uses_white_checkers), result["win_type"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import pickle
+import threading
+import unittest
+
+from core.Board import Board
+from core.TranspositionTable import TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Conjunto de pruebas para la clase TranspositionTable."""
+
+    def setUp(self):
+        """Prepara una tabla de transposición pequeña para cada prueba."""
+        self.table = TranspositionTable(max_entries=2)
+
+    def test_init_invalid_max_entries(self):
+        """Verifica que no se puede crear una tabla sin entradas."""
+        with self.assertRaises(ValueError):
+            TranspositionTable(max_entries=0)
+
+    def test_get_counts_hits_and_misses(self):
+        """Verifica que get() cuenta los aciertos y los fallos."""
+        self.assertIsNone(self.table.get("a"))
+        self.table.store("a", (1,))
+        self.assertEqual(self.table.get("a"), (1,))
+        self.assertEqual(self.table.hits, 1)
+        self.assertEqual(self.table.misses, 1)
+
+    def test_store_evicts_least_recently_used(self):
+        """Verifica que store() desaloja la entrada usada hace más tiempo."""
+        self.table.store("a", (1,))
+        self.table.store("b", (2,))
+        # "a" pasa a ser la entrada usada más recientemente
+        self.table.get("a")
+        self.table.store("c", (3,))
+        self.assertEqual(len(self.table), 2)
+        self.assertIsNone(self.table.get("b"))
+        self.assertEqual(self.table.get("a"), (1,))
+        self.assertEqual(self.table.get("c"), (3,))
+
+    def test_clear_resets_entries_and_counters(self):
+        """Verifica que clear() vacía la tabla y reinicia los contadores."""
+        self.table.store("a", (1,))
+        self.table.get("a")
+        self.table.clear()
+        self.assertEqual(len(self.table), 0)
+        self.assertEqual(self.table.hits, 0)
+        self.assertEqual(self.table.misses, 0)
+
+    def test_make_key_ignores_dice_order_and_zeros(self):
+        """Verifica que make_key() genera la misma clave sin importar el orden de los dados."""
+        self.assertEqual(TranspositionTable.make_key(7, True, (5, 3)),
+                         TranspositionTable.make_key(7, True, (3, 0, 5)))
+        self.assertNotEqual(TranspositionTable.make_key(7, True, (5, 3)),
+                            TranspositionTable.make_key(7, False, (5, 3)))
+
+    def test_board_legal_plays_use_table(self):
+        """Verifica que generate_legal_plays() reutiliza los resultados de la tabla del tablero."""
+        table = TranspositionTable()
+        board = Board(legal_plays_table=table)
+        first_plays = board.generate_legal_plays(True, (4, 2))
+        second_plays = board.copy().generate_legal_plays(True, (2, 4))
+        self.assertIs(first_plays, second_plays)
+        self.assertEqual(table.hits, 1)
+        self.assertEqual(table.misses, 1)
+        self.assertIs(Board().__legal_plays_table__, Board.LEGAL_PLAYS_TABLE)
+
+    def test_concurrent_access(self):
+        """Verifica que varios hilos pueden buscar y guardar en la misma tabla a la vez."""
+        table = TranspositionTable(max_entries=50)
+        errors = []
+
+        def worker(thread_num: int):
+            try:
+                for num in range(5000):
+                    key = (thread_num * 7 + num) % 80
+                    if table.get(key) is None:
+                        table.store(key, num)
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(thread_num,)) for thread_num in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(table.hits + table.misses, 4 * 5000)
+        self.assertLessEqual(len(table), 50)
+
+    def test_pickle(self):
+        """Verifica que la tabla se puede serializar y sigue funcionando."""
+        self.table.store("a", 1)
+        table = pickle.loads(pickle.dumps(self.table))
+        self.assertEqual(table.get("a"), 1)
+        table.store("b", 2)
+        self.assertEqual(len(table), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()